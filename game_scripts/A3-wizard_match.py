@@ -25,17 +25,27 @@ sys.path.append(str(Path(__file__).parent.parent / "utils"))
 from model_api import ModelAPI
 from logging_config import setup_logging
 from scoreboard import update_scoreboard_6p
+from match_api import fixture_result, kill_reason, match_timeout, report_kill
+from fixture_journal import journal_match
+from cpu_pinning import cpu_placement
+from match_shards import run_game_script_sharded
 
 logger = setup_logging(__name__)
 
 load_dotenv()
 
+
+def games_per_match(num_of_games: int) -> int:
+    """Games per match for a NUM_OF_GAMES_IN_A_MATCH value."""
+    return num_of_games
+
+
 # Configuration
 NUM_PLAYERS = 6
 NUM_ROUNDS = 10
 
 try:
-    NUM_GAMES_PER_MATCH = int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100"))
+    NUM_GAMES_PER_MATCH = games_per_match(int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100")))
 except (ValueError, TypeError):
     NUM_GAMES_PER_MATCH = 100
 
@@ -467,10 +477,19 @@ def main():
         for i in range(1, NUM_PLAYERS + 1)
     }
 
-    for i in range(NUM_GAMES):
+    if MERGED_STATS is not None:
+        match_stats = MERGED_STATS
+
+    for i in range(FIRST_GAME - 1, FIRST_GAME - 1 + NUM_GAMES):
+        if MATCH_SEED is not None:
+            random.seed(MATCH_SEED + i)
         play_game(i + 1, match_stats)
         sys.stdout.flush()
 
+    if SHARD_STATS_ONLY:
+        print(f"SHARD_STATS:{match_stats!r}")
+        return
+
     # Aggregate crash stats
     for key in match_stats:
         match_stats[key]["crash"] = match_stats[key]["make_move_crash"] + match_stats[key]["other_crash"]
@@ -807,6 +826,10 @@ def build_game_code(
         "\n"
         f"MOVE_TIMEOUT = {move_timeout}\n"
         f"NUM_GAMES = {num_games}\n"
+        "FIRST_GAME = 1\n"
+        "MATCH_SEED = None\n"
+        "SHARD_STATS_ONLY = False\n"
+        "MERGED_STATS = None\n"
         f"NUM_PLAYERS = {NUM_PLAYERS}\n"
         f"NUM_ROUNDS = {NUM_ROUNDS}\n"
     )
@@ -841,7 +864,12 @@ def build_human_game_code(
 
 
 def run_match(
-    game_code: str, match_id: int, run_ids: list[int], timeout: int = MATCH_TIME_LIMIT
+    game_code: str,
+    match_id: int,
+    run_ids: list[int],
+    timeout: int = MATCH_TIME_LIMIT,
+    shards: int = 1,
+    seed: int | None = None,
 ) -> dict:
     """Write temp file, execute subprocess, parse structured output."""
     temp_id = uuid.uuid4().hex[:8]
@@ -853,9 +881,7 @@ def run_match(
         with open(temp_file, "w") as f:
             f.write(game_code)
 
-        result = subprocess.run(
-            ["python", temp_file], capture_output=True, text=True, timeout=timeout
-        )
+        result = run_game_script_sharded(temp_file, shards, timeout, seed)
 
         if result.returncode != 0:
             return {
@@ -929,6 +955,7 @@ def run_match(
             "match_id": match_id,
             "success": False,
             "error": str(e),
+            "killed": kill_reason(e),
             "log": "",
         }
     finally:
@@ -937,11 +964,172 @@ def run_match(
 
 
 async def run_match_async(
-    game_code: str, match_id: int, run_ids: list[int]
+    game_code: str,
+    match_id: int,
+    run_ids: list[int],
+    shards: int = 1,
+    seed: int | None = None,
 ) -> dict:
     """Run match in executor for async compatibility."""
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, run_match, game_code, match_id, run_ids)
+    return await loop.run_in_executor(
+        None, run_match, game_code, match_id, run_ids, MATCH_TIME_LIMIT, shards, seed
+    )
+
+
+def prepare_match_code(
+    agent_specs: list[tuple[str, int]],
+    num_games: int = NUM_GAMES_PER_MATCH,
+    move_timeout: float = MOVE_TIME_LIMIT,
+) -> str:
+    """Load all six stored agents and assemble the match script ("" on load failure)."""
+    agent_codes = []
+    all_imports = set()
+
+    for i, (folder, run) in enumerate(agent_specs, 1):
+        code, imports = load_stored_agent(folder, GAME_NAME, run, i)
+        if not code:
+            print(f"ERROR: Failed to load Agent-{i} from {folder}:{run}")
+            return ""
+        agent_codes.append(code)
+        if imports:
+            for imp in imports.split("\n"):
+                if imp.strip():
+                    all_imports.add(imp.strip())
+
+    extra_imports = "\n".join(sorted(all_imports))
+    agent_infos = [f"{folder}:{run}" for folder, run in agent_specs]
+
+    return build_game_code(
+        agent_codes, extra_imports, num_games,
+        move_timeout, agent_infos,
+    )
+
+
+def match_log_path(agent_specs: list[tuple[str, int]], ts: str, match_id: int) -> Path:
+    """Per-match log file path, trimming agent names to fit the filesystem limit."""
+    agent_suffix = "_vs_".join(f"{f}:{r}" for f, r in agent_specs)
+    # Trim agent names if the filename would exceed filesystem limit (255 bytes)
+    max_filename = 255 - len(f"{ts}__match_00.txt")
+    if len(agent_suffix) > max_filename:
+        trim_to = (max_filename - 4 * (len(agent_specs) - 1)) // len(agent_specs) - 2
+        agent_suffix = "_vs_".join(f"{f[:trim_to]}:{r}" for f, r in agent_specs)
+    return RESULTS_DIR / f"{ts}_{agent_suffix}_match_{match_id}.txt"
+
+
+def record_match(
+    result: dict,
+    agent_specs: list[tuple[str, int]],
+    log_f: Path,
+    num_games: int = NUM_GAMES_PER_MATCH,
+    write_scoreboard: bool = False,
+) -> None:
+    """Write the per-match log file and, if requested, all six scoreboard rows."""
+    if result["success"]:
+        agent_points = result["agent_points"]
+        agent_scores = result["agent_scores"]
+
+        results_list = []
+        for i, (folder, run) in enumerate(agent_specs, 1):
+            key = f"Agent-{i}"
+            pts = agent_points.get(key, 0)
+            sc = agent_scores.get(key, 0)
+            results_list.append({"key": key, "folder": folder, "run": run, "pts": pts, "sc": sc})
+
+        results_list.sort(key=lambda x: (x["pts"], x["sc"]), reverse=True)
+
+        status = "Result:\n"
+        for res in results_list:
+            status += f"  {res['key']} ({res['folder']}:{res['run']}): Pts={res['pts']:.1f} Score={res['sc']:.1f}\n"
+
+        game_log = result.get("log", "")
+        if game_log:
+            status += f"\n{game_log}\n"
+    else:
+        status = f"FAILED: {result.get('error', 'Unknown')}\n"
+        if result.get("log"):
+            status += f"\nLog:\n{result['log']}\n"
+
+    with open(log_f, "w") as f:
+        f.write("Match Contenders:\n")
+        for i, (folder, run) in enumerate(agent_specs, 1):
+            f.write(f"Agent-{i}: {folder}:{run}\n")
+        placement = cpu_placement()
+        if placement:
+            f.write(f"{placement}\n")
+        f.write(f"\n{status}\n")
+        f.write("-" * 60 + "\n")
+
+    # Scoreboard update
+    if result["success"] and write_scoreboard:
+        update_match_scoreboard(result, agent_specs, num_games)
+
+
+def update_match_scoreboard(
+    result: dict,
+    agent_specs: list[tuple[str, int]],
+    num_games: int = NUM_GAMES_PER_MATCH,
+) -> None:
+    """Add a successful match to all six agents' scoreboard rows."""
+    agent_points = result["agent_points"]
+    agent_scores = result["agent_scores"]
+    agent_placements = result["agent_placements"]
+    for i, (folder, run) in enumerate(agent_specs, 1):
+        key = f"Agent-{i}"
+        agent_key = f"{folder}:{run}"
+
+        placements = {}
+        raw_placements = agent_placements.get(key, {})
+        for p in ["1st", "2nd", "3rd", "4th", "5th", "6th"]:
+            placements[p] = int(round(raw_placements.get(p, 0)))
+
+        update_scoreboard_6p(
+            SCOREBOARD_PATH,
+            agent_key,
+            games_played=num_games,
+            placements=placements,
+            points=int(round(agent_points.get(key, 0))),
+            score=agent_scores.get(key, 0.0),
+        )
+
+
+def run_fixture(
+    agent_specs: list[tuple[str, int]],
+    num_games: int | None = None,
+    move_timeout: float | None = None,
+    write_scoreboard: bool = False,
+    shards: int = 1,
+    seed: int | None = None,
+) -> dict:
+    """Play one 6-player match between stored agents and record it.
+
+    Library counterpart of ``--agent`` with six ``folder:run`` specs (exact
+    folder names, seat order preserved). Writes the same log file and
+    scoreboard rows as the CLI and returns the ``run_match`` dict extended
+    with the common keys documented in ``match_api``.
+    ``shards`` > 1 plays the games in that many parallel processes (see
+    ``match_shards``); ``seed`` makes the games' randomness reproducible.
+    """
+    num_games = NUM_GAMES_PER_MATCH if num_games is None else num_games
+    move_timeout = MOVE_TIME_LIMIT if move_timeout is None else move_timeout
+    agent_specs = list(agent_specs)
+    agent_keys = [f"{folder}:{run}" for folder, run in agent_specs]
+
+    game_code = prepare_match_code(agent_specs, num_games, move_timeout)
+    if not game_code:
+        res = {"match_id": 1, "success": False, "error": "Could not load agent code."}
+        return fixture_result(res, agent_keys, num_games, None)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    log_f = match_log_path(agent_specs, ts, 1)
+
+    timeout = match_timeout(MATCH_TIME_LIMIT, NUM_GAMES_PER_MATCH, num_games)
+    res = run_match(
+        game_code, 1, [run for _, run in agent_specs], timeout, shards=shards, seed=seed
+    )
+    record_match(res, agent_specs, log_f, num_games, write_scoreboard)
+    return fixture_result(res, agent_keys, num_games, log_f)
 
 
 async def main_async():
@@ -971,6 +1159,14 @@ async def main_async():
         "--parallel", type=int, default=4,
         help="Number of matches to run in parallel",
     )
+    parser.add_argument(
+        "--shards", type=int, default=1,
+        help="Split each match's games across this many processes",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed game i of each match with SEED + i (reproducible, shard-independent)",
+    )
     args = parser.parse_args()
 
     # --- Human modes ---
@@ -1055,27 +1251,9 @@ async def main_async():
     print("=" * 60)
 
     # Load all 6 agents
-    agent_codes = []
-    all_imports = set()
-
-    for i, (folder, run) in enumerate(agent_specs, 1):
-        code, imports = load_stored_agent(folder, GAME_NAME, run, i)
-        if not code:
-            print(f"ERROR: Failed to load Agent-{i} from {folder}:{run}")
-            sys.exit(1)
-        agent_codes.append(code)
-        if imports:
-            for imp in imports.split("\n"):
-                if imp.strip():
-                    all_imports.add(imp.strip())
-
-    extra_imports = "\n".join(sorted(all_imports))
-    agent_infos = [f"{folder}:{run}" for folder, run in agent_specs]
-
-    game_code = build_game_code(
-        agent_codes, extra_imports, NUM_GAMES_PER_MATCH,
-        MOVE_TIME_LIMIT, agent_infos,
-    )
+    game_code = prepare_match_code(agent_specs)
+    if not game_code:
+        sys.exit(1)
 
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1087,7 +1265,7 @@ async def main_async():
 
     async def sem_task(gc, mid, rids):
         async with semaphore:
-            return await run_match_async(gc, mid, rids)
+            return await run_match_async(gc, mid, rids, args.shards, args.seed)
 
     num_matches = 1
     for i in range(num_matches):
@@ -1102,76 +1280,24 @@ async def main_async():
     overall_agent_points = {f"Agent-{i}": 0.0 for i in range(1, NUM_PLAYERS+1)}
     overall_agent_scores = {f"Agent-{i}": 0.0 for i in range(1, NUM_PLAYERS+1)}
     
-    agent_suffix = "_vs_".join(f"{f}:{r}" for f, r in agent_specs)
-    # Trim agent names if the filename would exceed filesystem limit (255 bytes)
-    max_filename = 255 - len(f"{ts}__match_00.txt")
-    if len(agent_suffix) > max_filename:
-        trim_to = (max_filename - 4 * (len(agent_specs) - 1)) // len(agent_specs) - 2
-        agent_suffix = "_vs_".join(f"{f[:trim_to]}:{r}" for f, r in agent_specs)
-    
     for result in sorted(results, key=lambda x: x["match_id"]):
         match_id = result["match_id"]
-        log_f = RESULTS_DIR / f"{ts}_{agent_suffix}_match_{match_id}.txt"
+        log_f = match_log_path(agent_specs, ts, match_id)
 
         if result["success"]:
-            agent_points = result["agent_points"]
-            agent_scores = result["agent_scores"]
-            agent_placements = result["agent_placements"]
-
             # Merge points
             for k in overall_agent_points:
-                overall_agent_points[k] += agent_points.get(k, 0)
-                overall_agent_scores[k] += agent_scores.get(k, 0)
-                
-            results_list = []
-            for i, (folder, run) in enumerate(agent_specs, 1):
-                key = f"Agent-{i}"
-                pts = agent_points.get(key, 0)
-                sc = agent_scores.get(key, 0)
-                results_list.append({"key": key, "folder": folder, "run": run, "pts": pts, "sc": sc})
-            
-            results_list.sort(key=lambda x: (x["pts"], x["sc"]), reverse=True)
-
-            status = "Result:\n"
-            for res in results_list:
-                status += f"  {res['key']} ({res['folder']}:{res['run']}): Pts={res['pts']:.1f} Score={res['sc']:.1f}\n"
-            
-            game_log = result.get("log", "")
-            if game_log:
-                status += f"\n{game_log}\n"
-        else:
-            status = f"FAILED: {result.get('error', 'Unknown')}\n"
-            if result.get("log"):
-                status += f"\nLog:\n{result['log']}\n"
-
-        with open(log_f, "w") as f:
-            f.write("Match Contenders:\n")
-            for i, (folder, run) in enumerate(agent_specs, 1):
-                f.write(f"Agent-{i}: {folder}:{run}\n")
-            f.write(f"\n{status}\n")
-            f.write("-" * 60 + "\n")
-            
-        print(f"Match {match_id} completed. Log saved to {log_f}")
+                overall_agent_points[k] += result["agent_points"].get(k, 0)
+                overall_agent_scores[k] += result["agent_scores"].get(k, 0)
 
-        # Scoreboard update
-        if result["success"] and args.update_scoreboard:
-            for i, (folder, run) in enumerate(agent_specs, 1):
-                key = f"Agent-{i}"
-                agent_key = f"{folder}:{run}"
+        record_match(
+            result, agent_specs, log_f,
+            write_scoreboard=args.update_scoreboard,
+        )
+        journal_match(result, [f"{f}:{r}" for f, r in agent_specs])
+        report_kill(result)
 
-                placements = {}
-                raw_placements = agent_placements.get(key, {})
-                for p in ["1st", "2nd", "3rd", "4th", "5th", "6th"]:
-                    placements[p] = int(round(raw_placements.get(p, 0)))
-
-                update_scoreboard_6p(
-                    SCOREBOARD_PATH,
-                    agent_key,
-                    games_played=NUM_GAMES_PER_MATCH,
-                    placements=placements,
-                    points=int(round(agent_points.get(key, 0))),
-                    score=agent_scores.get(key, 0.0),
-                )
+        print(f"Match {match_id} completed. Log saved to {log_f}")
 
     # Print structured output for matchmaker parsing
     result_parts = [f"Agent-{i}={overall_agent_points[f'Agent-{i}']:.1f}" for i in range(1, NUM_PLAYERS + 1)]
@@ -26,6 +26,10 @@ from model_api import ModelAPI
 from logging_config import setup_logging
 from scoreboard import update_scoreboard
 from agent_loader import load_stored_agent, consolidate_imports, COMMON_HEADER_IMPORTS
+from match_api import fixture_result, kill_reason, report_kill
+from fixture_journal import journal_match
+from cpu_pinning import cpu_placement
+from zygote import run_game_script
 
 logger = setup_logging(__name__)
 
@@ -1017,9 +1021,7 @@ def run_match(
         with open(temp_file, "w") as f:
             f.write(game_code)
 
-        result = subprocess.run(
-            ["python", temp_file], capture_output=True, text=True, timeout=timeout
-        )
+        result = run_game_script(temp_file, timeout)
 
         if result.returncode != 0:
             return {
@@ -1094,6 +1096,7 @@ def run_match(
             "agent1_score": 0,
             "agent2_score": 0,
             "error": str(e),
+            "killed": kill_reason(e),
         }
     finally:
         if os.path.exists(temp_file):
@@ -1107,6 +1110,146 @@ async def run_match_async(
     return await loop.run_in_executor(None, run_match, game_code, match_id, run_ids)
 
 
+def prepare_match_code(
+    folder1: str,
+    run1: int,
+    folder2: str,
+    run2: int,
+    move_timeout: float = MOVE_TIME_LIMIT,
+) -> str:
+    """Load both stored agents and assemble the match script ("" on load failure)."""
+    code1, imp1 = load_stored_agent(folder1, GAME_NAME, run1, 1, "BackgammonAgent")
+    code2, imp2 = load_stored_agent(folder2, GAME_NAME, run2, 2, "BackgammonAgent")
+
+    if not code1 or not code2:
+        return ""
+
+    extra_imports = consolidate_imports(imp1, imp2, COMMON_HEADER_IMPORTS)
+
+    agent1_info = f"{folder1}:{run1}"
+    agent2_info = f"{folder2}:{run2}"
+
+    return build_game_code(
+        code1, code2, extra_imports,
+        move_timeout, MAX_TURNS_PER_GAME,
+        POINTS_TO_WIN_MATCH, MAX_GAMES_PER_MATCH,
+        agent1_info, agent2_info,
+    )
+
+
+def record_match(
+    res: dict,
+    folder1: str,
+    r1: int,
+    folder2: str,
+    r2: int,
+    log_f: Path,
+    write_scoreboard: bool = False,
+) -> None:
+    """Write the per-match log file and, if requested, both scoreboard rows."""
+    if res["success"]:
+        s1, s2 = res["agent1_score"], res["agent2_score"]
+        p1 = res.get("agent1_points", 0)
+        p2 = res.get("agent2_points", 0)
+
+        status = "Result:\n"
+        status += f"{folder1}:{r1} : Pts: {p1} - Score: {s1:.1f}\n"
+        status += f"{folder2}:{r2} : Pts: {p2} - Score: {s2:.1f}\n"
+
+        game_log = res.get("log", "")
+        if game_log:
+            status += f"\n{game_log}\n"
+    else:
+        status = f"FAILED: {res.get('error', 'Unknown')}"
+
+    with open(log_f, "w") as f:
+        f.write("Match Contenders:\n")
+        f.write(f"{folder1}:{r1}\n")
+        f.write(f"{folder2}:{r2}\n")
+        placement = cpu_placement()
+        if placement:
+            f.write(f"{placement}\n")
+        f.write("\n")
+        f.write(f"{status}\n")
+        f.write("-" * 60 + "\n")
+
+    if res["success"] and write_scoreboard:
+        update_match_scoreboard(res, [(folder1, r1), (folder2, r2)])
+
+
+def update_match_scoreboard(
+    res: dict,
+    agent_specs: list[tuple[str, int]],
+    num_games: int = 0,
+) -> None:
+    """Add a successful match to both agents' scoreboard rows.
+
+    ``num_games`` is unused: a backgammon match reports its own
+    ``games_played``.
+    """
+    (folder1, r1), (folder2, r2) = agent_specs
+    games_played = res.get("games_played", 0)
+    agent1_key = f"{folder1}:{r1}"
+    update_scoreboard(
+        SCOREBOARD_PATH, agent1_key,
+        games_played=games_played,
+        wins=res.get("agent1_wins", 0),
+        losses=res.get("agent2_wins", 0),
+        draws=res.get("draws", 0),
+        score=res["agent1_score"],
+        points=res.get("agent1_points", 0),
+    )
+    agent2_key = f"{folder2}:{r2}"
+    update_scoreboard(
+        SCOREBOARD_PATH, agent2_key,
+        games_played=games_played,
+        wins=res.get("agent2_wins", 0),
+        losses=res.get("agent1_wins", 0),
+        draws=res.get("draws", 0),
+        score=res["agent2_score"],
+        points=res.get("agent2_points", 0),
+    )
+
+
+def run_fixture(
+    agent_a: tuple[str, int],
+    agent_b: tuple[str, int],
+    num_games: int | None = None,
+    move_timeout: float | None = None,
+    write_scoreboard: bool = False,
+) -> dict:
+    """Play one match between two stored agents and record it.
+
+    Library counterpart of ``--agent folder:run folder:run``. Backgammon
+    matches are first to POINTS_TO_WIN_MATCH, so ``num_games`` is accepted
+    for interface parity but ignored; the played count comes from the match
+    output. Returns the ``run_match`` dict extended with the common keys
+    documented in ``match_api``.
+    """
+    move_timeout = MOVE_TIME_LIMIT if move_timeout is None else move_timeout
+    (folder1, run1), (folder2, run2) = agent_a, agent_b
+    agent_keys = [f"{folder1}:{run1}", f"{folder2}:{run2}"]
+
+    game_code = prepare_match_code(folder1, run1, folder2, run2, move_timeout)
+    if not game_code:
+        res = {
+            "match_id": 1,
+            "agent1_run_id": run1,
+            "agent2_run_id": run2,
+            "success": False,
+            "error": "Could not load agent code.",
+        }
+        return fixture_result(res, agent_keys, 0, None)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    log_f = RESULTS_DIR / f"{ts}_{folder1}:{run1}_vs_{folder2}:{run2}_match.txt"
+
+    res = run_match(game_code, 1, (run1, run2))
+    record_match(res, folder1, run1, folder2, run2, log_f, write_scoreboard)
+    return fixture_result(res, agent_keys, 0, log_f)
+
+
 async def main_async():
     parser = argparse.ArgumentParser(description="Run Backgammon matches")
     parser.add_argument(
@@ -1237,25 +1380,11 @@ async def main_async():
         run1 = runs1[i]
         run2 = runs2[i]
 
-        code1, imp1 = load_stored_agent(folder1, GAME_NAME, run1, 1, "BackgammonAgent")
-        code2, imp2 = load_stored_agent(folder2, GAME_NAME, run2, 2, "BackgammonAgent")
-
-        if not code1 or not code2:
+        game_code = prepare_match_code(folder1, run1, folder2, run2)
+        if not game_code:
             print(f"  FAILED to load match {i + 1}")
             continue
 
-        extra_imports = consolidate_imports(imp1, imp2, COMMON_HEADER_IMPORTS)
-
-        agent1_info = f"{folder1}:{run1}"
-        agent2_info = f"{folder2}:{run2}"
-
-        game_code = build_game_code(
-            code1, code2, extra_imports,
-            MOVE_TIME_LIMIT, MAX_TURNS_PER_GAME,
-            POINTS_TO_WIN_MATCH, MAX_GAMES_PER_MATCH,
-            agent1_info, agent2_info,
-        )
-
         async def sem_task(gc, mid, rids):
             async with semaphore:
                 return await run_match_async(gc, mid, rids)
@@ -1290,49 +1419,16 @@ async def main_async():
             total_pts1 += p1
             total_pts2 += p2
 
-            status = "Result:\n"
-            status += f"{folder1}:{run1} : Pts: {p1} - Score: {s1:.1f}\n"
-            status += f"{folder2}:{run2} : Pts: {p2} - Score: {s2:.1f}\n"
-
-            game_log = result.get("log", "")
-            if game_log:
-                status += f"\n{game_log}\n"
-        else:
-            status = f"FAILED: {result.get('error', 'Unknown')}"
-
         print(f"Match {match_id} Completed. Pts {p1}-{p2}")
         if result["success"]:
             print(f"MINI:{folder1}:{run1}={p1},{s1}|{folder2}:{run2}={p2},{s2}")
 
-        with open(log_f, "w") as f:
-            f.write("Match Contenders:\n")
-            f.write(f"{folder1}:{run1}\n")
-            f.write(f"{folder2}:{run2}\n\n")
-            f.write(f"{status}\n")
-            f.write("-" * 60 + "\n")
-
-        if result["success"] and args.update_scoreboard:
-            games_played = result.get("games_played", 0)
-            agent1_key = f"{folder1}:{run1}"
-            update_scoreboard(
-                SCOREBOARD_PATH, agent1_key,
-                games_played=games_played,
-                wins=result.get("agent1_wins", 0),
-                losses=result.get("agent2_wins", 0),
-                draws=result.get("draws", 0),
-                score=result["agent1_score"],
-                points=result.get("agent1_points", 0),
-            )
-            agent2_key = f"{folder2}:{run2}"
-            update_scoreboard(
-                SCOREBOARD_PATH, agent2_key,
-                games_played=games_played,
-                wins=result.get("agent2_wins", 0),
-                losses=result.get("agent1_wins", 0),
-                draws=result.get("draws", 0),
-                score=result["agent2_score"],
-                points=result.get("agent2_points", 0),
-            )
+        record_match(
+            result, folder1, run1, folder2, run2, log_f,
+            write_scoreboard=args.update_scoreboard,
+        )
+        journal_match(result, [f"{folder1}:{run1}", f"{folder2}:{run2}"])
+        report_kill(result)
 
     runs1_str = ",".join(str(r) for r in runs1)
     runs2_str = ",".join(str(r) for r in runs2)
@@ -26,15 +26,26 @@ from model_api import ModelAPI
 from logging_config import setup_logging
 from scoreboard import update_scoreboard
 from agent_loader import load_stored_agent, consolidate_imports
+from match_api import fixture_result, kill_reason, match_timeout, report_kill, report_stop
+from fixture_journal import journal_match
+from cpu_pinning import cpu_placement
+from match_shards import run_game_script_sharded
+from match_sprt import SPRT_CODE, games_actual
 
 logger = setup_logging(__name__)
 
 # Load environment variables
 load_dotenv()
 
+
+def games_per_match(num_of_games: int) -> int:
+    """Games per match for a NUM_OF_GAMES_IN_A_MATCH value (A5 plays a tenth)."""
+    return int(num_of_games / 10)
+
+
 # Configuration
 try:
-    NUM_GAMES_PER_MATCH = int(int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100")) / 10)
+    NUM_GAMES_PER_MATCH = games_per_match(int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100")))
 except (ValueError, TypeError):
     NUM_GAMES_PER_MATCH = 10
 
@@ -325,9 +336,24 @@ def main():
             "timeout": 0, "invalid": 0,
         },
     }
-    for i in range(NUM_GAMES):
+    if MERGED_STATS is not None:
+        match_stats = MERGED_STATS
+
+    played = 0
+    for i in range(FIRST_GAME - 1, FIRST_GAME - 1 + NUM_GAMES):
+        if MATCH_SEED is not None:
+            random.seed(MATCH_SEED + i)
         play_game(i + 1, match_stats)
         sys.stdout.flush()
+        played += 1
+        if sprt_stop(match_stats, played):
+            break
+
+    if SHARD_STATS_ONLY:
+        print(f"SHARD_STATS:{match_stats!r}")
+        return
+
+    sprt_finish(match_stats, played)
 
     for agent in ["Agent-1", "Agent-2"]:
         match_stats[agent]["crash"] = (
@@ -383,6 +409,11 @@ def build_game_code(
         "\n"
         f"MOVE_TIMEOUT = {move_timeout}\n"
         f"NUM_GAMES = {num_games}\n"
+        "FIRST_GAME = 1\n"
+        "MATCH_SEED = None\n"
+        "SHARD_STATS_ONLY = False\n"
+        "MERGED_STATS = None\n"
+        "SPRT_ALPHA = None\n"
         f'AGENT1_NAME = "{agent1_name}"\n'
         f'AGENT2_NAME = "{agent2_name}"\n'
     )
@@ -393,6 +424,7 @@ def build_game_code(
         extra_imports,
         agent1_code,
         agent2_code,
+        SPRT_CODE,
         MATCH_RUNNER_CODE,
     ])
 
@@ -632,7 +664,12 @@ def parse_agent_spec(spec: str) -> tuple[str, list[int]]:
     return model_pattern, runs
 
 def run_match(
-    game_code: str, match_id: int, run_ids: tuple[int, int], timeout: int = MATCH_TIME_LIMIT
+    game_code: str,
+    match_id: int,
+    run_ids: tuple[int, int],
+    timeout: int = MATCH_TIME_LIMIT,
+    shards: int = 1,
+    seed: int | None = None,
 ) -> dict:
     """Execute a match subprocess, parse results, and return structured dict."""
     temp_id = uuid.uuid4().hex[:8]
@@ -644,9 +681,7 @@ def run_match(
         with open(temp_file, "w") as f:
             f.write(game_code)
 
-        result = subprocess.run(
-            ["python", temp_file], capture_output=True, text=True, timeout=timeout
-        )
+        result = run_game_script_sharded(temp_file, shards, timeout, seed)
 
         if result.returncode != 0:
             return {
@@ -720,6 +755,7 @@ def run_match(
             "agent1_score": 0,
             "agent2_score": 0,
             "error": str(e),
+            "killed": kill_reason(e),
         }
     finally:
         if os.path.exists(temp_file):
@@ -727,11 +763,162 @@ def run_match(
 
 
 async def run_match_async(
-    game_code: str, match_id: int, run_ids: tuple[int, int]
+    game_code: str,
+    match_id: int,
+    run_ids: tuple[int, int],
+    shards: int = 1,
+    seed: int | None = None,
 ) -> dict:
     """Run a match in a thread pool to avoid blocking the event loop."""
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, run_match, game_code, match_id, run_ids)
+    return await loop.run_in_executor(
+        None, run_match, game_code, match_id, run_ids, MATCH_TIME_LIMIT, shards, seed
+    )
+
+
+def prepare_match_code(
+    folder1: str,
+    run1: int,
+    folder2: str,
+    run2: int,
+    num_games: int = NUM_GAMES_PER_MATCH,
+    move_timeout: float = MOVE_TIME_LIMIT,
+) -> str:
+    """Load both stored agents and assemble the match script ("" on load failure)."""
+    code1, imp1 = load_stored_agent(folder1, GAME_NAME, run1, 1, "Connect4Agent")
+    code2, imp2 = load_stored_agent(folder2, GAME_NAME, run2, 2, "Connect4Agent")
+
+    if not code1 or not code2:
+        return ""
+
+    extra_imports = consolidate_imports(imp1, imp2)
+    return build_game_code(
+        agent1_code=code1,
+        agent2_code=code2,
+        extra_imports=extra_imports,
+        num_games=num_games,
+        move_timeout=move_timeout,
+        agent1_name=f"{folder1}:{run1}",
+        agent2_name=f"{folder2}:{run2}",
+    )
+
+
+def record_match(
+    res: dict,
+    folder1: str,
+    r1: int,
+    folder2: str,
+    r2: int,
+    log_f: Path,
+    num_games: int = NUM_GAMES_PER_MATCH,
+    write_scoreboard: bool = False,
+) -> None:
+    """Write the per-match log file and, if requested, both scoreboard rows."""
+    if res["success"]:
+        status = "Result:\n"
+        status += f"{folder1}:{res['agent1_run_id']} : Pts: {res['agent1_points']} - Score: {res['agent1_score']}\n"
+        status += f"{folder2}:{res['agent2_run_id']} : Pts: {res['agent2_points']} - Score: {res['agent2_score']}\n"
+
+        if res.get("log"):
+            status += f"\n{res['log'].strip()}\n"
+
+    else:
+        status = f"FAILED: {res.get('error', 'Unknown')}\n"
+        if res.get("log"):
+            status += f"\nLog:\n{res['log']}\n"
+
+    with open(log_f, "w") as f:
+        f.write("Match Contenders:\n")
+        f.write(f"{folder1}:{r1}\n")
+        f.write(f"{folder2}:{r2}\n")
+        placement = cpu_placement()
+        if placement:
+            f.write(f"{placement}\n")
+        f.write("\n")
+        f.write(f"{status}\n")
+        f.write("-" * 60 + "\n")
+
+    if res["success"] and write_scoreboard:
+        update_match_scoreboard(res, [(folder1, r1), (folder2, r2)], num_games)
+
+
+def update_match_scoreboard(
+    res: dict,
+    agent_specs: list[tuple[str, int]],
+    num_games: int = NUM_GAMES_PER_MATCH,
+) -> None:
+    """Add a successful match to both agents' scoreboard rows.
+
+    A match stopped early by SPRT counts the games it actually played.
+    """
+    games = games_actual(res, num_games)
+    (folder1, _), (folder2, _) = agent_specs
+    agent1_key = f"{folder1}:{res['agent1_run_id']}"
+    update_scoreboard(
+        SCOREBOARD_PATH, agent1_key,
+        games_played=games,
+        stopped=int(games < num_games),
+        wins=res["agent1_wins"],
+        losses=res["agent2_wins"],
+        draws=res["draws"],
+        score=res["agent1_score"],
+        points=res["agent1_points"],
+    )
+    agent2_key = f"{folder2}:{res['agent2_run_id']}"
+    update_scoreboard(
+        SCOREBOARD_PATH, agent2_key,
+        games_played=games,
+        stopped=int(games < num_games),
+        wins=res["agent2_wins"],
+        losses=res["agent1_wins"],
+        draws=res["draws"],
+        score=res["agent2_score"],
+        points=res["agent2_points"],
+    )
+
+
+def run_fixture(
+    agent_a: tuple[str, int],
+    agent_b: tuple[str, int],
+    num_games: int | None = None,
+    move_timeout: float | None = None,
+    write_scoreboard: bool = False,
+    shards: int = 1,
+    seed: int | None = None,
+) -> dict:
+    """Play one match between two stored agents and record it.
+
+    Library counterpart of ``--agent folder:run folder:run``: agents are
+    ``(model_folder, run)`` pairs with exact folder names. Writes the same
+    log file and scoreboard rows as the CLI and returns the ``run_match``
+    dict extended with the common keys documented in ``match_api``.
+    ``shards`` > 1 plays the games in that many parallel processes (see
+    ``match_shards``); ``seed`` makes the games' randomness reproducible.
+    """
+    num_games = NUM_GAMES_PER_MATCH if num_games is None else num_games
+    move_timeout = MOVE_TIME_LIMIT if move_timeout is None else move_timeout
+    (folder1, run1), (folder2, run2) = agent_a, agent_b
+    agent_keys = [f"{folder1}:{run1}", f"{folder2}:{run2}"]
+
+    game_code = prepare_match_code(folder1, run1, folder2, run2, num_games, move_timeout)
+    if not game_code:
+        res = {
+            "match_id": 1,
+            "agent1_run_id": run1,
+            "agent2_run_id": run2,
+            "success": False,
+            "error": "Could not load agent code.",
+        }
+        return fixture_result(res, agent_keys, num_games, None)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    log_f = RESULTS_DIR / f"{ts}_{folder1}:{run1}_vs_{folder2}:{run2}_match.txt"
+
+    timeout = match_timeout(MATCH_TIME_LIMIT, NUM_GAMES_PER_MATCH, num_games)
+    res = run_match(game_code, 1, (run1, run2), timeout, shards=shards, seed=seed)
+    record_match(res, folder1, run1, folder2, run2, log_f, num_games, write_scoreboard)
+    return fixture_result(res, agent_keys, num_games, log_f)
 
 
 async def main_async():
@@ -746,6 +933,14 @@ async def main_async():
         "--parallel", type=int, default=4,
         help="Number of matches to run in parallel",
     )
+    parser.add_argument(
+        "--shards", type=int, default=1,
+        help="Split each match's games across this many processes",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed game i of each match with SEED + i (reproducible, shard-independent)",
+    )
     args = parser.parse_args()
 
     if args.human:
@@ -807,28 +1002,15 @@ async def main_async():
     for i in range(num_matches):
         run1 = runs1[i]
         run2 = runs2[i]
-        
-        code1, imp1 = load_stored_agent(folder1, GAME_NAME, run1, 1, "Connect4Agent")
-        code2, imp2 = load_stored_agent(folder2, GAME_NAME, run2, 2, "Connect4Agent")
 
-        if not code1 or not code2:
+        game_code = prepare_match_code(folder1, run1, folder2, run2)
+        if not game_code:
             print(f"  FAILED to prepare match {i+1}: Could not load agent code.")
             continue
-
-        extra_imports = consolidate_imports(imp1, imp2)
-        game_code = build_game_code(
-            agent1_code=code1,
-            agent2_code=code2,
-            extra_imports=extra_imports,
-            num_games=NUM_GAMES_PER_MATCH,
-            move_timeout=MOVE_TIME_LIMIT,
-            agent1_name=f"{folder1}:{run1}",
-            agent2_name=f"{folder2}:{run2}",
-        )
         
         async def sem_task(gc, mid, rids):
             async with semaphore:
-                return await run_match_async(gc, mid, rids)
+                return await run_match_async(gc, mid, rids, args.shards, args.seed)
         
         match_tasks.append(sem_task(game_code, i + 1, (run1, run2)))
 
@@ -861,48 +1043,16 @@ async def main_async():
             print(f"  Match {m_id} ({folder1}:{r1} vs {folder2}:{r2}): {p1} - {p2}")
             s1, s2 = res["agent1_score"], res["agent2_score"]
             print(f"MINI:{folder1}:{r1}={p1},{s1}|{folder2}:{r2}={p2},{s2}")
-
-            status = "Result:\n"
-            status += f"{folder1}:{res['agent1_run_id']} : Pts: {res['agent1_points']} - Score: {res['agent1_score']}\n"
-            status += f"{folder2}:{res['agent2_run_id']} : Pts: {res['agent2_points']} - Score: {res['agent2_score']}\n"
-
-            if res.get("log"):
-                status += f"\n{res['log'].strip()}\n"
-
+            report_stop(res, NUM_GAMES_PER_MATCH)
         else:
             print(f"  Match {m_id} ({folder1}:{r1} vs {folder2}:{r2}): FAILED - {res.get('error')}")
-            status = f"FAILED: {res.get('error', 'Unknown')}\n"
-            if res.get("log"):
-                status += f"\nLog:\n{res['log']}\n"
-
-        with open(log_f, "w") as f:
-            f.write("Match Contenders:\n")
-            f.write(f"{folder1}:{r1}\n")
-            f.write(f"{folder2}:{r2}\n\n")
-            f.write(f"{status}\n")
-            f.write("-" * 60 + "\n")
-
-        if res["success"] and args.update_scoreboard:
-            agent1_key = f"{folder1}:{res['agent1_run_id']}"
-            update_scoreboard(
-                SCOREBOARD_PATH, agent1_key,
-                games_played=NUM_GAMES_PER_MATCH,
-                wins=res["agent1_wins"],
-                losses=res["agent2_wins"],
-                draws=res["draws"],
-                score=res["agent1_score"],
-                points=res["agent1_points"],
-            )
-            agent2_key = f"{folder2}:{res['agent2_run_id']}"
-            update_scoreboard(
-                SCOREBOARD_PATH, agent2_key,
-                games_played=NUM_GAMES_PER_MATCH,
-                wins=res["agent2_wins"],
-                losses=res["agent1_wins"],
-                draws=res["draws"],
-                score=res["agent2_score"],
-                points=res["agent2_points"],
-            )
+
+        record_match(
+            res, folder1, r1, folder2, r2, log_f,
+            write_scoreboard=args.update_scoreboard,
+        )
+        journal_match(res, [f"{folder1}:{r1}", f"{folder2}:{r2}"])
+        report_kill(res)
 
     print("\nFINAL RESULTS:")
     print(f"  {folder1}: {total_pts1}")
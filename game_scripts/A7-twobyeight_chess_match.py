@@ -25,14 +25,25 @@ from model_api import ModelAPI
 from logging_config import setup_logging
 from scoreboard import update_scoreboard
 from agent_loader import load_stored_agent, consolidate_imports
+from match_api import fixture_result, kill_reason, match_timeout, report_kill, report_stop
+from fixture_journal import journal_match
+from cpu_pinning import cpu_placement
+from match_shards import run_game_script_sharded
+from match_sprt import SPRT_CODE, games_actual
 
 logger = setup_logging(__name__)
 
 load_dotenv()
 
+
+def games_per_match(num_of_games: int) -> int:
+    """Games per match for a NUM_OF_GAMES_IN_A_MATCH value."""
+    return int(num_of_games / 10)
+
+
 # Configuration
 try:
-    NUM_GAMES_PER_MATCH = int(int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100")) / 10)
+    NUM_GAMES_PER_MATCH = games_per_match(int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100")))
 except (ValueError, TypeError):
     NUM_GAMES_PER_MATCH = 10
 
@@ -635,9 +646,24 @@ def main():
         },
     }
 
-    for i in range(NUM_GAMES):
+    if MERGED_STATS is not None:
+        match_stats = MERGED_STATS
+
+    played = 0
+    for i in range(FIRST_GAME - 1, FIRST_GAME - 1 + NUM_GAMES):
+        if MATCH_SEED is not None:
+            random.seed(MATCH_SEED + i)
         play_game(i + 1, match_stats)
         sys.stdout.flush()
+        played += 1
+        if sprt_stop(match_stats, played):
+            break
+
+    if SHARD_STATS_ONLY:
+        print(f"SHARD_STATS:{match_stats!r}")
+        return
+
+    sprt_finish(match_stats, played)
 
     # Aggregate crash stat for backward compatibility
     for agent_key in ["Agent-1", "Agent-2"]:
@@ -1256,6 +1282,11 @@ def build_game_code(
         f"MOVE_TIMEOUT = {move_timeout}\n"
         f"MAX_MOVES = {max_moves}\n"
         f"NUM_GAMES = {num_games}\n"
+        "FIRST_GAME = 1\n"
+        "MATCH_SEED = None\n"
+        "SHARD_STATS_ONLY = False\n"
+        "MERGED_STATS = None\n"
+        "SPRT_ALPHA = None\n"
         f'AGENT1_INFO = "{agent1_info}"\n'
         f'AGENT2_INFO = "{agent2_info}"\n'
     )
@@ -1266,12 +1297,18 @@ def build_game_code(
         agent1_code,
         agent2_code,
         GAME_ENGINE_CODE,
+        SPRT_CODE,
         MATCH_RUNNER_CODE,
     ])
 
 
 def run_match(
-    game_code: str, match_id: int, run_ids: tuple[int, int], timeout: int = MATCH_TIME_LIMIT
+    game_code: str,
+    match_id: int,
+    run_ids: tuple[int, int],
+    timeout: int = MATCH_TIME_LIMIT,
+    shards: int = 1,
+    seed: int | None = None,
 ) -> dict:
     """Spawn subprocess, parse structured output, filter log lines."""
     temp_id = uuid.uuid4().hex[:8]
@@ -1283,9 +1320,7 @@ def run_match(
         with open(temp_file, "w") as f:
             f.write(game_code)
 
-        result = subprocess.run(
-            ["python", temp_file], capture_output=True, text=True, timeout=timeout
-        )
+        result = run_game_script_sharded(temp_file, shards, timeout, seed)
 
         if result.returncode != 0:
             return {
@@ -1359,6 +1394,7 @@ def run_match(
             "agent1_score": 0,
             "agent2_score": 0,
             "error": str(e),
+            "killed": kill_reason(e),
         }
     finally:
         if os.path.exists(temp_file):
@@ -1366,11 +1402,168 @@ def run_match(
 
 
 async def run_match_async(
-    game_code: str, match_id: int, run_ids: tuple[int, int]
+    game_code: str,
+    match_id: int,
+    run_ids: tuple[int, int],
+    shards: int = 1,
+    seed: int | None = None,
 ) -> dict:
     """Wrap run_match in executor for async scheduling."""
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, run_match, game_code, match_id, run_ids)
+    return await loop.run_in_executor(
+        None, run_match, game_code, match_id, run_ids, MATCH_TIME_LIMIT, shards, seed
+    )
+
+
+def prepare_match_code(
+    folder1: str,
+    run1: int,
+    folder2: str,
+    run2: int,
+    num_games: int = NUM_GAMES_PER_MATCH,
+    move_timeout: float = MOVE_TIME_LIMIT,
+) -> str:
+    """Load both stored agents and assemble the match script ("" on load failure)."""
+    code1, imp1 = load_stored_agent(folder1, GAME_NAME, run1, 1, "TwoByEightChessAgent")
+    code2, imp2 = load_stored_agent(folder2, GAME_NAME, run2, 2, "TwoByEightChessAgent")
+
+    if not code1 or not code2:
+        return ""
+
+    extra_imports = consolidate_imports(imp1, imp2)
+
+    agent1_info = f"{folder1}:{run1}"
+    agent2_info = f"{folder2}:{run2}"
+
+    return build_game_code(
+        code1, code2, extra_imports, num_games,
+        move_timeout, MAX_MOVES_PER_GAME, agent1_info, agent2_info,
+    )
+
+
+def record_match(
+    res: dict,
+    folder1: str,
+    r1: int,
+    folder2: str,
+    r2: int,
+    log_f: Path,
+    num_games: int = NUM_GAMES_PER_MATCH,
+    write_scoreboard: bool = False,
+) -> None:
+    """Write the per-match log file and, if requested, both scoreboard rows."""
+    if res["success"]:
+        s1 = res["agent1_score"]
+        s2 = res["agent2_score"]
+        p1 = res.get("agent1_points", 0)
+        p2 = res.get("agent2_points", 0)
+
+        with open(log_f, "w") as f:
+            f.write("Match Contenders:\n")
+            f.write(f"{folder1}:{r1}\n")
+            f.write(f"{folder2}:{r2}\n")
+            placement = cpu_placement()
+            if placement:
+                f.write(f"{placement}\n")
+            f.write("\n")
+
+            f.write("Result:\n")
+            f.write(f"{folder1}:{r1} : Pts: {p1} - Score: {s1:.1f}\n")
+            f.write(f"{folder2}:{r2} : Pts: {p2} - Score: {s2:.1f}\n")
+
+            game_log = res.get("log", "")
+            if game_log:
+                f.write(f"\n{game_log}\n")
+
+            f.write("-" * 60 + "\n")
+
+    if res["success"] and write_scoreboard:
+        update_match_scoreboard(res, [(folder1, r1), (folder2, r2)], num_games)
+
+
+def update_match_scoreboard(
+    res: dict,
+    agent_specs: list[tuple[str, int]],
+    num_games: int = NUM_GAMES_PER_MATCH,
+) -> None:
+    """Add a successful match to both agents' scoreboard rows.
+
+    A match stopped early by SPRT counts the games it actually played.
+    """
+    games = games_actual(res, num_games)
+    (folder1, r1), (folder2, r2) = agent_specs
+    s1, s2 = res["agent1_score"], res["agent2_score"]
+    p1, p2 = res.get("agent1_points", 0), res.get("agent2_points", 0)
+    agent1_key = f"{folder1}:{r1}"
+    agent2_key = f"{folder2}:{r2}"
+    a1_wins = res.get("agent1_wins", 0)
+    a2_wins = res.get("agent2_wins", 0)
+    match_draws = res.get("draws", 0)
+
+    update_scoreboard(
+        SCOREBOARD_PATH, agent1_key,
+        games_played=games,
+        stopped=int(games < num_games),
+        wins=a1_wins,
+        losses=a2_wins,
+        draws=match_draws,
+        score=s1,
+        points=p1,
+    )
+    update_scoreboard(
+        SCOREBOARD_PATH, agent2_key,
+        games_played=games,
+        stopped=int(games < num_games),
+        wins=a2_wins,
+        losses=a1_wins,
+        draws=match_draws,
+        score=s2,
+        points=p2,
+    )
+
+
+def run_fixture(
+    agent_a: tuple[str, int],
+    agent_b: tuple[str, int],
+    num_games: int | None = None,
+    move_timeout: float | None = None,
+    write_scoreboard: bool = False,
+    shards: int = 1,
+    seed: int | None = None,
+) -> dict:
+    """Play one match between two stored agents and record it.
+
+    Library counterpart of ``--agent folder:run folder:run``: agents are
+    ``(model_folder, run)`` pairs with exact folder names. Writes the same
+    log file and scoreboard rows as the CLI and returns the ``run_match``
+    dict extended with the common keys documented in ``match_api``.
+    ``shards`` > 1 plays the games in that many parallel processes (see
+    ``match_shards``); ``seed`` makes the games' randomness reproducible.
+    """
+    num_games = NUM_GAMES_PER_MATCH if num_games is None else num_games
+    move_timeout = MOVE_TIME_LIMIT if move_timeout is None else move_timeout
+    (folder1, run1), (folder2, run2) = agent_a, agent_b
+    agent_keys = [f"{folder1}:{run1}", f"{folder2}:{run2}"]
+
+    game_code = prepare_match_code(folder1, run1, folder2, run2, num_games, move_timeout)
+    if not game_code:
+        res = {
+            "match_id": 1,
+            "agent1_run_id": run1,
+            "agent2_run_id": run2,
+            "success": False,
+            "error": "Could not load agent code.",
+        }
+        return fixture_result(res, agent_keys, num_games, None)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    log_f = RESULTS_DIR / f"{ts}_{folder1}:{run1}_vs_{folder2}:{run2}_match.txt"
+
+    timeout = match_timeout(MATCH_TIME_LIMIT, NUM_GAMES_PER_MATCH, num_games)
+    res = run_match(game_code, 1, (run1, run2), timeout, shards=shards, seed=seed)
+    record_match(res, folder1, run1, folder2, run2, log_f, num_games, write_scoreboard)
+    return fixture_result(res, agent_keys, num_games, log_f)
 
 
 async def main_async():
@@ -1385,6 +1578,14 @@ async def main_async():
         "--parallel", type=int, default=4,
         help="Number of matches to run in parallel",
     )
+    parser.add_argument(
+        "--shards", type=int, default=1,
+        help="Split each match's games across this many processes",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed game i of each match with SEED + i (reproducible, shard-independent)",
+    )
     args = parser.parse_args()
 
     # Human play mode
@@ -1453,26 +1654,14 @@ async def main_async():
         run1 = runs1[i]
         run2 = runs2[i]
 
-        code1, imp1 = load_stored_agent(folder1, GAME_NAME, run1, 1, "TwoByEightChessAgent")
-        code2, imp2 = load_stored_agent(folder2, GAME_NAME, run2, 2, "TwoByEightChessAgent")
-
-        if not code1 or not code2:
+        game_code = prepare_match_code(folder1, run1, folder2, run2)
+        if not game_code:
             print(f"  FAILED to load match {i + 1}")
             continue
 
-        extra_imports = consolidate_imports(imp1, imp2)
-
-        agent1_info = f"{folder1}:{run1}"
-        agent2_info = f"{folder2}:{run2}"
-
-        game_code = build_game_code(
-            code1, code2, extra_imports, NUM_GAMES_PER_MATCH,
-            MOVE_TIME_LIMIT, MAX_MOVES_PER_GAME, agent1_info, agent2_info,
-        )
-
         async def sem_task(gc, mid, rids):
             async with semaphore:
-                return await run_match_async(gc, mid, rids)
+                return await run_match_async(gc, mid, rids, args.shards, args.seed)
         
         match_tasks.append(sem_task(game_code, i + 1, (run1, run2)))
 
@@ -1500,51 +1689,18 @@ async def main_async():
             p1 = result.get("agent1_points", 0)
             p2 = result.get("agent2_points", 0)
 
-            with open(log_f, "w") as f:
-                f.write("Match Contenders:\n")
-                f.write(f"{folder1}:{run1}\n")
-                f.write(f"{folder2}:{run2}\n\n")
-
-                f.write("Result:\n")
-                f.write(f"{folder1}:{run1} : Pts: {p1} - Score: {s1:.1f}\n")
-                f.write(f"{folder2}:{run2} : Pts: {p2} - Score: {s2:.1f}\n")
-
-                game_log = result.get("log", "")
-                if game_log:
-                    f.write(f"\n{game_log}\n")
-
-                f.write("-" * 60 + "\n")
-
             print(f"  Match {match_id} ({folder1}:{run1} vs {folder2}:{run2}): Pts {p1}-{p2}")
             print(f"MINI:{folder1}:{run1}={p1},{s1}|{folder2}:{run2}={p2},{s2}")
+            report_stop(result, NUM_GAMES_PER_MATCH)
         else:
             print(f"  Match {match_id} ({folder1}:{run1} vs {folder2}:{run2}): FAILED - {result.get('error')}")
 
-        if result["success"] and args.update_scoreboard:
-            agent1_key = f"{folder1}:{run1}"
-            agent2_key = f"{folder2}:{run2}"
-            a1_wins = result.get("agent1_wins", 0)
-            a2_wins = result.get("agent2_wins", 0)
-            match_draws = result.get("draws", 0)
-
-            update_scoreboard(
-                SCOREBOARD_PATH, agent1_key,
-                games_played=NUM_GAMES_PER_MATCH,
-                wins=a1_wins,
-                losses=a2_wins,
-                draws=match_draws,
-                score=s1,
-                points=p1,
-            )
-            update_scoreboard(
-                SCOREBOARD_PATH, agent2_key,
-                games_played=NUM_GAMES_PER_MATCH,
-                wins=a2_wins,
-                losses=a1_wins,
-                draws=match_draws,
-                score=s2,
-                points=p2,
-            )
+        record_match(
+            result, folder1, run1, folder2, run2, log_f,
+            write_scoreboard=args.update_scoreboard,
+        )
+        journal_match(result, [f"{folder1}:{run1}", f"{folder2}:{run2}"])
+        report_kill(result)
 
     print(f"\nLogs saved to: {RESULTS_DIR}")
 
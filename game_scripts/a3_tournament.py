@@ -0,0 +1,554 @@
+"""
+Two-phase A3 (Wizard) tournament.
+
+Phase 1 plays qualifier groups that seat every agent at least once; the
+best agent of each model goes on to Phase 2, which plays 6-agent tables
+of the finalists (every combination, or ``--phase2-meetings`` per pair).
+Both phases are journaled under ``phase1``/``phase2``, so an interrupted
+tournament resumes from its journal.
+"""
+
+import asyncio
+import itertools
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "utils"))
+
+from adaptive_concurrency import AdaptiveConcurrency
+from fixture_durations import FixtureDurations
+from fixture_journal import FixtureJournal, recorded_fixtures
+from match_cache import MatchCache
+from matchmaker import (
+    AGENTS_DIR,
+    GAME_REGISTRY,
+    SCRIPT_DIR,
+    RunOptions,
+    apply_cache,
+    calibrate_durations,
+    discover_agents,
+    estimate_slots,
+    fixture_slots,
+    generate_6p_fixtures,
+    make_pool,
+    order_longest_first,
+    pair_coverage,
+    print_concurrency,
+    print_killed,
+    print_order,
+    print_run_estimate,
+    resume_jobs,
+    run_fixture_job,
+    slot_limit,
+    start_pinning,
+    verify_agent_syntax,
+)
+from run_status import RunStatus
+from time_budget import format_duration
+
+
+async def run_a3_tournament(
+    game_id: str,
+    opts: RunOptions,
+    resume: Path | None = None,
+    phase2_meetings: int | None = None,
+    calibrate: bool = False,
+) -> None:
+    if calibrate:
+        game_name = GAME_REGISTRY[game_id]["name"]
+        await calibrate_durations(game_id, discover_agents(game_name), opts)
+    plan = plan_a3_tournament(game_id, opts, resume, phase2_meetings)
+    if plan is None:
+        return
+    journal, durations = plan["journal"], plan["durations"]
+    match_script = plan["match_script"]
+    pending_p1 = plan["pending_p1"]
+
+    workers, runner_log_dir = opts.workers, opts.runner_log_dir
+    pool = make_pool([(match_script, plan["game_name"], plan["agents"])], opts)
+    pinning = start_pinning(pool, opts)
+    semaphore = fixture_slots(pool, workers, opts.concurrency, opts.concurrency_start)
+    start_time = time.time()
+    status = RunStatus(plan["game_name"], slot_limit(pool, semaphore, workers))
+    status.add(len(pending_p1))
+    await status.open()
+    
+    tasks = [
+        run_fixture_job(
+            job, i + 1, len(pending_p1), semaphore, start_time, match_script, pool=pool,
+            runner_log_dir=runner_log_dir / "phase1" if runner_log_dir else None,
+            durations=durations, journal=journal, phase="phase1", pinning=pinning,
+            status=status,
+        )
+        for i, job in enumerate(pending_p1)
+    ]
+    
+    try:
+        batch_results = await asyncio.gather(*tasks)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\nInterrupted Phase 1 — cancelling remaining matches...")
+        for t in tasks:
+            if isinstance(t, asyncio.Task) and not t.done():
+                t.cancel()
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        durations.save()
+        await status.close()
+        print(f"Resume with: --game {game_id} --resume {journal.path}")
+        sys.exit(1)
+    durations.save()
+    start_p2 = None
+    if isinstance(semaphore, AdaptiveConcurrency):
+        semaphore.close()
+        start_p2 = semaphore.limit  # Phase 2 starts where Phase 1 settled
+
+    jobs_p2 = select_a3_finalists(game_id, plan, batch_results)
+    if jobs_p2 is None or (not opts.auto_yes and not confirm_a3_phase2()):
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        await status.close()
+        sys.exit(1 if jobs_p2 is None else 0)
+
+    jobs_p2, earlier_p2 = plan_a3_phase2(game_id, plan, jobs_p2, opts.order)
+    semaphore_p2 = fixture_slots(pool, workers, opts.concurrency, start_p2)
+    start_time_p2 = time.time()
+    cache = None
+    if plan["cache_mode"] != "off":
+        cache = MatchCache(plan["game_name"], match_script)
+    status.limit = slot_limit(pool, semaphore_p2, workers)
+    status.add(sum(job.get("repeat", 1) for job in jobs_p2))
+    
+    tasks_p2 = [
+        run_fixture_job(
+            job, i + 1, len(jobs_p2), semaphore_p2, start_time_p2, match_script, pool=pool,
+            runner_log_dir=runner_log_dir / "phase2" if runner_log_dir else None,
+            durations=durations, journal=journal, phase="phase2", pinning=pinning,
+            cache=cache, status=status,
+        )
+        for i, job in enumerate(jobs_p2)
+    ]
+    
+    try:
+        results_p2 = [r for batch in await asyncio.gather(*tasks_p2) for r in batch]
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\nInterrupted Phase 2 — cancelling remaining matches...")
+        for t in tasks_p2:
+            if isinstance(t, asyncio.Task) and not t.done():
+                t.cancel()
+        print(f"Resume with: --game {game_id} --resume {journal.path}")
+        sys.exit(1)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        durations.save()
+        await status.close()
+
+    print_a3_summary(game_id, results_p2, earlier_p2, journal, start_time_p2, semaphore_p2)
+
+
+def plan_a3_tournament(
+    game_id: str,
+    opts: RunOptions,
+    resume: Path | None = None,
+    phase2_meetings: int | None = None,
+) -> dict | None:
+    """Set up A3 Phase 1: validate agents, draw (or resume) the qualifier
+    groups and journal them. ``opts.cache_mode``, ``opts.seed``,
+    ``opts.incremental`` (skip Phase 2 tables already on the scoreboard)
+    and *phase2_meetings* (see
+    ``a3_phase2_tables``) apply to Phase 2 only (the qualifiers are always
+    played).
+
+    Returns None for a dry run, otherwise a plan dict used by
+    ``select_a3_finalists`` and ``plan_a3_phase2``. Exits on invalid agents
+    or a bad journal.
+    """
+    game = GAME_REGISTRY.get(game_id)
+    if not game:
+        print(f"ERROR: Unknown game_id {game_id}")
+        sys.exit(1)
+
+    game_name = game["name"]
+    match_script = SCRIPT_DIR / game["script"]
+    workers, shards = opts.workers, opts.shards
+
+    if not match_script.exists():
+        print(f"ERROR: Match script not found: {match_script}")
+        sys.exit(1)
+
+    agents = discover_agents(game_name)
+    if not agents:
+        print(f"ERROR: No agents found for {game_name} in {AGENTS_DIR}")
+        sys.exit(1)
+
+    if opts.health_check:
+        if not verify_agent_syntax(game_name, agents):
+            sys.exit(1)
+
+    # Validate agent counts: Exactly 2 per model.
+    invalid_models = [m for m, rs in agents.items() if len(rs) != 2]
+    if invalid_models:
+        print(f"ERROR: A3 requires exactly 2 agents per model. Invalid models: {invalid_models}")
+        sys.exit(1)
+
+    models = sorted(agents.keys())
+    num_models = len(models)
+
+    if num_models < 3:
+        print(f"ERROR: A3 requires at least 3 models for 6-player games. Found {num_models}.")
+        sys.exit(1)
+
+    print("\nMATCHMAKER A3 - PHASE 1: Qualifiers")
+    print(f"Models: {num_models} (Total Agents: {num_models * 2})")
+
+    # Group into chunks of 3 models; pad the last group if needed.
+    random.shuffle(models)
+    groups = [models[i : i + 3] for i in range(0, num_models, 3)]
+    if len(groups[-1]) < 3:
+        remainder = groups[-1]
+        pad_pool = [m for m in models if m not in remainder]
+        pad_count = 3 - len(remainder)
+        remainder.extend(random.sample(pad_pool, pad_count))
+        groups[-1] = remainder
+        print(f"Note: Last qualifier group padded with {pad_count} extra model(s) for a full 6-player table.")
+    
+    # NUM_OF_GAMES_IN_A_MATCH is typically an env var. We bump it x10 for A3 Phase 1.
+    base_games = int(os.environ.get("NUM_OF_GAMES_IN_A_MATCH", "50"))
+
+    jobs_p1: list[dict] = []
+    for g in groups:
+        # Each group has 3 models. 2 agents per model = 6 players.
+        match_agents = []
+        for m in g:
+            match_agents.extend([(m, agents[m][0]), (m, agents[m][1])])
+        # We do NOT update the scoreboard for Phase 1 as these are qualifiers
+        # and do not reflect final standings across the board.
+        jobs_p1.append({
+            "agents": match_agents,
+            "label": " vs ".join(g),
+            "num_of_games": base_games * 10,
+            "write_scoreboard": False,
+        })
+
+    # A resumed tournament keeps its journaled qualifier groups.
+    journal = FixtureJournal(resume) if resume else FixtureJournal.create(game_name)
+    recorded_p1 = journal.jobs("phase1") if resume else None
+    if resume and recorded_p1 is None:
+        print(f"ERROR: {resume} has no A3 qualifier fixtures")
+        sys.exit(1)
+    if recorded_p1 is not None:
+        if recorded_p1[0] != game_id:
+            print(f"ERROR: {resume} is a {recorded_p1[0]} tournament, not {game_id}")
+            sys.exit(1)
+        jobs_p1 = recorded_p1[1]
+        print(f"Resuming: {resume}")
+
+    num_p1 = len(jobs_p1)
+    print(f"Fixture: {num_p1} matches (Qualifiers)")
+
+    # Qualifiers are few and long: split their games over the workers that
+    # would otherwise sit idle while they run.
+    if shards is None:
+        shards = max(1, workers // num_p1)
+    for job in jobs_p1:
+        job["shards"] = shards
+    
+    if opts.dry_run:
+        print("\n--- DRY RUN (Phase 1) ---")
+        for job in jobs_p1:
+            print(f"  {job['label']}")
+        print_run_estimate(jobs_p1, FixtureDurations(game_name), estimate_slots(opts))
+        
+        print("\n--- DRY RUN (Phase 2) ---")
+        print_a3_phase2_estimate(
+            num_models, phase2_meetings, FixtureDurations(game_name), estimate_slots(opts)
+        )
+        return None
+
+    # Execute Phase 1
+    print(f"Config: {base_games * 10} games per Match (Phase 1 only)")
+    if shards > 1:
+        print(f"Shards: {shards} processes per qualifier")
+
+    durations = FixtureDurations(game_name)
+    if recorded_p1 is None:
+        if opts.order == "longest-first":
+            jobs_p1, _ = order_longest_first(jobs_p1, durations)
+        for i, job in enumerate(jobs_p1):
+            job["batch"] = i
+        journal.write_jobs("phase1", game_id, jobs_p1)
+    print(f"Journal: {journal.path}")
+    pending_p1, earlier_p1 = resume_jobs(journal, "phase1", jobs_p1)
+    if earlier_p1:
+        print(f"Qualifiers already completed: {len(earlier_p1)}")
+    return {
+        "game_name": game_name,
+        "match_script": match_script,
+        "agents": agents,
+        "models": models,
+        "jobs_p1": jobs_p1,
+        "pending_p1": pending_p1,
+        "earlier_p1": earlier_p1,
+        "journal": journal,
+        "durations": durations,
+        "cache_mode": opts.cache_mode,
+        "seed": opts.seed,
+        "recorded": recorded_fixtures(game_name) if opts.incremental else None,
+        "phase2_meetings": phase2_meetings,
+    }
+
+
+def select_a3_finalists(game_id: str, plan: dict, batch_results: list[list[dict]]) -> list[dict] | None:
+    """Print the qualifier results and pick each model's better run.
+
+    Returns the (unordered) Phase 2 jobs (the tables of
+    ``a3_phase2_tables``), or None when a qualifier failed.
+    """
+    agents, models = plan["agents"], plan["models"]
+    jobs_p1, pending_p1, journal = plan["jobs_p1"], plan["pending_p1"], plan["journal"]
+    earlier_p1 = plan["earlier_p1"]
+
+    # Qualifier results in qualifier order, journaled ones included.
+    by_batch = {r["batch"]: r for r in earlier_p1}
+    for job, batch in zip(pending_p1, batch_results):
+        by_batch[job["batch"]] = batch[0]
+    results = [by_batch[job["batch"]] for job in jobs_p1]
+
+    print("\n--- PHASE 1 RESULTS ---")
+    for r in results:
+        if not r.get("success"):
+            print(f"\nFailed Qualifier: {r['label']}\n{r.get('error')}")
+            print(f"Re-run it with: --game {game_id} --resume {journal.path}")
+            return None
+        # Print per-agent results so user can read the standings for this match
+        print(f"\n{'-'*60}\nQualifier Group: {r['label']}\n{'-'*60}")
+        for agent, pts, score in zip(r["agents"], r["points"], r["scores"]):
+            print(f"  {agent}: Pts={pts:.1f} Score={score:.1f}")
+        if r.get("log_path"):
+            print(f"  Log: {r['log_path']}")
+
+    print("\n--- PHASE 1 SELECTION ---")
+    # Automatic selection based on points
+    model_results: dict[str, list[tuple[int, float]]] = {m: [] for m in models}
+    
+    for job, r in zip(jobs_p1, results):
+        for (model_name, run_id), points in zip(job["agents"], r["points"]):
+            model_results[model_name].append((run_id, float(points)))
+
+    # Aggregate points per run_id (models in padded groups appear multiple times)
+    model_agg: dict[str, dict[int, float]] = {m: {} for m in models}
+    for m in models:
+        for run_id, pts in model_results[m]:
+            model_agg[m][run_id] = model_agg[m].get(run_id, 0.0) + pts
+
+    chosen_agents: list[tuple[str, int]] = []
+    print(f"{'Model':<40} | {'Run A (Pts)':<15} | {'Run B (Pts)':<15} | {'Winner'}")
+    print("-" * 85)
+
+    for m in sorted(models):
+        res = sorted(model_agg[m].items())  # [ (run1, total_pts1), (run2, total_pts2) ]
+        if len(res) != 2:
+            # Fallback if parsing failed for some reason
+            print(f"WARNING: Could not parse results for {m}. Defaulting to first run.")
+            winner_run = agents[m][0]
+            pts_a, pts_b = 0.0, 0.0
+        else:
+            run_a, pts_a = res[0]
+            run_b, pts_b = res[1]
+            if pts_a >= pts_b:
+                winner_run = run_a
+            else:
+                winner_run = run_b
+
+        chosen_agents.append((m, winner_run))
+        a_str = f"{res[0][0]} ({res[0][1]:.1f})" if len(res)>0 else "N/A"
+        b_str = f"{res[1][0]} ({res[1][1]:.1f})" if len(res)>1 else "N/A"
+        print(f"{m:<40} | {a_str:<15} | {b_str:<15} | {winner_run}")
+                
+    # Phase 2
+    meetings = plan.get("phase2_meetings")
+    recorded = plan.get("recorded")
+    covered = pair_coverage(recorded) if recorded and meetings else None
+    combinations = a3_phase2_tables(chosen_agents, meetings, covered)
+    num_p2 = len(combinations)
+    print("\nMATCHMAKER A3 - PHASE 2: Main Event")
+    print(f"Selected Agents: {len(chosen_agents)}")
+    if meetings:
+        full = math.comb(len(chosen_agents), 6)
+        met = pair_coverage(Counter(tuple(sorted(t)) for t in combinations)).values() or [0]
+        saved = f"{full - num_p2} fewer than" if full > num_p2 else "vs"
+        print(f"Design: {num_p2} matches, pairs meet {min(met)}-{max(met)} times in them "
+              f"({saved} all {full} combinations)")
+        if covered is not None:
+            print("Recorded: pair meetings of tables already played count towards the design")
+    else:
+        print(f"Combinations: {num_p2} matches")
+
+    # Build P2 jobs (Phase 2: hardcoded to 1 game per match)
+    jobs_p2: list[dict] = []
+    for count_idx, group in enumerate(combinations):
+        # Keep label short since there are 134k 
+        jobs_p2.append({
+            "agents": list(group),
+            "label": f"Match_{count_idx+1}",
+            "num_of_games": 1,
+            "write_scoreboard": True,
+        })
+    if recorded and not meetings:
+        jobs_p2 = [job for job in jobs_p2 if not recorded[tuple(sorted(job["agents"]))]]
+        print(f"Recorded: {num_p2 - len(jobs_p2)} tables already played (skipped)")
+    random.shuffle(jobs_p2) # disperse model clustering evenly
+    return jobs_p2
+
+
+def a3_phase2_tables(
+    finalists: list[tuple[str, int]],
+    meetings: int | None = None,
+    covered: Counter | None = None,
+) -> list[list[tuple[str, int]]]:
+    """Phase 2 tables of the finalists (one agent per model).
+
+    Without *meetings*, every 6-agent combination, in sorted seat order.
+    With *meetings*, a sampled design: the greedy covering tables of
+    ``generate_6p_fixtures`` (every pair meets at least *meetings* times,
+    counting the recorded *covered* meetings), seated by ``balance_seats``.
+    """
+    if not meetings:
+        return [list(group) for group in itertools.combinations(finalists, 6)]
+    tables = generate_6p_fixtures({m: [run] for m, run in finalists}, meetings, covered=covered)
+    return balance_seats(tables)
+
+
+def balance_seats(tables: list[list[tuple[str, int]]]) -> list[list[tuple[str, int]]]:
+    """Seat each table so every agent plays every seat about equally often.
+
+    Tables are seated in order; each takes the seating that puts its agents
+    in the seats they have used least so far.
+    """
+    used: dict[tuple[str, int], list[int]] = {}
+    seated = []
+    for table in tables:
+        for agent in table:
+            used.setdefault(agent, [0] * len(table))
+        order = min(
+            itertools.permutations(table),
+            key=lambda order: sum(used[a][seat] for seat, a in enumerate(order)),
+        )
+        for seat, agent in enumerate(order):
+            used[agent][seat] += 1
+        seated.append(list(order))
+    return seated
+
+
+def print_a3_phase2_estimate(
+    num_models: int, meetings: int | None, durations: FixtureDurations, workers: int
+) -> None:
+    """Dry-run size of Phase 2: all combinations versus the sampled design."""
+    full = math.comb(num_models, 6)
+    per_game = durations.global_mean
+
+    def compute(tables: int) -> str:
+        if per_game is None:
+            return ""
+        seconds = tables * per_game
+        return (f", ~{format_duration(seconds)} of compute"
+                f" ({format_duration(seconds / max(1, workers))} on {workers} workers)")
+
+    print(f"All combinations: {full} matches, every pair meets "
+          f"{math.comb(num_models - 2, 4)} times{compute(full)}")
+    if not meetings:
+        print("Use --phase2-meetings K for a sampled design where every pair meets K+ times")
+        return
+    placeholder = [(f"model-{i}", 1) for i in range(num_models)]
+    tables = len(a3_phase2_tables(placeholder, meetings))
+    print(f"Sampled design: ~{tables} matches, every pair meets {meetings}+ times{compute(tables)}")
+    if full > tables:
+        print(f"Saves: {full - tables} matches ({(full - tables) / full:.1%})")
+    if per_game is None:
+        print("Compute estimates need recorded durations (run a tournament first)")
+
+
+def confirm_a3_phase2() -> bool:
+    """Ask before starting the (large) Phase 2."""
+    while True:
+        proceed = input("Start Phase 2? [y/N]: ").strip().lower()
+        if proceed in ("y", "yes"):
+            return True
+        elif proceed in ("n", "no", ""):
+            print("Aborting.")
+            return False
+
+
+def plan_a3_phase2(
+    game_id: str, plan: dict, jobs_p2: list[dict], order: str = "longest-first"
+) -> tuple[list[dict], list[dict]]:
+    """Order and journal the Phase 2 jobs (or take them from a resumed journal).
+
+    Tables the match cache answers are not scheduled. Returns the pending
+    jobs and the journaled or cached results of completed ones.
+    """
+    journal, durations = plan["journal"], plan["durations"]
+    num_p2 = len(jobs_p2)
+    known = 0
+    cached: list[dict] = []
+    recorded_p2 = journal.jobs("phase2")
+    if recorded_p2 is not None:
+        jobs_p2 = recorded_p2[1]
+    else:
+        jobs_p2, cached = apply_cache(game_id, jobs_p2, plan["cache_mode"], plan["seed"])
+        if plan["cache_mode"] != "off":
+            print(f"Cache: {len(cached)} of {num_p2} matches reused ({plan['cache_mode']})")
+        if order == "longest-first":
+            jobs_p2, known = order_longest_first(jobs_p2, durations)
+        for i, job in enumerate(jobs_p2):
+            job["batch"] = i
+        journal.write_jobs("phase2", game_id, jobs_p2)
+        journal.record_cached("phase2", cached)
+    jobs_p2, earlier_p2 = resume_jobs(journal, "phase2", jobs_p2)
+    if earlier_p2:
+        print(f"Already completed: {len(earlier_p2)} matches, {len(jobs_p2)} remaining")
+    earlier_p2 += cached
+    print("Config: 1 game per Match (Phase 2 only)")
+    print_order(order, known, num_p2, durations)
+    return jobs_p2, earlier_p2
+
+
+def print_a3_summary(
+    game_id: str,
+    results_p2: list[dict],
+    earlier_p2: list[dict],
+    journal: FixtureJournal,
+    start_time_p2: float,
+    semaphore_p2=None,
+) -> None:
+    """Summary of A3 Phase 2; failed tables go to a3_failed_matches.log."""
+    results_p2 = earlier_p2 + results_p2
+    succeeded = sum(1 for r in results_p2 if r.get("success"))
+    failed = sum(1 for r in results_p2 if not r.get("success"))
+    duration = time.time() - start_time_p2
+    duration_str = time.strftime("%H:%M:%S", time.gmtime(duration))
+
+    print("\nPHASE 2 COMPLETE")
+    print(f"  Succeeded: {succeeded} | Failed: {failed}")
+    cached = sum(1 for r in results_p2 if r.get("cached"))
+    if cached:
+        print(f"  Cached: {cached} reused from the match cache")
+    print_killed(results_p2)
+    print_concurrency(semaphore_p2)
+    print(f"  Duration: {duration_str}")
+
+    if failed:
+        with open("a3_failed_matches.log", "w") as f:
+            for r in results_p2:
+                if not r.get("success"):
+                    err = r.get("error", "unknown")
+                    f.write(f"{r['label']}: {err}\n")
+        print("Failed matches written to a3_failed_matches.log")
+        print(f"Re-run them with: --game {game_id} --resume {journal.path}")
+
+
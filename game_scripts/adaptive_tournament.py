@@ -0,0 +1,170 @@
+"""
+Information-maximizing tournament of a 2-player game
+(``matchmaker.py --format adaptive``).
+
+Schedules, whenever a worker slot frees up, the cross-model pairing with
+the most expected information under the live ratings (``RatingTable``),
+until the ranking is confident enough or the fixture budget runs out.
+"""
+
+import asyncio
+import itertools
+import math
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "utils"))
+
+from adaptive_concurrency import AdaptiveConcurrency
+from fixture_durations import FixtureDurations
+from fixture_journal import FixtureJournal
+from matchmaker import (
+    GAME_REGISTRY,
+    RunOptions,
+    fixture_slots,
+    format_agents,
+    make_pool,
+    print_summary,
+    run_fixture_job,
+    slot_limit,
+    start_pinning,
+)
+from ratings import RatingTable, match_share
+from run_status import RunStatus
+
+
+def _print_ratings(ratings: RatingTable) -> None:
+    """Final adaptive table: rating with a 95% interval, and matches played."""
+    ranked = ratings.ranked()
+
+    print(f"\n{'='*80}")
+    print("ADAPTIVE RATINGS")
+    print(f"{'='*80}")
+
+    agent_col = max(max(len(f"{f}:{r}") for f, r in ranked), 5)
+    header = f"{'#':<4} {'Agent':<{agent_col}}  {'Matches':>7}  {'Rating':>7}  {'95%':>6}"
+    print(header)
+    print("-" * len(header))
+
+    for rank, agent in enumerate(ranked, 1):
+        print(
+            f"{rank:<4} {agent[0] + ':' + str(agent[1]):<{agent_col}}  "
+            f"{ratings.matches[agent]:>7}  {ratings.mu[agent]:>7.0f}  "
+            f"{'±' + format(2 * math.sqrt(ratings.var[agent]), '.0f'):>6}"
+        )
+
+    print(f"{'='*80}")
+
+
+async def run_adaptive_tournament(
+    game_id: str, opts: RunOptions, budget: int | None = None, confidence: float = 0.9
+) -> None:
+    """Information-maximizing tournament of a 2-player game.
+
+    Keeps a live rating with uncertainty per agent (``RatingTable``) and,
+    whenever a worker slot frees up, schedules the cross-model pairing with
+    the most expected information under the current estimates. Stops when
+    every agent has played and the expected fraction of correctly ordered
+    agent pairs (``rank_confidence``) reaches *confidence*, or after
+    *budget* fixtures (default: one round robin's worth of pairings).
+    Matches write the scoreboard as usual and are journaled as phase
+    ``adaptive`` (counted by ``--incremental``); the tournament itself
+    cannot be resumed.
+    """
+    game_name = GAME_REGISTRY[game_id]["name"]
+    match_script, agents, flat = format_agents(game_id, "adaptive", opts.health_check)
+    workers, shards = opts.workers, opts.shards or 1
+    round_robin = sum(1 for a, b in itertools.combinations(flat, 2) if a[0] != b[0])
+    budget = budget or round_robin
+    print(f"\nMATCHMAKER - {game_name} [adaptive]")
+    print(f"Agents: {len(flat)} ({len(agents)} models)")
+    print(
+        f"Fixture: up to {budget} matches, until rank confidence {confidence:g} "
+        f"(a round robin needs {round_robin} per same_opponent_match)"
+    )
+    print(f"Workers: {workers}")
+    print(f"Backend: {opts.backend}")
+    if opts.dry_run:
+        print("\n--- DRY RUN (no matches executed) ---")
+        print(f"Total Matches: at most {budget}")
+        return
+
+    journal = FixtureJournal.create(game_name)
+    print(f"Journal: {journal.path}")
+    durations = FixtureDurations(game_name)
+    pool = make_pool([(match_script, game_name, agents)], opts)
+    pinning = start_pinning(pool, opts)
+    semaphore = fixture_slots(pool, workers, opts.concurrency, opts.concurrency_start)
+    start_time = time.time()
+    status = RunStatus(game_name, slot_limit(pool, semaphore, workers))
+    status.add(budget)
+    await status.open()
+
+    ratings = RatingTable(flat)
+    by_key = {f"{f}:{r}": (f, r) for f, r in flat}
+    in_flight: dict[asyncio.Future, tuple] = {}
+    busy: Counter = Counter()
+    results: list[dict] = []
+    scheduled = 0
+    stop = None
+    try:
+        while True:
+            if stop is None:
+                if scheduled >= budget:
+                    stop = f"fixture budget of {budget} matches reached"
+                elif min(ratings.matches[a] for a in flat) > 0:
+                    reached = ratings.rank_confidence()
+                    if reached >= confidence:
+                        stop = f"rank confidence {reached:.3f} reached"
+            slots = semaphore.limit if isinstance(semaphore, AdaptiveConcurrency) else workers
+            while stop is None and len(in_flight) < slots and scheduled < budget:
+                pair = ratings.best_pair(lambda a, b: a[0] != b[0], busy)
+                job = {
+                    "agents": list(pair),
+                    "label": " vs ".join(f"{f}:{r}" for f, r in pair),
+                    "num_of_games": None,
+                    "write_scoreboard": True,
+                    "shards": shards,
+                    "batch": scheduled,
+                }
+                journal.write_jobs("adaptive", game_id, [job])
+                scheduled += 1
+                task = asyncio.ensure_future(run_fixture_job(
+                    job, scheduled, budget, semaphore, start_time, match_script, pool=pool,
+                    runner_log_dir=opts.runner_log_dir, durations=durations, journal=journal,
+                    phase="adaptive", pinning=pinning, status=status,
+                ))
+                in_flight[task] = pair
+                busy.update(pair)
+            if not in_flight:
+                break
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                busy.subtract(in_flight.pop(task))
+                for res in task.result():
+                    results.append(res)
+                    if res.get("success"):
+                        a, b = (by_key[key] for key in res["agents"])
+                        ratings.update(a, b, match_share(*res["points"]))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\nInterrupted — cancelling remaining matches...")
+        for task in in_flight:
+            task.cancel()
+        stop = "interrupted"
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        durations.save()
+        await status.close()
+
+    print_summary(
+        game_id, results, [], journal, start_time, semaphore,
+        title="ADAPTIVE COMPLETE", resumable=False,
+    )
+    print(f"  Stopped: {stop or 'no pairing left'}")
+    print(f"  Rank confidence: {ratings.rank_confidence():.3f}")
+    _print_ratings(ratings)
+
+
@@ -0,0 +1,235 @@
+"""
+Multi-game league: the tournaments of several games over one worker pool
+and one fixture queue (``matchmaker.py --game A1,A3,...``).
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "utils"))
+
+from a3_tournament import (
+    confirm_a3_phase2,
+    plan_a3_phase2,
+    plan_a3_tournament,
+    print_a3_summary,
+    select_a3_finalists,
+)
+from fixture_durations import FixtureDurations
+from match_cache import MatchCache
+from matchmaker import (
+    GAME_REGISTRY,
+    RunOptions,
+    fixture_games,
+    fixture_slots,
+    make_pool,
+    plan_tournament,
+    print_concurrency,
+    print_summary,
+    run_fixture_job,
+    slot_limit,
+    start_pinning,
+)
+from run_status import RunStatus
+
+
+def merge_queues(
+    queues: list[tuple[str, list[dict], FixtureDurations]], order: str = "longest-first"
+) -> list[tuple[str, dict]]:
+    """Interleave the batch lists of several games into one start order.
+
+    With ``longest-first``, batches with an expected wall time start
+    longest first across all games. The rest (everything with ``random``)
+    follow their own game's order, taking turns between games so that no
+    game waits for another's whole fixture list.
+    """
+    known, unknown = [], []
+    for game_id, jobs, durations in queues:
+        for pos, job in enumerate(jobs):
+            estimate = None
+            if order == "longest-first":
+                estimate = durations.estimate(job["agents"], fixture_games(job))
+            if estimate is None:
+                unknown.append((pos, game_id, job))
+            else:
+                known.append((-estimate * job.get("repeat", 1), game_id, job))
+    known.sort(key=lambda item: item[0])
+    unknown.sort(key=lambda item: item[0])
+    return [(g, job) for _, g, job in known] + [(g, job) for _, g, job in unknown]
+
+
+async def _ask(question) -> bool:
+    """Run a blocking yes/no prompt without stalling the other games.
+
+    A daemon thread rather than the default executor: an interrupted run
+    must not wait for the prompt's ``input()`` to return.
+    """
+    loop = asyncio.get_running_loop()
+    answer = loop.create_future()
+
+    def ask() -> None:
+        result = question()
+        try:
+            loop.call_soon_threadsafe(answer.set_result, result)
+        except RuntimeError:
+            pass  # the event loop is gone
+
+    threading.Thread(target=ask, daemon=True).start()
+    return await answer
+
+
+async def run_league(
+    game_ids: list[str],
+    opts: RunOptions,
+    same_opponent_match: int,
+    new_models: list[str] | None = None,
+    random16: bool = False,
+    phase2_meetings: int | None = None,
+) -> None:
+    """Run the tournaments of several games over one pool and one queue.
+
+    Every game is planned (and journaled) as on its own, then all batches
+    go into one start order (``merge_queues``) behind A3's qualifiers,
+    which gate its Phase 2. Each game prints its own summary as soon as
+    its last batch finishes; A3's Phase 2 joins the queue when its
+    qualifiers are done. A game that cannot be planned is skipped.
+    """
+    plans: dict[str, dict] = {}
+    for game_id in game_ids:
+        try:
+            if game_id == "A3":
+                plan = plan_a3_tournament(game_id, opts, phase2_meetings=phase2_meetings)
+            else:
+                plan = plan_tournament(
+                    game_id, opts, same_opponent_match, new_models=new_models, random16=random16
+                )
+        except SystemExit:
+            print(f"Skipping {game_id}.")
+            continue
+        if plan is not None:
+            plans[game_id] = plan
+    if opts.dry_run or not plans:
+        return
+
+    games = [
+        (plan["match_script"], GAME_REGISTRY[game_id]["name"], plan["agents"])
+        for game_id, plan in plans.items()
+    ]
+    workers, runner_log_dir = opts.workers, opts.runner_log_dir
+    print(f"\nLEAGUE - {', '.join(plans)}: one queue over {workers} workers")
+    pool = make_pool(games, opts)
+    pinning = start_pinning(pool, opts)
+    semaphore = fixture_slots(pool, workers, opts.concurrency, opts.concurrency_start)
+    start_time = time.time()
+    status = RunStatus("league", slot_limit(pool, semaphore, workers))
+    status.add(sum(
+        job.get("repeat", 1)
+        for game_id, plan in plans.items()
+        for job in (plan["pending_p1"] if game_id == "A3" else plan["batches"])
+    ))
+    await status.open()
+    caches = {
+        game_id: MatchCache(GAME_REGISTRY[game_id]["name"], plan["match_script"])
+        for game_id, plan in plans.items()
+    } if opts.cache_mode != "off" else {}
+
+    def start(game_id: str, job: dict, idx: int, total: int, phase: str = "main") -> asyncio.Task:
+        plan = plans[game_id]
+        log_dir = runner_log_dir / game_id if runner_log_dir else None
+        if log_dir is not None and phase != "main":
+            log_dir = log_dir / phase
+        return asyncio.create_task(run_fixture_job(
+            job, idx, total, semaphore, start_time, plan["match_script"], pool=pool,
+            runner_log_dir=log_dir, durations=plan["durations"], journal=plan["journal"],
+            phase=phase, pinning=pinning, tag=game_id,
+            cache=caches.get(game_id), status=status,
+        ))
+
+    # Tasks are created in start order; the concurrency limit admits them FIFO.
+    tasks: dict[str, list[asyncio.Task]] = {game_id: [] for game_id in plans}
+    a3_first = [("A3", job) for job in plans["A3"]["pending_p1"]] if "A3" in plans else []
+    queues = [
+        (game_id, plan["batches"], plan["durations"])
+        for game_id, plan in plans.items() if game_id != "A3"
+    ]
+    positions = {
+        id(job): i for game_id, plan in plans.items()
+        for i, job in enumerate(plan["pending_p1"] if game_id == "A3" else plan["batches"])
+    }
+    for game_id, job in a3_first + merge_queues(queues, opts.order):
+        total = len(plans[game_id]["pending_p1"] if game_id == "A3" else plans[game_id]["batches"])
+        phase = "phase1" if game_id == "A3" else "main"
+        tasks[game_id].append(start(game_id, job, positions[id(job)] + 1, total, phase))
+
+    outcome: dict[str, tuple[list[dict], float]] = {}
+
+    async def finish_game(game_id: str) -> None:
+        plan = plans[game_id]
+        results = [r for batch in await asyncio.gather(*tasks[game_id]) for r in batch]
+        plan["durations"].save()
+        print_summary(
+            game_id, results, plan["cached"], plan["journal"], start_time,
+            mini=plan["mini"], title=f"{game_id} COMPLETE",
+        )
+        outcome[game_id] = (plan["cached"] + results, time.time() - start_time)
+
+    async def finish_a3() -> None:
+        plan = plans["A3"]
+        batch_results = await asyncio.gather(*tasks["A3"])
+        plan["durations"].save()
+        jobs_p2 = select_a3_finalists("A3", plan, batch_results)
+        if jobs_p2 is None or (not opts.auto_yes and not await _ask(confirm_a3_phase2)):
+            outcome["A3"] = ([r for batch in batch_results for r in batch], time.time() - start_time)
+            return
+        jobs_p2, earlier_p2 = plan_a3_phase2("A3", plan, jobs_p2, opts.order)
+        start_p2 = time.time()
+        status.add(sum(job.get("repeat", 1) for job in jobs_p2))
+        tasks["A3"] = [
+            start("A3", job, i + 1, len(jobs_p2), "phase2") for i, job in enumerate(jobs_p2)
+        ]
+        results_p2 = [r for batch in await asyncio.gather(*tasks["A3"]) for r in batch]
+        plan["durations"].save()
+        print_a3_summary("A3", results_p2, earlier_p2, plan["journal"], start_p2)
+        outcome["A3"] = (earlier_p2 + results_p2, time.time() - start_time)
+
+    flows = [
+        asyncio.ensure_future(finish_a3() if game_id == "A3" else finish_game(game_id))
+        for game_id in plans
+    ]
+    try:
+        await asyncio.gather(*flows)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\nInterrupted — cancelling remaining matches...")
+        for t in flows + [t for game_tasks in tasks.values() for t in game_tasks]:
+            if not t.done():
+                t.cancel()
+        for game_id, plan in plans.items():
+            if game_id not in outcome:
+                print(f"Resume with: --game {game_id} --resume {plan['journal'].path}")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        for plan in plans.values():
+            plan["durations"].save()
+        await status.close()
+
+    print("\nLEAGUE COMPLETE")
+    for game_id in plans:
+        if game_id not in outcome:
+            print(f"  {game_id}: interrupted")
+            continue
+        results, finished = outcome[game_id]
+        succeeded = sum(1 for r in results if r.get("success"))
+        finished_str = time.strftime("%H:%M:%S", time.gmtime(finished))
+        print(
+            f"  {game_id}: Succeeded: {succeeded} | Failed: {len(results) - succeeded} "
+            f"| finished at {finished_str}"
+        )
+    print_concurrency(semaphore)
+    duration_str = time.strftime("%H:%M:%S", time.gmtime(time.time() - start_time))
+    print(f"  Duration: {duration_str}")
+
+
@@ -2,24 +2,65 @@
 Round-robin tournament scheduler for competitive LLM agent matches.
 
 Discovers all agents for a given game, generates cross-model fixtures
-(filtering out same-model pairs), and executes them concurrently as
-subprocesses delegated to the appropriate game match runner.
+(filtering out same-model pairs), and executes them concurrently by
+delegating to the appropriate game match runner — either by calling its
+``run_fixture()`` in a warm worker pool (default) or by spawning one cold
+runner CLI subprocess per fixture.
 """
 
 import argparse
 import asyncio
+import functools
 import itertools
+import json
+import os
 import random
 import re
+import signal
 import sys
 import time
-from collections import Counter
+from collections import Counter, deque
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Iterator
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 AGENTS_DIR = PROJECT_ROOT / "agents"
 
+sys.path.append(str(PROJECT_ROOT / "utils"))
+
+import subinterp
+from adaptive_concurrency import AdaptiveConcurrency, cpu_count, start_limit
+from agent_loader import collect_agent_imports
+from cpu_pinning import CpuPinning
+from dotenv import load_dotenv
+from fixture_durations import FixtureDurations
+from fixture_journal import FixtureJournal, recorded_fixtures
+from fixture_stream import FixtureStream, count_pairs
+from match_api import load_runner, record_scoreboard, takes_seed
+from match_cache import MatchCache, fixture_seed, seed_policy
+from match_cluster import DEFAULT_PORT, ClusterPool, cluster_token
+from match_pool import MatchWorkerPool, SubinterpreterPool
+from run_estimate import CALIBRATION_GAMES, calibration_groups, run_estimate
+from run_status import RunStatus
+from time_budget import TimeBudget, budget_fit, format_duration, parse_duration
+
+# Same .env as the runners, so fixture deadlines use their MATCH_TIME_LIMIT.
+load_dotenv()
+
+BACKENDS = ("pool", "zygote", "subinterp", "subprocess", "cluster")
+ORDERS = ("longest-first", "random")
+CONCURRENCY_MODES = ("adaptive", "fixed")
+CACHE_MODES = ("off", "any", "seeded")
+FORMATS = ("round-robin", "swiss", "adaptive")
+
+# A fixture batch is killed this long after its scaled MATCH_TIME_LIMIT
+# (runner startup, agent loading, log writing).
+DEADLINE_GRACE = 60
+# Default for MATCH_STALL_LIMIT: seconds a game script may stay silent.
+DEFAULT_STALL_LIMIT = 600
+
 GAME_REGISTRY: dict[str, dict] = {
     "A1": {"name": "A1-Battleship", "script": "A1-battleship_match.py", "players": 2},
     "A2": {"name": "A2-LieOnce", "script": "A2-lie_once_match.py", "players": 2},
@@ -44,6 +85,32 @@ GAME_REGISTRY: dict[str, dict] = {
 }
 
 
+@dataclass
+class RunOptions:
+    """How a tournament's fixtures are run: the options every format shares.
+
+    ``shards`` None lets A3 size its qualifier shards (other formats play
+    unsharded); ``concurrency_start`` is where the adaptive limit starts
+    (an explicit ``--workers``, else the CPU count).
+    """
+
+    workers: int
+    dry_run: bool = False
+    health_check: bool = False
+    auto_yes: bool = False
+    backend: str = "pool"
+    batch_size: int | None = None
+    shards: int | None = None
+    runner_log_dir: Path | None = None
+    order: str = "longest-first"
+    listen: str | None = None
+    concurrency: str = "adaptive"
+    concurrency_start: int | None = None
+    pin_cpus: bool = False
+    cache_mode: str = "off"
+    seed: int | None = None
+    incremental: bool = False
+    time_budget: float | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -115,15 +182,30 @@ def discover_agents(game_name: str) -> dict[str, list[int]]:
 # ---------------------------------------------------------------------------
 
 
+def pair_coverage(groups: Counter) -> Counter:
+    """Times each agent pair met, from fixture counts keyed by agent group.
+
+    Pairs are sorted tuples, as in ``generate_6p_fixtures``'s coverage.
+    """
+    covered: Counter = Counter()
+    for group, n in groups.items():
+        for pair in itertools.combinations(sorted(group), 2):
+            covered[pair] += n
+    return covered
+
+
 def generate_2p_fixtures(
     agents: dict[str, list[int]],
     same_opponent_match: int,
     new_models: list[str] | None = None,
+    covered: Counter | None = None,
 ) -> list[tuple[tuple[str, int], tuple[str, int]]]:
     """All cross-model agent pairs, repeated same_opponent_match times.
 
     When *new_models* is given, only pairs where at least one side belongs
     to one of those model folders are produced (incremental tournament).
+    With *covered* (``pair_coverage`` of the recorded fixtures), each pair
+    is only repeated for the meetings it still lacks.
     """
     flat = [(folder, run) for folder, runs in agents.items() for run in runs]
     pairs = [
@@ -137,7 +219,14 @@ def generate_2p_fixtures(
             (a, b) for a, b in pairs
             if a[0] in nm_set or b[0] in nm_set
         ]
-    fixtures = pairs * same_opponent_match
+    if covered is None:
+        fixtures = pairs * same_opponent_match
+    else:
+        fixtures = [
+            pair
+            for pair in pairs
+            for _ in range(same_opponent_match - covered[tuple(sorted(pair))])
+        ]
     random.shuffle(fixtures)
     return fixtures
 
@@ -163,82 +252,75 @@ def generate_6p_fixtures(
     agents: dict[str, list[int]],
     same_opponent_match: int,
     new_models: list[str] | None = None,
+    covered: Counter | None = None,
 ) -> list[list[tuple[str, int]]]:
     """Greedy pairwise-coverage groups of 6 agents from different models.
 
+    Every cross-model pair needs *same_opponent_match* meetings. The
+    remaining deficit is kept per pair and, as the number of deficient
+    pairs, per agent, and updated as groups are added. Each group starts
+    from a most-needed pair (the agent with the most deficient pairs and
+    its most deficient partner) and grows one agent at a time, adding the
+    agent from an unused model that covers the most deficient pairs with
+    the group so far (ties: the agent with the most deficient pairs, then
+    the one that met the group least, then random). Every group covers at least its starting pair, so generation
+    ends after at most one group per missing meeting.
+
     When *new_models* is given, only cross-model pairs involving those models
     need coverage, and every generated group is guaranteed to contain at least
-    one of them.
+    one of them. *covered* (``pair_coverage`` of the recorded fixtures) is
+    the coverage to start from, so only the deficit is generated.
     """
     flat = [(folder, run) for folder, runs in agents.items() for run in runs]
-    folders = list(agents.keys())
-    num_models = len(folders)
-    group_size = min(num_models, 6)
-
-    # Build target coverage for every cross-model pair
-    cross_pairs = [
-        (a, b) for a, b in itertools.combinations(flat, 2) if a[0] != b[0]
-    ]
-    if new_models:
-        nm_set = set(new_models)
-        cross_pairs = [
-            (a, b) for a, b in cross_pairs
-            if a[0] in nm_set or b[0] in nm_set
-        ]
-    coverage: Counter[tuple[tuple[str, int], tuple[str, int]]] = Counter()
-    target = same_opponent_match
+    group_size = min(len(agents), 6)
+    covered = covered or Counter()
+    met = Counter(covered)
+    nm_set = set(new_models or ())
+
+    # Remaining meetings per pair, and per agent its partners still owed one
+    deficit: dict[tuple, int] = {}
+    owed: dict[tuple[str, int], set] = {a: set() for a in flat}
+    for a, b in itertools.combinations(flat, 2):
+        if a[0] == b[0] or (nm_set and a[0] not in nm_set and b[0] not in nm_set):
+            continue
+        pair = (a, b) if a < b else (b, a)
+        missing = same_opponent_match - covered[pair]
+        if missing > 0:
+            deficit[pair] = missing
+            owed[a].add(b)
+            owed[b].add(a)
 
-    def under_covered() -> int:
-        return sum(1 for p in cross_pairs if coverage[p] < target)
+    def need(a, b) -> int:
+        return deficit.get((a, b) if a < b else (b, a), 0)
 
     fixtures: list[list[tuple[str, int]]] = []
-    stall = 0
-    max_stall = 200
-
-    while under_covered() > 0:
-        best_group: list[tuple[str, int]] | None = None
-        best_score = 0
-
-        for _ in range(1000):
-            if group_size > num_models:
-                break
-            if new_models:
-                # Force one of the new models into the group
-                focus_model = random.choice(new_models)
-                other_folders = [f for f in folders if f != focus_model]
-                
-                remaining_slots = group_size - 1
-                if remaining_slots > len(other_folders):
-                    remaining_slots = len(other_folders)
-                
-                chosen_others = random.sample(other_folders, remaining_slots)
-                group = [(focus_model, random.choice(agents[focus_model]))]
-                group.extend((m, random.choice(agents[m])) for m in chosen_others)
-            else:
-                chosen_models = random.sample(folders, group_size)
-                group = [(m, random.choice(agents[m])) for m in chosen_models]
-
-            score = 0
-            for a, b in itertools.combinations(group, 2):
-                pair = (a, b) if a < b else (b, a)
-                if coverage[pair] < target:
-                    score += 1
-
-            if score > best_score:
-                best_score = score
-                best_group = group
-
-        if best_group is None or best_score == 0:
-            stall += 1
-            if stall >= max_stall:
-                break
-            continue
-
-        stall = 0
-        for a, b in itertools.combinations(best_group, 2):
+    while deficit:
+        most = max(len(partners) for partners in owed.values())
+        first = random.choice([a for a, partners in owed.items() if len(partners) == most])
+        second = max(owed[first], key=lambda b: (need(first, b), len(owed[b]), random.random()))
+        group = [first, second]
+        while len(group) < group_size:
+            used = {folder for folder, _ in group}
+            group.append(max(
+                (c for c in flat if c[0] not in used),
+                key=lambda c: (
+                    sum(1 for g in group if need(g, c)),
+                    len(owed[c]),
+                    -sum(met[(g, c) if g < c else (c, g)] for g in group),
+                    random.random(),
+                ),
+            ))
+        for a, b in itertools.combinations(group, 2):
             pair = (a, b) if a < b else (b, a)
-            coverage[pair] += 1
-        fixtures.append(best_group)
+            met[pair] += 1
+            if pair not in deficit:
+                continue
+            deficit[pair] -= 1
+            if not deficit[pair]:
+                del deficit[pair]
+                owed[a].discard(b)
+                owed[b].discard(a)
+        fixtures.append(group)
 
     random.shuffle(fixtures)
     return fixtures
@@ -249,60 +331,712 @@ def generate_6p_fixtures(
 # ---------------------------------------------------------------------------
 
 
-async def run_match_subprocess(
-    cmd: list[str],
+def make_pool(
+    games: list[tuple[Path, str, dict[str, list[int]]]], opts: RunOptions
+) -> MatchWorkerPool | ClusterPool | None:
+    """Start the worker pool of ``opts.backend`` (None for the subprocess backend).
+
+    *games* lists ``(match_script, game_name, agents)`` of every game the
+    pool will run; one pool serves a whole multi-game league.
+    """
+    backend, workers, pin_cpus = opts.backend, opts.workers, opts.pin_cpus
+    if backend == "subprocess":
+        return None
+    scripts = [match_script for match_script, _, _ in games]
+    if backend == "cluster":
+        return ClusterPool(opts.listen or f"127.0.0.1:{DEFAULT_PORT}", scripts, cluster_token())
+    if backend == "subinterp":
+        if subinterp.available():
+            return SubinterpreterPool(workers, scripts, pin_cpus)
+        print("NOTE: subinterpreters need Python 3.12+; using the process pool instead.")
+    zygote_imports = None
+    if backend == "zygote":
+        zygote_imports = set()
+        for _, game_name, agents in games:
+            zygote_imports |= collect_agent_imports(game_name, agents)
+    return MatchWorkerPool(workers, scripts, zygote_imports, pin_cpus)
+
+
+def start_pinning(pool, opts: RunOptions) -> CpuPinning | None:
+    """Print the CPU pinning layout of this run.
+
+    Pools pin their own workers; for the subprocess backend the returned
+    ``CpuPinning`` is handed to ``run_fixture_job``, which pins each runner
+    subprocess to a free slot.
+    """
+    if not opts.pin_cpus:
+        return None
+    if isinstance(pool, ClusterPool):
+        print("CPU pinning: per worker host (utils/match_cluster.py --pin-cpus)")
+        return None
+    if pool is not None:
+        print(f"CPU pinning: {pool.pinning.describe()}")
+        return None
+    pinning = CpuPinning(opts.workers)
+    print(f"CPU pinning: {pinning.describe()}")
+    return pinning
+
+
+def fixture_slots(pool, workers: int, concurrency: str = "adaptive", start: int | None = None):
+    """Concurrency limit for fixture batches.
+
+    Remote slots for the cluster backend; otherwise *workers* at once
+    (``fixed``) or an ``AdaptiveConcurrency`` limit of at most *workers*,
+    starting at *start* or the CPU count (``adaptive``).
+    """
+    if isinstance(pool, ClusterPool):
+        return pool.capacity
+    if concurrency == "adaptive":
+        return AdaptiveConcurrency(workers, start)
+    return asyncio.Semaphore(workers)
+
+
+def slot_limit(pool, semaphore, workers: int) -> Callable[[], int]:
+    """Current concurrency limit of *semaphore*, for ``RunStatus``."""
+    if isinstance(semaphore, AdaptiveConcurrency):
+        return lambda: semaphore.limit
+    if isinstance(pool, ClusterPool):
+        return lambda: pool.slots
+    return lambda: workers
+
+
+def default_workers() -> int:
+    """Default ``--workers``: room for the adaptive limit to grow past the CPUs."""
+    return max(2, 2 * cpu_count())
+
+
+def print_concurrency(semaphore) -> None:
+    if isinstance(semaphore, AdaptiveConcurrency):
+        semaphore.close()
+        print(f"  Concurrency: {semaphore.summary()}")
+
+
+def batch_jobs(jobs: list[dict], batch_size: int) -> list[dict]:
+    """Group jobs with identical agents into batches of up to *batch_size*.
+
+    A batch is one job with a ``repeat`` count; it runs back to back on one
+    worker (or one runner CLI invocation), so agent loading and runner
+    startup are paid once per batch. Batches keep the order in which each
+    agent group first appears. Seeded jobs only share a batch with jobs of
+    the same seed; the jobs' ``cache_key``s become the batch's ``cache_keys``.
+    """
+    groups: dict[tuple, list[dict]] = {}
+    for job in jobs:
+        key = (
+            tuple(job["agents"]),
+            job.get("num_of_games"),
+            job.get("write_scoreboard"),
+            job.get("shards", 1),
+            job.get("seed"),
+        )
+        groups.setdefault(key, []).append(job)
+
+    batches = []
+    for group in groups.values():
+        for start in range(0, len(group), max(batch_size, 1)):
+            chunk = group[start : start + max(batch_size, 1)]
+            batch = dict(chunk[0])
+            batch["repeat"] = len(chunk)
+            if "cache_key" in batch:
+                batch["cache_keys"] = [j["cache_key"] for j in chunk]
+                del batch["cache_key"]
+            if len(chunk) > 1:
+                batch["label"] = f"{chunk[0]['label']} (x{len(chunk)})"
+            batches.append(batch)
+    return batches
+
+
+def apply_cache(
+    game_id: str,
+    jobs: list[dict],
+    cache_mode: str = "off",
+    seed: int | None = None,
+    dry_run: bool = False,
+) -> tuple[list[dict], list[dict]]:
+    """Key *jobs* for the match cache and take out the ones it already answers.
+
+    Every job gets a ``cache_key`` (and, with a base *seed*, its own
+    ``seed`` if the runner takes one). With *cache_mode* ``any`` cached
+    outcomes are reused whatever the seed policy, with ``seeded`` only for
+    seeded runs. The scoreboard rows of reused outcomes are written again
+    here (not in a dry run), exactly as the runner wrote them. Returns the
+    jobs still to run and the cached results (``cached`` = True).
+
+    With *cache_mode* ``off`` no job is keyed (no agent file is hashed and
+    nothing is stored); only the seeds are set, and without a *seed* the
+    runner is not even loaded.
+    """
+    game = GAME_REGISTRY[game_id]
+    match_script = SCRIPT_DIR / game["script"]
+    if cache_mode == "off" and seed is None:
+        return jobs, []
+    module = load_runner(match_script)
+    seeded = seed is not None and takes_seed(module)
+    cache = MatchCache(game["name"], match_script) if cache_mode != "off" else None
+    policy = seed_policy(seed if seeded else None)
+    reuse = cache_mode == "any" or (cache_mode == "seeded" and seeded)
+
+    occurrences: Counter = Counter()
+    pending, cached = [], []
+    for job in jobs:
+        games = fixture_games(job)
+        k = occurrences[tuple(job["agents"]), games]
+        occurrences[tuple(job["agents"]), games] += 1
+        if seeded:
+            job["seed"] = fixture_seed(seed, job["agents"], k)
+        if cache is None:
+            pending.append(job)
+            continue
+        job["cache_key"] = cache.key(job["agents"], games, policy, k)
+        res = cache.get(job["cache_key"]) if reuse else None
+        if res is None:
+            pending.append(job)
+            continue
+        res.update(label=job["label"], error=None, killed=None)
+        if job.get("write_scoreboard") and not dry_run:
+            record_scoreboard(module, res)
+        cached.append(res)
+    return pending, cached
+
+
+def _runner_cmd(match_script: Path, job: dict) -> list[str]:
+    """Runner CLI invocation equivalent to *job* (subprocess backend).
+
+    A 2-player batch repeats each agent's run ID (``model:1:1:1``), which the
+    runners play as that many matches; ``--parallel 1`` keeps them back to
+    back so the batch uses a single worker slot.
+    """
+    repeat = job.get("repeat", 1)
+    cmd = [sys.executable, str(match_script), "--agent"]
+    if repeat > 1:
+        cmd.extend(f"{f}" + f":{r}" * repeat for f, r in job["agents"])
+        cmd.extend(["--parallel", "1"])
+    else:
+        cmd.extend(f"{f}:{r}" for f, r in job["agents"])
+    if job.get("shards", 1) > 1:
+        cmd.extend(["--shards", str(job["shards"])])
+    if job.get("seed") is not None:
+        cmd.extend(["--seed", str(job["seed"])])
+    if job.get("write_scoreboard"):
+        cmd.append("--update-scoreboard")
+    return cmd
+
+
+_MINI_RE = re.compile(r"^MINI:.+?=(\d+),(-?[\d.]+)\|.+?=(\d+),(-?[\d.]+)$")
+_TAGGED_RE = re.compile(r"^(RESULT|SCORE):((?:Agent-\d+=-?[\d.]+,?)+)$")
+_KILLED_RE = re.compile(r"^KILLED:(deadline|stall)$")
+_STOP_RE = re.compile(r"^SPRT_STOP: (\d+) of (\d+) games$")
+
+
+class RunnerOutput:
+    """Incremental parser for a runner CLI's stdout, fed one line at a time.
+
+    2-player runners print one ``MINI:{a}={pts},{score}|{b}={pts},{score}``
+    line per match; the 6-player runner prints ``RESULT:`` and ``SCORE:``
+    lines keyed by ``Agent-<seat>`` (one match per invocation). Matches the
+    runner reports as killed (``KILLED:<reason>`` lines, see
+    ``match_api.report_kill``) are collected in ``killed``; a ``SPRT_STOP``
+    line after a ``MINI:`` line (``match_api.report_stop``) records the games
+    that match really played as ``games_actual``. Only the parsed
+    results and the last ``tail_lines`` lines (for error messages) are
+    kept; every line is also written to *sink* when one is given.
+    """
+
+    def __init__(self, num_agents: int, sink=None, tail_lines: int = 20) -> None:
+        self.num_agents = num_agents
+        self.sink = sink
+        self.results: list[dict] = []
+        self.killed: list[str] = []
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self._tagged: dict[str, list[float]] = {}
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip("\n")
+        self.tail.append(line)
+        if self.sink is not None:
+            self.sink.write(line + "\n")
+
+        m = _KILLED_RE.match(line)
+        if m:
+            self.killed.append(m.group(1))
+            return
+
+        m = _STOP_RE.match(line)
+        if m and self.results:
+            self.results[-1]["games_actual"] = int(m.group(1))
+            self.results[-1]["games_played"] = int(m.group(2))
+            return
+
+        if self.num_agents == 2:
+            m = _MINI_RE.match(line)
+            if m:
+                self.results.append({
+                    "points": [int(m.group(1)), int(m.group(3))],
+                    "scores": [float(m.group(2)), float(m.group(4))],
+                })
+            return
+
+        m = _TAGGED_RE.match(line)
+        if not m or self.results:
+            return
+        key = "points" if m.group(1) == "RESULT" else "scores"
+        if key in self._tagged:
+            return
+        values = dict(part.split("=") for part in m.group(2).split(","))
+        self._tagged[key] = [
+            float(values.get(f"Agent-{i}", 0)) for i in range(1, self.num_agents + 1)
+        ]
+        if len(self._tagged) == 2:
+            self.results.append(dict(self._tagged))
+
+    def tail_text(self) -> str:
+        return "\n".join(self.tail)
+
+
+async def _stream_lines(stream: asyncio.StreamReader, handle) -> None:
+    """Call *handle* for every line of *stream* until EOF.
+
+    Lines longer than the stream limit are skipped rather than buffered.
+    """
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            continue
+        if not line:
+            return
+        handle(line.decode(errors="replace"))
+
+
+def _base_games() -> int:
+    """NUM_OF_GAMES_IN_A_MATCH as the runners will read it."""
+    try:
+        return int(os.getenv("NUM_OF_GAMES_IN_A_MATCH", "100"))
+    except ValueError:
+        return 100
+
+
+def fixture_games(job: dict) -> int:
+    """NUM_OF_GAMES_IN_A_MATCH value one fixture of *job* runs with."""
+    return job.get("num_of_games") or _base_games()
+
+
+def fixture_deadline(job: dict) -> float:
+    """Seconds a fixture batch may run before the matchmaker kills it.
+
+    ``MATCH_TIME_LIMIT`` covers one match of ``NUM_OF_GAMES_IN_A_MATCH``
+    games. Jobs that play more games (A3 qualifiers) get proportionally
+    more, and a batch gets one budget per fixture.
+    """
+    try:
+        limit = float(os.getenv("MATCH_TIME_LIMIT", "900"))
+    except ValueError:
+        limit = 900.0
+    base_games = _base_games()
+    scale = 1.0
+    if job.get("num_of_games") and base_games > 0:
+        scale = max(1.0, job["num_of_games"] / base_games)
+    return limit * scale * job.get("repeat", 1) + DEADLINE_GRACE
+
+
+def order_longest_first(
+    jobs: list[dict], durations: FixtureDurations
+) -> tuple[list[dict], int]:
+    """Sort jobs by expected wall time, longest first (LPT scheduling).
+
+    Starting the long fixtures first lets the short ones fill in around
+    them instead of one straggler running alone at the end. Ties, and
+    everything when there is no history yet, keep their (shuffled) order.
+    Returns the ordered jobs and how many of them have recorded durations.
+    """
+    estimates = [
+        durations.estimate(job["agents"], fixture_games(job)) for job in jobs
+    ]
+    known = sum(1 for job in jobs if durations.known(job["agents"]))
+    if all(e is None for e in estimates):
+        return list(jobs), 0
+    order = sorted(
+        range(len(jobs)),
+        key=lambda i: -(estimates[i] or 0.0) * jobs[i].get("repeat", 1),
+    )
+    return [jobs[i] for i in order], known
+
+
+def order_by_coverage(jobs: list[dict], covered: Counter | None = None) -> list[list[dict]]:
+    """Split jobs into coverage levels, in the order they should run.
+
+    A job's level is the most meetings any of its agent pairs has had
+    before it (recorded ones in *covered* included), so every pairing's
+    k-th meeting comes before any pairing's (k+1)-th. A tournament cut
+    short after any level has covered all pairings equally often. Jobs
+    keep their order within a level.
+    """
+    seen: Counter = Counter(covered or {})
+    levels: dict[int, list[dict]] = {}
+    for job in jobs:
+        pairs = [tuple(sorted(p)) for p in itertools.combinations(map(tuple, job["agents"]), 2)]
+        level = max(seen[p] for p in pairs)
+        for p in pairs:
+            seen[p] += 1
+        levels.setdefault(level, []).append(job)
+    return [levels[k] for k in sorted(levels)]
+
+
+def print_order(order: str, known: int, total: int, durations: FixtureDurations) -> None:
+    if order == "random":
+        print("Order: random")
+    elif durations.global_mean is None:
+        print("Order: random (no recorded durations yet)")
+    else:
+        print(
+            f"Order: longest first ({known}/{total} with recorded durations, "
+            "others estimated from their agents)"
+        )
+
+
+def estimate_slots(opts: RunOptions) -> int:
+    """Batches a dry-run estimate runs at once.
+
+    Adaptive concurrency starts at ``AdaptiveConcurrency``'s initial limit
+    (an explicit ``--workers``, else the CPU count), not at ``--workers``.
+    """
+    if opts.concurrency == "adaptive" and opts.backend != "cluster":
+        return start_limit(opts.workers, opts.concurrency_start)
+    return opts.workers
+
+
+def print_run_estimate(batches: Iterable[dict], durations: FixtureDurations, workers: int) -> None:
+    """Dry-run wall time, CPU-hours and straggler of *batches* (see ``run_estimate``).
+
+    *workers* is ``estimate_slots(opts)``.
+    """
+    estimate = run_estimate(batches, fixture_games, durations, workers)
+    if estimate is None:
+        print("Estimate: no recorded durations yet (--calibrate measures the agents first)")
+        return
+    print(
+        f"Estimate: ~{format_duration(estimate['wall'])} wall on {workers} workers, "
+        f"{estimate['cpu_hours']:.1f} CPU-hours ({estimate['known']} of {estimate['batches']} "
+        "batches from their own history, others from their agents)"
+    )
+    straggler = estimate["straggler"]
+    if straggler["label"] is not None:
+        print(
+            f"Straggler: {straggler['label']} (~{format_duration(straggler['seconds'])}, "
+            f"starting at ~{format_duration(straggler['start'])}, finishes last)"
+        )
+
+
+async def calibrate_durations(
+    game_id: str, agents: dict[str, list[int]], opts: RunOptions
+) -> None:
+    """Record durations for the agents that have none (``--calibrate``).
+
+    Plays one unscored fixture of ``CALIBRATION_GAMES`` games per group
+    from ``calibration_groups``, so a dry run's estimate rests on
+    measurements of every agent instead of the overall mean.
+    """
+    game = GAME_REGISTRY[game_id]
+    match_script = SCRIPT_DIR / game["script"]
+    durations = FixtureDurations(game["name"])
+    groups = calibration_groups(agents, game["players"], durations)
+    if not groups:
+        print("Calibration: every agent has recorded durations")
+        return
+    print(f"Calibration: {len(groups)} fixtures of {CALIBRATION_GAMES} games "
+          "for the agents without recorded durations")
+    jobs = [
+        {
+            "agents": group,
+            "label": " vs ".join(f"{f}:{r}" for f, r in group),
+            "num_of_games": CALIBRATION_GAMES,
+            "write_scoreboard": False,
+            "shards": 1,
+        }
+        for group in groups
+    ]
+    pool = make_pool([(match_script, game["name"], agents)], opts)
+    if isinstance(pool, MatchWorkerPool):
+        pool.warm()  # keep worker start-up out of the measurements
+    semaphore = fixture_slots(pool, opts.workers, "fixed")
+    start_time = time.time()
+
+    def start(job: dict, idx: int):
+        return run_fixture_job(
+            job, idx, len(jobs), semaphore, start_time, match_script,
+            pool=pool, durations=durations,
+        )
+
+    try:
+        results = await run_bounded(jobs, start, lambda: dispatch_window(pool, opts.workers))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        durations.save()
+    failed = sum(1 for res in results if not res["success"])
+    print(f"Calibration: done in {format_duration(time.time() - start_time)}"
+          + (f", {failed} fixtures failed (not measured)" if failed else ""))
+
+
+def print_stopped(results: list[dict]) -> None:
+    """Summary line for matches SPRT stopped before their full game count."""
+    stopped = [
+        r for r in results
+        if r.get("success") and r.get("games_actual", 0) < r.get("games_played", 0)
+    ]
+    if stopped:
+        played = sum(r["games_actual"] for r in stopped)
+        planned = sum(r["games_played"] for r in stopped)
+        print(f"  Stopped early (SPRT): {len(stopped)} fixtures, {played} of {planned} games played")
+
+
+def print_killed(results: list[dict]) -> None:
+    """Summary line for fixtures killed by a deadline or the stall watchdog."""
+    reasons = Counter(r["killed"] for r in results if r.get("killed"))
+    if reasons:
+        detail = ", ".join(f"{reason}: {n}" for reason, n in sorted(reasons.items()))
+        print(f"  Killed: {sum(reasons.values())} ({detail})")
+
+
+async def run_fixture_job(
+    job: dict,
     match_idx: int,
     total: int,
-    label: str,
     semaphore: asyncio.Semaphore,
     start_time: float,
-    env_vars: dict[str, str] | None = None,
-) -> dict:
-    """Run a single match runner subprocess with concurrency control."""
-    import os
-    env = os.environ.copy()
-    if env_vars:
-        env.update(env_vars)
+    match_script: Path,
+    pool: MatchWorkerPool | None = None,
+    runner_log_dir: Path | None = None,
+    durations: FixtureDurations | None = None,
+    journal: FixtureJournal | None = None,
+    phase: str = "main",
+    pinning: CpuPinning | None = None,
+    tag: str = "",
+    cache: MatchCache | None = None,
+    budget: TimeBudget | None = None,
+    status: RunStatus | None = None,
+) -> list[dict]:
+    """Run one batch of fixtures with concurrency control.
+
+    *job* holds ``agents`` [(folder, run), ...], ``label``, ``num_of_games``
+    (NUM_OF_GAMES_IN_A_MATCH override or None), ``write_scoreboard``,
+    ``repeat`` (fixtures in the batch, default 1) and ``shards`` (processes
+    each match's games are split across, default 1). With a *pool* the
+    runner's ``run_fixture()`` is called in a warm worker; otherwise the
+    runner CLI is spawned as a cold subprocess whose output is parsed line
+    by line and then written to ``runner_log_dir/<match_idx>.log`` or
+    dropped. Only parsed results are kept, so memory does not grow with
+    the number of fixtures.
+
+    The batch is killed after ``fixture_deadline(job)`` seconds (for a
+    subprocess, its whole process group). Failed fixtures whose match was
+    killed, here or inside the runner, carry ``killed`` = ``"deadline"`` or
+    ``"stall"``. With *durations*, the wall time of every successful
+    fixture (the batch's time split evenly) is recorded there. With a
+    *journal*, the batch's start is journaled under *phase* and each
+    fixture's result is appended by whichever process wrote its scoreboard
+    rows (the pool worker, or the runner CLI via ``MATCH_JOURNAL``). With
+    *pinning*, the runner subprocess runs on a free core set of it. A *tag*
+    (the game ID in a multi-game league) prefixes the printed labels. With a
+    *cache*, each successful fixture result is stored under the job's
+    ``cache_keys`` (pool and cluster backends; the runner CLI's output
+    carries too little of the result to replay its scoreboard rows). With a
+    *budget*, a batch whose expected wall time no longer fits is not run
+    (nor journaled as started); its fixtures come back with ``unplayed``.
+    With a *status*, the batch's start and results are counted there and
+    the progress line shows the share of fixtures already ended.
+
+    Returns one dict per fixture with keys: success, label, error, agents,
+    points, scores (points/scores aligned with agents, present on success).
+    """
+    label = job["label"]
+    shown = f"{tag} {label}" if tag else label
+    repeat = job.get("repeat", 1)
+    agent_keys = [f"{f}:{r}" for f, r in job["agents"]]
+
+    deadline = fixture_deadline(job)
+
+    def failed(error: str, killed: str | None = None) -> list[dict]:
+        return [
+            {
+                "success": False,
+                "label": label,
+                "error": error,
+                "agents": agent_keys,
+                "killed": killed,
+            }
+            for _ in range(repeat)
+        ]
+
+    def timed_out() -> list[dict]:
+        return failed(f"killed: deadline (still running after {deadline:g} seconds)", "deadline")
+
+    def finished(results: list[dict]) -> list[dict]:
+        if isinstance(semaphore, AdaptiveConcurrency):
+            semaphore.observe(results)
+        if durations is not None:
+            # Worker backends time each fixture from when a worker took it;
+            # a runner subprocess is timed from its start. A match SPRT
+            # stopped counts the share of its games it really played.
+            per_fixture = (time.monotonic() - job_start) / repeat
+            for res in results:
+                if res.get("success"):
+                    played = res.get("games_actual", 1) / res.get("games_played", 1)
+                    durations.record(
+                        job["agents"],
+                        fixture_games(job) * played,
+                        res.get("seconds", per_fixture),
+                        job.get("shards", 1),
+                    )
+        keys = job.get("cache_keys") or [job.get("cache_key")]
+        if cache is not None and pool is not None:
+            for key, res in zip(keys, results):
+                if key and res.get("success") and "games_played" in res:
+                    cache.put(key, res)
+        return results
+
+    def ended(results: list[dict]) -> list[dict]:
+        if status is not None:
+            status.finish(game_id, results, time.monotonic() - job_start)
+        return results
+
+    game_id = next(
+        (gid for gid, game in GAME_REGISTRY.items() if game["script"] == match_script.name),
+        match_script.stem,
+    )
+    journal_entry = None
+    if journal is not None:
+        journal_entry = {"phase": phase, "batch": job["batch"], "label": label}
 
+    slot = None
     async with semaphore:
+        if budget is not None and not budget.fits(job, fixture_games(job)):
+            print(f"SKIPPED (time budget): {shown}", flush=True)
+            if status is not None:
+                status.skip(repeat)
+            return [
+                {"success": False, "label": label, "error": "time budget", "agents": agent_keys,
+                 "unplayed": True}
+                for _ in range(repeat)
+            ]
+        job_start = time.monotonic()
+        if journal is not None:
+            journal.start(phase, job["batch"])
         elapsed = time.time() - start_time
         elapsed_str = time.strftime("%H:%M:%S", time.gmtime(elapsed))
-        pct = (match_idx / total) * 100
+        if status is not None:
+            status.start(repeat)
+            progress = f"{status.done_pct():5.1f}% done"
+        else:
+            progress = f"{match_idx / total * 100:5.1f}%"
         print(
-            f"[{match_idx:>5}/{total}] {pct:5.1f}% | {elapsed_str} elapsed | {label}",
+            f"[{match_idx:>5}/{total}] {progress} | {elapsed_str} elapsed | {shown}",
             flush=True,
         )
 
         try:
+            if pool is not None:
+                try:
+                    # The deadline starts when a worker takes the batch.
+                    results = await pool.run_fixtures(
+                        match_script, job["agents"],
+                        job.get("num_of_games"), job.get("write_scoreboard", False),
+                        repeat, job.get("shards", 1),
+                        (str(journal.path), journal_entry) if journal else None,
+                        job.get("seed"), deadline,
+                    )
+                except asyncio.TimeoutError:
+                    # The pool has recycled the worker; its slot is free again.
+                    print(f"FAILED (killed: deadline): {shown}", flush=True)
+                    return ended(finished(timed_out()))
+                success = all(r.get("success") for r in results)
+                print(f"{'FINISHED' if success else 'FAILED'}: {shown}", flush=True)
+                for res in results:
+                    res["label"] = label
+                    res["error"] = str(res.get("error"))[:300] if not res.get("success") else None
+                    res.setdefault("killed", None)
+                return ended(finished(results))
+
+            env = os.environ.copy()
+            if job.get("num_of_games") is not None:
+                env["NUM_OF_GAMES_IN_A_MATCH"] = str(job["num_of_games"])
+            if journal is not None:
+                env["MATCH_JOURNAL"] = str(journal.path)
+                env["MATCH_JOURNAL_ENTRY"] = json.dumps(journal_entry)
+
+            preexec_fn = None
+            if pinning is not None:
+                slot = pinning.acquire()
+                env["MATCH_CPU_PINNING"] = "1"
+                preexec_fn = functools.partial(pinning.apply, slot)
+
             proc = await asyncio.create_subprocess_exec(
-                *cmd,
+                *_runner_cmd(match_script, job),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
+                start_new_session=True,
+                preexec_fn=preexec_fn,
             )
+            sink = None
+            if runner_log_dir is not None:
+                runner_log_dir.mkdir(parents=True, exist_ok=True)
+                sink = open(runner_log_dir / f"{match_idx:05d}.log", "w")
+                sink.write(f"# {label}\n")
+            output = RunnerOutput(len(agent_keys), sink)
+            stderr_tail: deque[str] = deque(maxlen=20)
             try:
-                stdout, stderr = await proc.communicate()
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        _stream_lines(proc.stdout, output.feed),
+                        _stream_lines(proc.stderr, stderr_tail.append),
+                        proc.wait(),
+                    ),
+                    timeout=deadline,
+                )
             except asyncio.TimeoutError:
-                proc.kill()
-                await proc.communicate()
-                print(f"FAILED (timeout): {label}", flush=True)
-                return {"success": False, "label": label, "error": "timeout", "stdout": ""}
-
-            success = proc.returncode == 0
-            if success:
-                print(f"FINISHED: {label}", flush=True)
-            else:
-                print(f"FAILED: {label}", flush=True)
-
-            return {
-                "success": success,
-                "label": label,
-                "error": stderr.decode(errors="replace")[:300] if not success else None,
-                "stdout": stdout.decode(errors="replace"),
-            }
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+                print(f"FAILED (killed: deadline): {shown}", flush=True)
+                return ended(finished(timed_out()))
+            except asyncio.CancelledError:
+                # Interrupted tournament: stop the runner so it writes no
+                # scoreboard rows the journal would not know about.
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                raise
+            finally:
+                if sink is not None:
+                    sink.close()
+
+            if proc.returncode != 0:
+                print(f"FAILED: {shown}", flush=True)
+                return ended(failed("".join(stderr_tail)[-300:]))
+
+            results = [
+                {"success": True, "label": label, "error": None, "agents": agent_keys, **p}
+                for p in output.results[:repeat]
+            ]
+            missing = repeat - len(results)
+            if missing:
+                results += failed("Could not parse results:\n" + output.tail_text()[-300:])[:missing]
+                # Matches the runner reported as killed (printed as FAILED lines).
+                for res, reason in zip(results[-missing:], output.killed):
+                    res["killed"] = reason
+                    res["error"] = f"killed: {reason}"
+            print(f"{'FAILED' if missing else 'FINISHED'}: {shown}", flush=True)
+            return ended(finished(results))
         except Exception as e:
-            print(f"ERROR: {label} - {e}", flush=True)
-            return {"success": False, "label": label, "error": str(e)[:300], "stdout": ""}
+            print(f"ERROR: {shown} - {e}", flush=True)
+            return ended(failed(str(e)[:300]))
+        finally:
+            if slot is not None:
+                pinning.release(slot)
 
 
 # ---------------------------------------------------------------------------
@@ -432,36 +1166,18 @@ def verify_agent_syntax(game_name: str, agents: dict[str, list[int]]) -> bool:
 
 
 def _print_mini_league_standings(results: list[dict]) -> None:
-    """Parse MINI: lines from match runner stdout and display standings.
-
-    Each match runner emits per-match lines in the format:
-      MINI:{agent1}={pts1},{score1}|{agent2}={pts2},{score2}
-    """
+    """Aggregate per-agent points/scores from fixture results and display standings."""
     standings: dict[str, dict] = {}
-    pat = re.compile(
-        r"^MINI:(.+?)=(\d+),(-?[\d.]+)\|(.+?)=(\d+),(-?[\d.]+)$"
-    )
 
     for r in results:
         if not r.get("success"):
             continue
-        stdout = r.get("stdout", "")
-        for line in stdout.splitlines():
-            m = pat.match(line.strip())
-            if not m:
-                continue
-            agent1, pts1, score1 = m.group(1), int(m.group(2)), float(m.group(3))
-            agent2, pts2, score2 = m.group(4), int(m.group(5)), float(m.group(6))
-
-            for agent, pts, score in [
-                (agent1, pts1, score1),
-                (agent2, pts2, score2),
-            ]:
-                if agent not in standings:
-                    standings[agent] = {"points": 0, "score": 0.0, "matches": 0}
-                standings[agent]["points"] += pts
-                standings[agent]["score"] += score
-                standings[agent]["matches"] += 1
+        for agent, pts, score in zip(r["agents"], r["points"], r["scores"]):
+            if agent not in standings:
+                standings[agent] = {"points": 0, "score": 0.0, "matches": 0}
+            standings[agent]["points"] += pts
+            standings[agent]["score"] += score
+            standings[agent]["matches"] += 1
 
     if not standings:
         return
@@ -496,18 +1212,57 @@ def _print_mini_league_standings(results: list[dict]) -> None:
 
 async def run_tournament(
     game_id: str,
+    opts: RunOptions,
     same_opponent_match: int,
-    workers: int,
-    dry_run: bool,
     new_models: list[str] | None = None,
-    health_check: bool = False,
     random16: bool = False,
     mini_agents: dict[str, list[int]] | None = None,
+    stream: bool = False,
+    calibrate: bool = False,
 ) -> None:
+    if calibrate:
+        game_name = GAME_REGISTRY[game_id]["name"]
+        await calibrate_durations(game_id, mini_agents or discover_agents(game_name), opts)
+    plan = plan_tournament(
+        game_id, opts, same_opponent_match, new_models, random16, mini_agents, stream
+    )
+    if plan is None:
+        return
+    await run_batches(
+        game_id, plan["batches"], plan["cached"], plan["agents"], plan["journal"],
+        plan["durations"], opts, mini=plan["mini"], total=plan.get("total"),
+        fixtures=plan.get("fixtures"),
+    )
+
+
+def plan_tournament(
+    game_id: str,
+    opts: RunOptions,
+    same_opponent_match: int,
+    new_models: list[str] | None = None,
+    random16: bool = False,
+    mini_agents: dict[str, list[int]] | None = None,
+    stream: bool = False,
+) -> dict | None:
+    """Generate, batch, order and journal the fixtures of a 2-player or
+    single-phase tournament, printing its header.
+
+    With ``opts.incremental``, the fixtures already on the scoreboard (see
+    ``recorded_fixtures``) count towards the target coverage and only the
+    deficit is generated. With ``opts.time_budget`` (seconds), batches are
+    ordered by coverage level (``order_by_coverage``) and the header
+    estimates how many fit. Fixtures the match cache answers (see ``apply_cache``) are not
+    scheduled. Returns None for a dry run, otherwise a plan dict with
+    ``batches``, ``cached`` (reused results), ``agents``, ``journal``,
+    ``durations`` and ``mini``. Exits on invalid agents or options. With
+    *stream*, the batches come from a lazy ``FixtureStream`` instead (see
+    ``plan_stream``).
+    """
     game = GAME_REGISTRY[game_id]
     game_name = game["name"]
     players = game["players"]
     match_script = SCRIPT_DIR / game["script"]
+    workers, shards, time_budget = opts.workers, opts.shards or 1, opts.time_budget
 
     if not match_script.exists():
         print(f"ERROR: Match script not found: {match_script}")
@@ -521,7 +1276,7 @@ async def run_tournament(
             print(f"ERROR: No agents found for {game_name} in {AGENTS_DIR}")
             sys.exit(1)
 
-    if health_check:
+    if opts.health_check:
         if not verify_agent_syntax(game_name, agents):
             sys.exit(1)
 
@@ -552,14 +1307,24 @@ async def run_tournament(
         mode_label = " [mini league]"
     elif new_models:
         mode_label = f" [incremental: {', '.join(new_models)}]"
+    elif opts.incremental:
+        mode_label = " [incremental: recorded results]"
     else:
         mode_label = ""
 
+    if stream:
+        return plan_stream(game_id, agents, same_opponent_match, new_models, mode_label, opts)
+
+    covered = None
+    if opts.incremental and mini_agents is None:
+        recorded = recorded_fixtures(game_name)
+        covered = pair_coverage(recorded)
+
     if players == 2:
         if mini_agents is not None:
             fixtures_2p = generate_mini_fixtures(agents, same_opponent_match)
         else:
-            fixtures_2p = generate_2p_fixtures(agents, same_opponent_match, new_models)
+            fixtures_2p = generate_2p_fixtures(agents, same_opponent_match, new_models, covered)
         if random16 and len(fixtures_2p) > 16:
             fixtures_2p = random.sample(fixtures_2p, 16)
         total_matches = len(fixtures_2p)
@@ -582,77 +1347,430 @@ async def run_tournament(
         unique_pairs = len(all_pairs)
         print(f"\nMATCHMAKER - {game_name}{mode_label}")
         print(f"Agents: {total_agents} ({num_models} models)")
-        print(
-            f"Fixture: {total_matches} matches "
-            f"({unique_pairs} pairings x {same_opponent_match} same_opponent_match)"
-        )
+        coverage_str = f"{unique_pairs} pairings x {same_opponent_match} same_opponent_match"
+        if covered is not None:
+            met = sum(min(covered[tuple(sorted(p))], same_opponent_match) for p in all_pairs)
+            coverage_str = f"deficit of {coverage_str}; {met} already recorded"
+        print(f"Fixture: {total_matches} matches ({coverage_str})")
         print(f"Workers: {workers}")
     else:
-        fixtures_6p = generate_6p_fixtures(agents, same_opponent_match, new_models)
+        fixtures_6p = generate_6p_fixtures(agents, same_opponent_match, new_models, covered)
         if random16 and len(fixtures_6p) > 16:
             fixtures_6p = random.sample(fixtures_6p, 16)
         total_matches = len(fixtures_6p)
         print(f"\nMATCHMAKER - {game_name}{mode_label}")
         print(f"Agents: {total_agents} ({num_models} models)")
         print(f"Fixture: {total_matches} matches (6-player groups, greedy coverage)")
+        if covered is not None:
+            print(f"Recorded: {sum(recorded.values())} matches already played")
         print(f"Workers: {workers}")
+    print(f"Backend: {opts.backend}")
+
+    # Build fixture jobs
+    fixtures = fixtures_2p if players == 2 else fixtures_6p
+    jobs = [
+        {
+            "agents": list(group),
+            "label": " vs ".join(f"{f}:{r}" for f, r in group),
+            "num_of_games": None,
+            "write_scoreboard": mini_agents is None,
+            "shards": shards,
+        }
+        for group in fixtures
+    ]
+    jobs, cached = apply_cache(game_id, jobs, opts.cache_mode, opts.seed, opts.dry_run)
+    if opts.seed is not None:
+        seeded = takes_seed(load_runner(match_script))
+        print(f"Seed: {opts.seed}"
+              + ("" if seeded else f" (ignored: {game_id} games are unseeded)"))
+    if opts.cache_mode != "off":
+        print(f"Cache: {len(cached)} of {total_matches} matches reused ({opts.cache_mode})")
+
+    batch_size = opts.batch_size
+    if batch_size is None:
+        # Enough batches to keep every worker busy several times over.
+        batch_size = max(1, total_matches // (workers * 4))
+    if opts.backend == "subprocess" and players != 2:
+        batch_size = 1  # the 6-player runner CLI plays one match per invocation
+    # With a time budget, batches never span coverage levels.
+    levels = order_by_coverage(jobs, covered) if time_budget is not None else [jobs]
+    level_batches = [batch_jobs(level, batch_size) for level in levels]
+    batches = [batch for level in level_batches for batch in level]
+    print(f"Batches: {len(batches)} (up to {batch_size} fixtures each)")
+    if shards > 1:
+        print(f"Shards: {shards} processes per match")
+    durations = FixtureDurations(game_name)
+    known = 0
+    if opts.order == "longest-first":
+        ordered = [order_longest_first(level, durations) for level in level_batches]
+        batches = [batch for level, _ in ordered for batch in level]
+        known = sum(n for _, n in ordered)
+    print_order(opts.order, known, len(batches), durations)
+    if time_budget is not None:
+        print(f"Coverage levels: {len(levels)} (every pairing's k-th meeting runs before any (k+1)-th)")
+        fit = budget_fit(
+            batches, [fixture_games(b) for b in batches], durations, time_budget,
+            estimate_slots(opts),
+        )
+        budget_str = f"Time budget: {format_duration(time_budget)}"
+        if fit is None:
+            print(f"{budget_str} (no recorded durations; batches start while time remains)")
+        else:
+            fitted, work = fit
+            print(
+                f"{budget_str} | estimated work {format_duration(work)} on {estimate_slots(opts)} workers"
+                f" | ~{fitted} of {len(jobs)} matches fit"
+            )
 
-    if dry_run:
+    if opts.dry_run:
         print("\n--- DRY RUN (no matches executed) ---")
         print(f"Total Matches: {total_matches}")
-        return
+        if cached:
+            print(f"To run: {len(jobs)} (the rest are cached)")
+        print_run_estimate(batches, durations, estimate_slots(opts))
+        return None
+
+    journal = FixtureJournal.create(game_name)
+    for i, job in enumerate(batches):
+        job["batch"] = i
+    journal.write_jobs("main", game_id, batches)
+    journal.record_cached("main", cached)
+    print(f"Journal: {journal.path}")
+    return {
+        "match_script": match_script,
+        "batches": batches,
+        "cached": cached,
+        "agents": agents,
+        "journal": journal,
+        "durations": durations,
+        "mini": mini_agents is not None,
+    }
+
+
+def plan_stream(
+    game_id: str,
+    agents: dict[str, list[int]],
+    same_opponent_match: int,
+    new_models: list[str] | None,
+    mode_label: str,
+    opts: RunOptions,
+) -> dict | None:
+    """``plan_tournament`` for ``--stream``: a 2-player round robin whose
+    batches a ``FixtureStream`` yields lazily, in seeded pseudo-random order.
+
+    Counts are computed from the model sizes and the journal records the
+    stream's parameters, so planning time and memory do not grow with the
+    number of fixtures. The plan's ``batches`` is an iterator; ``total``
+    is its length.
+    """
+    game = GAME_REGISTRY[game_id]
+    game_name = game["name"]
+    workers, shards, batch_size = opts.workers, opts.shards or 1, opts.batch_size
+    pairs = count_pairs(agents, new_models)
+    if batch_size is None:
+        batch_size = max(1, pairs * same_opponent_match // (workers * 4))
+    stream = FixtureStream(agents, same_opponent_match, batch_size, new_models, shards=shards)
+
+    print(f"\nMATCHMAKER - {game_name}{mode_label} [stream]")
+    print(f"Agents: {sum(len(runs) for runs in agents.values())} ({len(agents)} models)")
+    print(f"Fixture: {stream.fixtures()} matches ({pairs} pairings x {same_opponent_match} "
+          "same_opponent_match)")
+    print(f"Workers: {workers}")
+    print(f"Backend: {opts.backend}")
+    print(f"Batches: {stream.batches()} (up to {stream.batch_size} fixtures each)")
+    if shards > 1:
+        print(f"Shards: {shards} processes per match")
+    print(f"Order: pseudo-random stream (seed {stream.seed}), generated as workers free up")
+
+    if opts.dry_run:
+        print("\n--- DRY RUN (no matches executed) ---")
+        print(f"Total Matches: {stream.fixtures()}")
+        print_run_estimate(stream, FixtureDurations(game_name), estimate_slots(opts))
+        return None
+
+    journal = FixtureJournal.create(game_name)
+    journal.write_stream("main", game_id, stream.spec())
+    print(f"Journal: {journal.path}")
+    return {
+        "match_script": SCRIPT_DIR / game["script"],
+        "batches": iter(stream),
+        "total": stream.batches(),
+        "fixtures": stream.fixtures(),
+        "cached": [],
+        "agents": agents,
+        "journal": journal,
+        "durations": FixtureDurations(game_name),
+        "mini": False,
+    }
+
+
+async def resume_tournament(game_id: str, journal_path: Path, opts: RunOptions) -> None:
+    """Continue a tournament from its fixture journal.
+
+    The fixtures come from the journal, not from the current agents or
+    options; fixtures journaled as successful are skipped (their scoreboard
+    rows are already written), and failed or never-finished ones run again.
+    A journaled fixture stream is rebuilt and filtered as it is consumed.
+    """
+    game = GAME_REGISTRY[game_id]
+    game_name = game["name"]
+    if not journal_path.exists():
+        print(f"ERROR: Journal not found: {journal_path}")
+        sys.exit(1)
+    journal = FixtureJournal(journal_path)
+    streamed = journal.stream("main")
+    recorded = journal.jobs("main") if streamed is None else streamed
+    if recorded is None:
+        print(f"ERROR: {journal_path} has no fixture list for --game {game_id}")
+        sys.exit(1)
+    journal_game, batches = recorded
+    if journal_game != game_id:
+        print(f"ERROR: {journal_path} is a {journal_game} tournament, not {game_id}")
+        sys.exit(1)
 
-    # Build subprocess commands
-    commands: list[tuple[list[str], str]] = []
+    stream = None
+    if streamed is not None:
+        stream = FixtureStream.from_spec(batches)
+        done = journal.completed("main")
+        earlier = [res for results in done.values() for res in results]
+        pending = pending_jobs(done, iter(stream), [])
+        total = stream.fixtures()
+    else:
+        pending, earlier = resume_jobs(journal, "main", batches)
+        total = sum(job.get("repeat", 1) for job in batches)
+    print(f"\nMATCHMAKER - {game_name} [resume: {journal_path.name}]")
+    print(f"Fixture: {total} matches, {len(earlier)} already completed")
+    interrupted = journal.interrupted("main")
+    if interrupted:
+        print(f"Interrupted: {interrupted} batches started without a journaled result (re-run)")
+    if stream is not None:
+        print(f"Remaining: {total - len(earlier)} matches, streamed (seed {stream.seed})")
+    else:
+        print(f"Remaining: {sum(job.get('repeat', 1) for job in pending)} matches "
+              f"in {len(pending)} batches")
+    print(f"Workers: {opts.workers}")
+    print(f"Backend: {opts.backend}")
+    if opts.dry_run:
+        print("\n--- DRY RUN (no matches executed) ---")
+        print_run_estimate(pending, FixtureDurations(game_name), estimate_slots(opts))
+        return
 
-    if players == 2:
-        for a, b in fixtures_2p:
-            cmd = [
-                sys.executable,
-                str(match_script),
-                "--agent",
-                f"{a[0]}:{a[1]}",
-                f"{b[0]}:{b[1]}",
-            ]
-            if mini_agents is None:
-                cmd.append("--update-scoreboard")
-            label = f"{a[0]}:{a[1]} vs {b[0]}:{b[1]}"
-            commands.append((cmd, label))
+    fixtures = None
+    if stream is not None:
+        agents, mini, count = stream.agents, False, stream.batches()
+        fixtures = total - len(earlier)
     else:
-        for group in fixtures_6p:
-            cmd = [sys.executable, str(match_script), "--agent"]
-            cmd.extend(f"{f}:{r}" for f, r in group)
-            if mini_agents is None:
-                cmd.append("--update-scoreboard")
-            label = " vs ".join(f"{f}:{r}" for f, r in group)
-            commands.append((cmd, label))
-
-    semaphore = asyncio.Semaphore(workers)
-    start_time = time.time()
+        agents = {}
+        for job in batches:
+            for folder, run in job["agents"]:
+                if run not in agents.setdefault(folder, []):
+                    agents[folder].append(run)
+        mini, count = not any(job.get("write_scoreboard") for job in batches), None
+    await run_batches(
+        game_id, pending, earlier, agents, journal, FixtureDurations(game_name), opts,
+        mini=mini, total=count, fixtures=fixtures,
+    )
 
-    tasks = [
-        run_match_subprocess(cmd, i + 1, total_matches, label, semaphore, start_time)
-        for i, (cmd, label) in enumerate(commands)
-    ]
+
+def resume_jobs(
+    journal: FixtureJournal, phase: str, jobs: list[dict]
+) -> tuple[list[dict], list[dict]]:
+    """Split journaled *jobs* into what still has to run and what already did.
+
+    Returns the pending jobs (batches shrunk by their completed fixtures)
+    and the journaled results of the completed fixtures.
+    """
+    earlier: list[dict] = []
+    pending = list(pending_jobs(journal.completed(phase), jobs, earlier))
+    return pending, earlier
+
+
+def pending_jobs(
+    done: dict[int, list[dict]], jobs: Iterable[dict], earlier: list[dict]
+) -> Iterator[dict]:
+    """Lazily yield the *jobs* not completed in *done* (``journal.completed``),
+    shrunk by their completed fixtures, whose results go to *earlier*."""
+    for job in jobs:
+        repeat = job.get("repeat", 1)
+        completed = done.get(job["batch"], [])[:repeat]
+        earlier.extend(completed)
+        if len(completed) < repeat:
+            job = {**job, "repeat": repeat - len(completed)}
+            if "cache_keys" in job:
+                job["cache_keys"] = job["cache_keys"][len(completed):]
+            yield job
+
+
+def dispatch_window(pool, workers: int) -> int:
+    """Batches in flight at once: twice the most that can run concurrently."""
+    if isinstance(pool, ClusterPool):
+        return 2 * max(workers, pool.slots)
+    return 2 * workers
+
+
+async def run_bounded(
+    jobs: Iterable[dict],
+    start: Callable[[dict, int], Awaitable[list[dict]]],
+    window: Callable[[], int],
+) -> list[dict]:
+    """Run ``start(job, idx)`` for every job, at most ``window()`` at a time.
+
+    Jobs are taken from *jobs* (idx counting from 1) only as running ones
+    finish, so a lazy iterable is never materialized and only the batches
+    in flight exist as tasks. Returns the results of all batches, in
+    completion order. Cancelling cancels the batches in flight.
+    """
+    results: list[dict] = []
+    running: set[asyncio.Task] = set()
+
+    async def collect() -> None:
+        nonlocal running
+        done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            results.extend(task.result())
+
+    try:
+        for idx, job in enumerate(jobs, 1):
+            while len(running) >= max(1, window()):
+                await collect()
+            running.add(asyncio.ensure_future(start(job, idx)))
+        while running:
+            await collect()
+    except BaseException:
+        for task in running:
+            task.cancel()
+        raise
+    return results
+
+
+async def run_batches(
+    game_id: str,
+    batches: Iterable[dict],
+    earlier: list[dict],
+    agents: dict[str, list[int]],
+    journal: FixtureJournal,
+    durations: FixtureDurations,
+    opts: RunOptions,
+    mini: bool = False,
+    total: int | None = None,
+    fixtures: int | None = None,
+) -> None:
+    """Run fixture batches of a 2-player or single-phase tournament and summarize.
+
+    *earlier* holds results journaled by a previous run of the same
+    tournament or reused from the match cache; they count towards the
+    summary and mini league standings. Unless ``opts.cache_mode`` is
+    ``off``, new results are stored in the cache.
+    With ``opts.time_budget`` (seconds), batches that no longer fit are skipped
+    and the summary reports the pairings left under-covered. *batches* may
+    be a lazy iterable (a fixture stream) with its length given as *total*
+    and its fixture count as *fixtures*; it is consumed as workers free up
+    (``run_bounded``). Progress is published through a ``RunStatus``.
+    """
+    game = GAME_REGISTRY[game_id]
+    match_script = SCRIPT_DIR / game["script"]
+    cache = MatchCache(game["name"], match_script) if opts.cache_mode != "off" else None
+    workers = opts.workers
+    pool = make_pool([(match_script, game["name"], agents)], opts)
+    pinning = start_pinning(pool, opts)
+    semaphore = fixture_slots(pool, workers, opts.concurrency, opts.concurrency_start)
+    start_time = time.time()
+    budget = None
+    if opts.time_budget is not None:
+        budget = TimeBudget(opts.time_budget, durations)
+
+    if total is None:
+        total = len(batches)
+    if fixtures is None:
+        fixtures = sum(job.get("repeat", 1) for job in batches)
+    status = RunStatus(game["name"], slot_limit(pool, semaphore, workers))
+    status.add(fixtures)
+    await status.open()
+
+    def start(job: dict, idx: int):
+        return run_fixture_job(
+            job, idx, total, semaphore, start_time, match_script,
+            pool=pool, runner_log_dir=opts.runner_log_dir, durations=durations,
+            journal=journal, pinning=pinning, cache=cache, budget=budget, status=status,
+        )
 
     # Handle KeyboardInterrupt gracefully
     results = []
     try:
-        results = await asyncio.gather(*tasks)
+        results = await run_bounded(batches, start, lambda: dispatch_window(pool, workers))
     except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\nInterrupted — cancelling remaining matches...")
-        for t in tasks:
-            if isinstance(t, asyncio.Task) and not t.done():
-                t.cancel()
+        print(f"Resume with: --game {game_id} --resume {journal.path}")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        durations.save()
+        await status.close()
+
+    print_summary(game_id, results, earlier, journal, start_time, semaphore, mini)
+    if budget is not None and results:
+        print_coverage(results, earlier)
+
+
+def print_coverage(results: list[dict], earlier: list[dict], limit: int = 20) -> None:
+    """Meetings played per agent pairing versus planned, least covered first."""
+    planned: Counter = Counter()
+    played: Counter = Counter()
+    for res in earlier + results:
+        for pair in itertools.combinations(sorted(res["agents"]), 2):
+            planned[pair] += 1
+            if res.get("success"):
+                played[pair] += 1
+    short = sorted(
+        (pair for pair in planned if played[pair] < planned[pair]),
+        key=lambda p: (played[p] / planned[p], played[p], p),
+    )
+    print(f"\nCoverage: {len(planned) - len(short)} of {len(planned)} pairings fully played")
+    if not short:
+        return
+    levels = Counter(played[p] for p in planned)
+    print("  Meetings: " + ", ".join(f"{n} pairings x{k}" for k, n in sorted(levels.items())))
+    print("  Under-covered pairings (played/planned):")
+    for pair in short[:limit]:
+        print(f"    {' vs '.join(pair)}: {played[pair]}/{planned[pair]}")
+    if len(short) > limit:
+        print(f"    ... and {len(short) - limit} more")
+
 
-    # Summary
+def print_summary(
+    game_id: str,
+    results: list[dict],
+    earlier: list[dict],
+    journal: FixtureJournal,
+    start_time: float,
+    semaphore=None,
+    mini: bool = False,
+    title: str = "COMPLETE",
+    resumable: bool = True,
+) -> None:
+    """Summary of a finished (or interrupted) tournament of *game_id*."""
+    duration = time.time() - start_time
+    results = earlier + results
+    unplayed = sum(1 for r in results if r.get("unplayed"))
+    results = [r for r in results if not r.get("unplayed")]
     succeeded = sum(1 for r in results if r.get("success"))
     failed = sum(1 for r in results if not r.get("success"))
-    duration = time.time() - start_time
     duration_str = time.strftime("%H:%M:%S", time.gmtime(duration))
 
-    print(f"\nCOMPLETE")
+    print(f"\n{title}")
     print(f"  Succeeded: {succeeded} | Failed: {failed}")
+    if unplayed:
+        print(f"  Unplayed: {unplayed} did not fit in the time budget")
+        if resumable:
+            print(f"  Play them later with: --game {game_id} --resume {journal.path}")
+    cached = sum(1 for r in earlier if r.get("cached"))
+    if cached:
+        print(f"  Cached: {cached} reused from the match cache")
+    if len(earlier) > cached:
+        print(f"  Resumed: {len(earlier) - cached} completed in earlier runs")
+    print_killed(results)
+    print_stopped(results)
+    print_concurrency(semaphore)
     print(f"  Duration: {duration_str}")
 
     if failed:
@@ -661,247 +1779,59 @@ async def run_tournament(
             if not r.get("success"):
                 err = r.get("error", "unknown")
                 print(f"  - {r['label']}: {err}")
+        if resumable:
+            print(f"Re-run them with: --game {game_id} --resume {journal.path}")
 
-    if mini_agents is not None and results:
+    if mini and results:
         _print_mini_league_standings(results)
 
 
-async def run_a3_tournament(
-    game_id: str,
-    workers: int,
-    dry_run: bool,
-    health_check: bool = False,
-    auto_yes: bool = False,
-) -> None:
-    import os
-    import math
-
-    game = GAME_REGISTRY.get(game_id)
-    if not game:
-        print(f"ERROR: Unknown game_id {game_id}")
-        sys.exit(1)
-
-    game_name = game["name"]
-    match_script = SCRIPT_DIR / game["script"]
+def format_agents(
+    game_id: str, fmt: str, health_check: bool
+) -> tuple[Path, dict[str, list[int]], list[tuple[str, int]]]:
+    """Match script, agents and flat agent list of a 2-player *fmt* tournament.
 
-    if not match_script.exists():
-        print(f"ERROR: Match script not found: {match_script}")
+    Exits for games with more players or fewer than two models.
+    """
+    game = GAME_REGISTRY[game_id]
+    if game["players"] != 2:
+        print(f"ERROR: --format {fmt} needs a 2-player game; {game_id} has {game['players']} players")
         sys.exit(1)
-
-    agents = discover_agents(game_name)
-    if not agents:
-        print(f"ERROR: No agents found for {game_name} in {AGENTS_DIR}")
+    agents = discover_agents(game["name"])
+    if len(agents) < 2:
+        print(f"ERROR: Need 2+ models for cross-model pairings, found {len(agents)}")
         sys.exit(1)
-
-    if health_check:
-        if not verify_agent_syntax(game_name, agents):
-            sys.exit(1)
-
-    # Validate agent counts: Exactly 2 per model.
-    invalid_models = [m for m, rs in agents.items() if len(rs) != 2]
-    if invalid_models:
-        print(f"ERROR: A3 requires exactly 2 agents per model. Invalid models: {invalid_models}")
+    if health_check and not verify_agent_syntax(game["name"], agents):
         sys.exit(1)
+    flat = [(f, r) for f, rs in agents.items() for r in rs]
+    return SCRIPT_DIR / game["script"], agents, flat
 
-    models = sorted(agents.keys())
-    num_models = len(models)
 
-    if num_models < 3:
-        print(f"ERROR: A3 requires at least 3 models for 6-player games. Found {num_models}.")
-        sys.exit(1)
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
 
-    print(f"\nMATCHMAKER A3 - PHASE 1: Qualifiers")
-    print(f"Models: {num_models} (Total Agents: {num_models * 2})")
-
-    # Group into chunks of 3 models; pad the last group if needed.
-    random.shuffle(models)
-    groups = [models[i : i + 3] for i in range(0, num_models, 3)]
-    if len(groups[-1]) < 3:
-        remainder = groups[-1]
-        pad_pool = [m for m in models if m not in remainder]
-        pad_count = 3 - len(remainder)
-        remainder.extend(random.sample(pad_pool, pad_count))
-        groups[-1] = remainder
-        print(f"Note: Last qualifier group padded with {pad_count} extra model(s) for a full 6-player table.")
-    
-    commands_p1: list[tuple[list[str], str, list[tuple[str, int]]]] = []
-    for g in groups:
-        # Each group has 3 models. 2 agents per model = 6 players.
-        cmd = [sys.executable, str(match_script), "--agent"]
-        match_agents = []
-        for m in g:
-            match_agents.extend([(m, agents[m][0]), (m, agents[m][1])])
-            cmd.extend([f"{m}:{agents[m][0]}", f"{m}:{agents[m][1]}"])
-        # We do NOT run --update-scoreboard for Phase 1 as these are qualifiers 
-        # and do not reflect final standings across the board.
-        
-        label = " vs ".join(g)
-        commands_p1.append((cmd, label, match_agents))
-        
-    num_p1 = len(commands_p1)
-    print(f"Fixture: {num_p1} matches (Qualifiers)")
-    
-    if dry_run:
-        print("\n--- DRY RUN (Phase 1) ---")
-        for cmd_data in commands_p1:
-            print(f"  {cmd_data[1]}")
-        
-        # Expected Combinatorics Phase 2
-        combinations_count = math.comb(num_models, 6)
-        print(f"\n--- DRY RUN (Phase 2) ---")
-        print(f"Expected Matches: {combinations_count} combinations of winning agents")
-        return
 
-    # Execute Phase 1
-    # NUM_OF_GAMES_IN_A_MATCH is typically an env var. We bump it x10 for A3 Phase 1.
-    base_games = int(os.environ.get("NUM_OF_GAMES_IN_A_MATCH", "50"))
-    env_vars_p1 = {"NUM_OF_GAMES_IN_A_MATCH": str(base_games * 10)}
-    print(f"Config: {env_vars_p1['NUM_OF_GAMES_IN_A_MATCH']} games per Match (Phase 1 only)")
+def parse_games(value: str) -> list[str]:
+    """``--game`` value -> game IDs: one ID, a comma list, or ``all``."""
+    if value.strip().lower() == "all":
+        return list(GAME_REGISTRY)
+    game_ids = [g.strip().upper() for g in value.split(",") if g.strip()]
+    unknown = [g for g in game_ids if g not in GAME_REGISTRY]
+    if unknown or not game_ids:
+        raise argparse.ArgumentTypeError(
+            f"unknown game {', '.join(unknown) or value!r} "
+            f"(choose from {', '.join(GAME_REGISTRY)} or all)"
+        )
+    return list(dict.fromkeys(game_ids))
 
-    semaphore = asyncio.Semaphore(workers)
-    start_time = time.time()
-    
-    tasks = [
-        run_match_subprocess(cmd_data[0], i + 1, num_p1, cmd_data[1], semaphore, start_time, env_vars=env_vars_p1)
-        for i, cmd_data in enumerate(commands_p1)
-    ]
-    
-    try:
-        results = await asyncio.gather(*tasks)
-    except (KeyboardInterrupt, asyncio.CancelledError):
-        print("\n\nInterrupted Phase 1 — cancelling remaining matches...")
-        for t in tasks:
-            if isinstance(t, asyncio.Task) and not t.done():
-                t.cancel()
-        sys.exit(1)
 
-    print(f"\n--- PHASE 1 RESULTS ---")
-    for r in results:
-        if not r.get("success"):
-            print(f"\nFailed Qualifier: {r['label']}\n{r.get('error')}")
-            sys.exit(1)
-        # Print output so user can read the standard scoreboard stats for this match
-        print(f"\n{'-'*60}\nQualifier Group: {r['label']}\n{'-'*60}")
-        print(r.get("stdout", ""))
-
-    print(f"\n--- PHASE 1 SELECTION ---")
-    # Automatic selection based on points
-    model_results: dict[str, list[tuple[int, float]]] = {m: [] for m in models}
-    
-    for i, r in enumerate(results):
-        stdout = r.get("stdout", "")
-        # RESULT:Agent-1=45.0,Agent-2=25.0,...
-        m_res = re.search(r"RESULT:([^ \n]+)", stdout)
-        if m_res:
-            parts = m_res.group(1).split(",")
-            match_agents = commands_p1[i][2]
-            for p in parts:
-                if "=" not in p: continue
-                agent_label, points_str = p.split("=")
-                agent_idx = int(agent_label.split("-")[1]) - 1
-                points = float(points_str)
-                model_name, run_id = match_agents[agent_idx]
-                model_results[model_name].append((run_id, points))
-
-    # Aggregate points per run_id (models in padded groups appear multiple times)
-    model_agg: dict[str, dict[int, float]] = {m: {} for m in models}
-    for m in models:
-        for run_id, pts in model_results[m]:
-            model_agg[m][run_id] = model_agg[m].get(run_id, 0.0) + pts
-
-    chosen_agents: list[tuple[str, int]] = []
-    print(f"{'Model':<40} | {'Run A (Pts)':<15} | {'Run B (Pts)':<15} | {'Winner'}")
-    print("-" * 85)
-
-    for m in sorted(models):
-        res = sorted(model_agg[m].items())  # [ (run1, total_pts1), (run2, total_pts2) ]
-        if len(res) != 2:
-            # Fallback if parsing failed for some reason
-            print(f"WARNING: Could not parse results for {m}. Defaulting to first run.")
-            winner_run = agents[m][0]
-            pts_a, pts_b = 0.0, 0.0
-        else:
-            run_a, pts_a = res[0]
-            run_b, pts_b = res[1]
-            if pts_a >= pts_b:
-                winner_run = run_a
-            else:
-                winner_run = run_b
-
-        chosen_agents.append((m, winner_run))
-        a_str = f"{res[0][0]} ({res[0][1]:.1f})" if len(res)>0 else "N/A"
-        b_str = f"{res[1][0]} ({res[1][1]:.1f})" if len(res)>1 else "N/A"
-        print(f"{m:<40} | {a_str:<15} | {b_str:<15} | {winner_run}")
-                
-    # Phase 2
-    combinations = list(itertools.combinations(chosen_agents, 6))
-    num_p2 = len(combinations)
-    print(f"\nMATCHMAKER A3 - PHASE 2: Main Event")
-    print(f"Selected Agents: {len(chosen_agents)}")
-    print(f"Combinations: {num_p2} matches")
-    
-    if not auto_yes:
-        while True:
-            proceed = input("Start Phase 2? [y/N]: ").strip().lower()
-            if proceed in ("y", "yes"):
-                break
-            elif proceed in ("n", "no", ""):
-                print("Aborting.")
-                sys.exit(0)
-
-    # Build P2 commands
-    commands_p2: list[tuple[list[str], str]] = []
-    for count_idx, group in enumerate(combinations):
-        cmd = [sys.executable, str(match_script), "--agent"]
-        cmd.extend(f"{f}:{r}" for f, r in group)
-        cmd.append("--update-scoreboard")
-        # Keep label short since there are 134k 
-        label = f"Match_{count_idx+1}"
-        commands_p2.append((cmd, label))
-
-    random.shuffle(commands_p2) # disperse model clustering evenly
-    semaphore_p2 = asyncio.Semaphore(workers)
-    start_time_p2 = time.time()
-    
-    # Phase 2: Hardcode to 1 game per match
-    env_vars_p2 = {"NUM_OF_GAMES_IN_A_MATCH": "1"}
-    print(f"Config: 1 game per Match (Phase 2 only)")
-    
-    tasks_p2 = [
-        run_match_subprocess(cmd, i + 1, num_p2, label, semaphore_p2, start_time_p2, env_vars=env_vars_p2)
-        for i, (cmd, label) in enumerate(commands_p2)
-    ]
-    
+def parse_time_budget(value: str) -> float:
+    """``--time-budget`` value -> seconds."""
     try:
-        results_p2 = await asyncio.gather(*tasks_p2)
-    except (KeyboardInterrupt, asyncio.CancelledError):
-        print("\n\nInterrupted Phase 2 — cancelling remaining matches...")
-        for t in tasks_p2:
-            if isinstance(t, asyncio.Task) and not t.done():
-                t.cancel()
-        sys.exit(1)
-        
-    succeeded = sum(1 for r in results_p2 if r.get("success"))
-    failed = sum(1 for r in results_p2 if not r.get("success"))
-    duration = time.time() - start_time_p2
-    duration_str = time.strftime("%H:%M:%S", time.gmtime(duration))
-
-    print(f"\nPHASE 2 COMPLETE")
-    print(f"  Succeeded: {succeeded} | Failed: {failed}")
-    print(f"  Duration: {duration_str}")
-
-    if failed:
-        with open("a3_failed_matches.log", "w") as f:
-            for r in results_p2:
-                if not r.get("success"):
-                    err = r.get("error", "unknown")
-                    f.write(f"{r['label']}: {err}\n")
-        print("Failed matches written to a3_failed_matches.log")
-
-
-# ---------------------------------------------------------------------------
-# CLI entry point
-# ---------------------------------------------------------------------------
+        return parse_duration(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
 
 
 def main() -> None:
@@ -911,8 +1841,9 @@ def main() -> None:
     parser.add_argument(
         "--game",
         required=True,
-        choices=list(GAME_REGISTRY.keys()),
-        help="Game ID (e.g. A1, A2, ..., A8)",
+        type=parse_games,
+        help="Game ID (e.g. A1, A2, ..., A8), a comma-separated list of them, or "
+        "'all'; several games share one worker pool and fixture queue",
     )
     parser.add_argument(
         "--same_opponent_match",
@@ -923,8 +1854,17 @@ def main() -> None:
     parser.add_argument(
         "--workers",
         type=int,
-        default=24,
-        help="Max concurrent match subprocesses (default: 24)",
+        default=None,
+        help="Worker processes, and the most fixture batches run at once "
+        "(default: 2 x CPUs)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        choices=CONCURRENCY_MODES,
+        default="adaptive",
+        help="adaptive: start at one batch per CPU and adjust from the runnable "
+        "queue, load average and move-timeout rate; fixed: always --workers "
+        "(default: adaptive)",
     )
     parser.add_argument(
         "--dry-run",
@@ -937,6 +1877,49 @@ def main() -> None:
         default=None,
         help="Only generate matches involving these model folders (comma-separated)",
     )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="round-robin",
+        help="round-robin: every cross-model pair, --same_opponent_match times; "
+        "swiss: --rounds rounds pairing agents with similar points; adaptive: pair "
+        "for the most rating information until --confidence or --budget "
+        "(swiss and adaptive: 2-player games) (default: round-robin)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=None,
+        help="Rounds of a --format swiss tournament (default: ceil(log2(agents)) + 2)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Most fixtures of a --format adaptive tournament "
+        "(default: one per cross-model pair)",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.9,
+        help="--format adaptive stops once this expected fraction of agent pairs "
+        "is ranked in the right order (default: 0.9)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Count the fixtures already on the scoreboard (from the game's fixture "
+        "journals) towards the target coverage and schedule only the deficit",
+    )
+    parser.add_argument(
+        "--phase2-meetings",
+        type=int,
+        default=None,
+        metavar="K",
+        help="A3 Phase 2: play a sampled, seat-balanced design in which every pair of "
+        "finalists meets at least K times instead of all 6-agent combinations",
+    )
     parser.add_argument(
         "--health",
         action="store_true",
@@ -964,7 +1947,143 @@ def main() -> None:
         action="store_true",
         help="Skip confirmation prompts (e.g. A3 Phase 2 start)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Max fixtures of the same agents run back to back per worker "
+        "invocation (default: fixtures / (workers x 4), at least 1)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help="Split each match's games across this many processes "
+        "(default: 1; A3 qualifiers use workers / qualifier count)",
+    )
+    parser.add_argument(
+        "--stall-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Kill a game script (and its process group) after this many seconds "
+        f"without output (default: MATCH_STALL_LIMIT or {DEFAULT_STALL_LIMIT}; 0 disables)",
+    )
+    parser.add_argument(
+        "--runner-logs",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="With --backend subprocess, write each runner's stdout to "
+        "DIR/<fixture>.log instead of dropping it",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        metavar="JOURNAL",
+        help="Continue the tournament recorded in this fixture journal, skipping "
+        "fixtures it lists as completed (fixture options are taken from the journal)",
+    )
+    parser.add_argument(
+        "--order",
+        choices=ORDERS,
+        default="longest-first",
+        help="Fixture start order: longest expected wall time first, from the "
+        "durations recorded by earlier runs, or random (default: longest-first)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="pool",
+        help="Match execution backend: warm worker pool calling each runner's "
+        "run_fixture(); zygote: pool workers that preload agent imports and fork "
+        "each game script; subinterp: pool workers running each game script in its "
+        "own subinterpreter; subprocess: one cold runner CLI subprocess per fixture; "
+        "cluster: serve fixtures to remote workers (utils/match_cluster.py) "
+        "(default: pool)",
+    )
+    parser.add_argument(
+        "--listen",
+        default=f"127.0.0.1:{DEFAULT_PORT}",
+        metavar="HOST:PORT",
+        help="Address the cluster coordinator listens on; 0.0.0.0:PORT for workers on "
+        f"other hosts (default: 127.0.0.1:{DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each worker (and the game scripts it runs) to its own core set, "
+        "with a cgroup v2 cpu.max quota per worker where writable",
+    )
+    parser.add_argument(
+        "--cache",
+        choices=CACHE_MODES,
+        default="off",
+        help="Store match outcomes in results/match_cache and reuse them for "
+        "unchanged agents, runner and settings: any, seeded (only with --seed), "
+        "or off (default: off; nothing is stored or reused)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Base seed: every fixture plays with its own seed derived from it, "
+        "making outcomes reproducible (not A4)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=parse_time_budget,
+        default=None,
+        metavar="DURATION",
+        help="Wall-clock budget, e.g. 3h, 90m or 2h30m: run fixtures in coverage order "
+        "and start none that no longer fits (not A3, leagues or --format)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="2-player round robin: generate fixtures lazily, in a seeded pseudo-random "
+        "order, as workers free up instead of building the whole fixture list first",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help=f"With --dry-run: first play one unscored {CALIBRATION_GAMES}-game fixture for "
+        "every agent without recorded durations, so the estimate covers all agents",
+    )
+    parser.add_argument(
+        "--status-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Also serve the live run status (results/status/<game>.json) as JSON on "
+        "http://127.0.0.1:PORT/",
+    )
+    parser.add_argument(
+        "--sprt",
+        type=float,
+        default=None,
+        metavar="ALPHA",
+        help="Stop a 2-player match early once its winner is decided at error "
+        "rate ALPHA, e.g. 0.05 (default: MATCH_SPRT or off; see utils/match_sprt.py)",
+    )
     args = parser.parse_args()
+    # An explicit --workers is also where the adaptive limit starts.
+    concurrency_start = args.workers
+    if args.workers is None:
+        args.workers = default_workers()
+
+    # Inherited by pool workers and runner subprocesses (see zygote.stall_limit).
+    if args.stall_timeout is not None:
+        os.environ["MATCH_STALL_LIMIT"] = str(args.stall_timeout)
+    else:
+        os.environ.setdefault("MATCH_STALL_LIMIT", str(DEFAULT_STALL_LIMIT))
+    if args.sprt is not None:
+        if not 0 <= args.sprt < 0.5:
+            parser.error("--sprt takes an error rate below 0.5 (0 disables)")
+        os.environ["MATCH_SPRT"] = str(args.sprt)
+    if args.status_port is not None:
+        os.environ["MATCH_STATUS_PORT"] = str(args.status_port)
 
     new_models = None
     if args.new_model:
@@ -977,6 +2096,103 @@ def main() -> None:
         parser.error("--agent is only used with --mini")
     if args.mini and args.new_model:
         parser.error("--mini and --new-model are mutually exclusive")
+    if args.resume and (args.mini or args.new_model or args.random16 or args.incremental):
+        parser.error("--resume takes its fixtures from the journal; "
+                     "drop --mini/--new-model/--random16/--incremental")
+    if args.mini and args.incremental:
+        parser.error("--incremental counts scoreboard fixtures; a mini league has none")
+    if args.format != "round-robin":
+        if (args.mini or args.new_model or args.random16 or args.incremental or args.resume
+                or args.cache != "off" or args.seed is not None):
+            parser.error(f"--format {args.format} pairs agents from live results; drop "
+                         "--mini/--new-model/--random16/--incremental/--resume/--cache/--seed")
+        if len(args.game) > 1:
+            parser.error(f"--format {args.format} takes a single --game")
+    if args.rounds is not None and args.format != "swiss":
+        parser.error("--rounds is only used with --format swiss")
+    if args.budget is not None and args.format != "adaptive":
+        parser.error("--budget is only used with --format adaptive")
+    if args.phase2_meetings is not None:
+        if "A3" not in args.game:
+            parser.error("--phase2-meetings is only used with A3")
+        if args.phase2_meetings < 1:
+            parser.error("--phase2-meetings must be at least 1")
+    if args.time_budget is not None:
+        if args.format != "round-robin":
+            parser.error("--time-budget is not used with --format (see --budget/--rounds)")
+        if len(args.game) > 1 or args.game[0] == "A3":
+            parser.error("--time-budget takes a single --game other than A3")
+    if args.calibrate:
+        if not args.dry_run:
+            parser.error("--calibrate measures agents for a --dry-run estimate")
+        if len(args.game) > 1 or args.format != "round-robin" or args.resume:
+            parser.error("--calibrate takes a single --game (not --format or --resume)")
+    if args.backend == "cluster" and cluster_token() is None:
+        parser.error("--backend cluster needs MATCH_CLUSTER_TOKEN in .env "
+                     "(the same value on every worker host)")
+    if args.stream:
+        if len(args.game) > 1 or GAME_REGISTRY[args.game[0]]["players"] != 2:
+            parser.error("--stream takes a single 2-player --game")
+        if (args.format != "round-robin" or args.mini or args.random16 or args.incremental
+                or args.resume or args.cache != "off" or args.seed is not None
+                or args.time_budget is not None):
+            parser.error("--stream plays a plain round robin; drop --format/--mini/--random16/"
+                         "--incremental/--resume/--cache/--seed/--time-budget")
+
+    opts = RunOptions(
+        workers=args.workers,
+        dry_run=args.dry_run,
+        health_check=args.health,
+        auto_yes=args.auto_yes,
+        backend=args.backend,
+        batch_size=args.batch_size,
+        shards=args.shards,
+        runner_log_dir=args.runner_logs,
+        order=args.order,
+        listen=args.listen,
+        concurrency=args.concurrency,
+        concurrency_start=concurrency_start,
+        pin_cpus=args.pin_cpus,
+        cache_mode=args.cache,
+        seed=args.seed,
+        incremental=args.incremental,
+        time_budget=args.time_budget,
+    )
+
+    game_ids = args.game
+    if len(game_ids) > 1:
+        if args.mini or args.resume:
+            parser.error("--mini and --resume take a single --game "
+                         "(resume each game of a league from its own journal)")
+        from league import run_league
+
+        asyncio.run(
+            run_league(
+                game_ids,
+                opts,
+                same_opponent_match=args.same_opponent_match,
+                new_models=new_models,
+                random16=args.random16,
+                phase2_meetings=args.phase2_meetings,
+            )
+        )
+        return
+    args.game = game_ids[0]
+
+    if args.format == "swiss":
+        from swiss_tournament import run_swiss_tournament
+
+        asyncio.run(run_swiss_tournament(args.game, opts, rounds=args.rounds))
+        return
+    if args.format == "adaptive":
+        from adaptive_tournament import run_adaptive_tournament
+
+        asyncio.run(
+            run_adaptive_tournament(
+                args.game, opts, budget=args.budget, confidence=args.confidence
+            )
+        )
+        return
 
     # Build mini league agents dict from --agent specs
     mini_agents: dict[str, list[int]] | None = None
@@ -1017,29 +2233,36 @@ def main() -> None:
         if args.mini:
             print("ERROR: --mini is not supported for A3 (6-player game)")
             sys.exit(1)
+        from a3_tournament import run_a3_tournament
+
         asyncio.run(
             run_a3_tournament(
                 args.game,
-                args.workers,
-                args.dry_run,
-                args.health,
-                args.auto_yes,
+                opts,
+                resume=args.resume,
+                phase2_meetings=args.phase2_meetings,
+                calibrate=args.calibrate,
             )
         )
+    elif args.resume:
+        asyncio.run(resume_tournament(args.game, args.resume, opts))
     else:
         asyncio.run(
             run_tournament(
                 args.game,
-                args.same_opponent_match,
-                args.workers,
-                args.dry_run,
-                new_models,
-                args.health,
-                args.random16,
-                mini_agents,
+                opts,
+                same_opponent_match=args.same_opponent_match,
+                new_models=new_models,
+                random16=args.random16,
+                mini_agents=mini_agents,
+                stream=args.stream,
+                calibrate=args.calibrate,
             )
         )
 
 
 if __name__ == "__main__":
+    # The format drivers import this module by name; share this instance
+    # instead of loading it a second time.
+    sys.modules.setdefault("matchmaker", sys.modules[__name__])
     main()
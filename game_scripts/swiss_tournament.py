@@ -0,0 +1,235 @@
+"""
+Swiss-system tournament of a 2-player game (``matchmaker.py --format swiss``).
+
+Every round pairs the agents by the points they scored so far
+(``swiss_pairings``) and plays one match per pairing; the final table
+ranks by points, then Buchholz.
+"""
+
+import asyncio
+import itertools
+import math
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "utils"))
+
+from fixture_durations import FixtureDurations
+from fixture_journal import FixtureJournal
+from matchmaker import (
+    GAME_REGISTRY,
+    RunOptions,
+    fixture_slots,
+    format_agents,
+    make_pool,
+    order_longest_first,
+    print_summary,
+    run_fixture_job,
+    slot_limit,
+    start_pinning,
+)
+from run_status import RunStatus
+
+# Candidate pairings tried per round before rematches and same-model pairs
+# are allowed.
+SWISS_SEARCH_LIMIT = 20000
+
+
+def default_swiss_rounds(num_agents: int) -> int:
+    """Rounds that separate the agents into a ranking: ceil(log2(agents)) + 2."""
+    return math.ceil(math.log2(max(num_agents, 2))) + 2
+
+
+def swiss_pairings(
+    ranked: list[tuple[str, int]],
+    played: Counter,
+    limit: int = SWISS_SEARCH_LIMIT,
+) -> list[tuple[tuple[str, int], tuple[str, int]]]:
+    """Pair *ranked* agents (best first, even count) for one Swiss round.
+
+    Each agent, from the top, meets the nearest-ranked agent of another
+    model it has not played yet (*played* counts sorted pairs), backtracking
+    when that would leave a later agent without an opponent. When no such
+    pairing turns up within *limit* candidates, agents are paired greedily
+    by fewest rematches, then rank, and same-model pairs are allowed.
+    """
+    steps = 0
+
+    def pair(pool: list[tuple[str, int]]) -> list | None:
+        nonlocal steps
+        if not pool:
+            return []
+        first, rest = pool[0], pool[1:]
+        for other in rest:
+            steps += 1
+            if steps > limit:
+                return None
+            if other[0] == first[0] or played[tuple(sorted((first, other)))]:
+                continue
+            tail = pair([a for a in rest if a != other])
+            if tail is not None:
+                return [(first, other)] + tail
+        return None
+
+    pairs = pair(ranked)
+    if pairs is not None:
+        return pairs
+    pairs, pool = [], list(ranked)
+    while pool:
+        first = pool.pop(0)
+        other = min(pool, key=lambda a: (played[tuple(sorted((first, a)))], a[0] == first[0]))
+        pool.remove(other)
+        pairs.append((first, other))
+    return pairs
+
+
+def _print_swiss_standings(
+    points: dict[tuple[str, int], float],
+    opponents: dict[tuple[str, int], list[tuple[str, int]]],
+    byes: Counter,
+) -> None:
+    """Final Swiss table: points, then Buchholz (sum of the opponents' points)."""
+    buchholz = {a: sum(points[o] for o in opponents[a]) for a in points}
+    ranked = sorted(points, key=lambda a: (points[a], buchholz[a]), reverse=True)
+
+    print(f"\n{'='*80}")
+    print("SWISS STANDINGS")
+    print(f"{'='*80}")
+
+    agent_col = max(max(len(f"{f}:{r}") for f, r in ranked), 5)
+    header = (
+        f"{'#':<4} {'Agent':<{agent_col}}  "
+        f"{'Matches':>7}  {'Byes':>4}  {'Points':>8}  {'Buchholz':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for rank, agent in enumerate(ranked, 1):
+        print(
+            f"{rank:<4} {agent[0] + ':' + str(agent[1]):<{agent_col}}  "
+            f"{len(opponents[agent]):>7}  {byes[agent]:>4}  "
+            f"{points[agent]:>8.1f}  {buchholz[agent]:>9.1f}"
+        )
+
+    print(f"{'='*80}")
+
+
+async def run_swiss_tournament(game_id: str, opts: RunOptions, rounds: int | None = None) -> None:
+    """Swiss-system tournament of a 2-player game.
+
+    Every round pairs the agents by the points they scored so far in this
+    tournament (``swiss_pairings``) and runs one match per pairing through
+    the worker pool; matches write the scoreboard like round-robin ones.
+    With an odd agent count the lowest-ranked agent without a bye sits out
+    and is credited the round's mean points per match. Each round is
+    journaled as phase ``round<k>``, so ``--incremental`` counts its
+    matches; a Swiss tournament itself cannot be resumed.
+    """
+    game_name = GAME_REGISTRY[game_id]["name"]
+    match_script, agents, flat = format_agents(game_id, "swiss", opts.health_check)
+    workers, shards = opts.workers, opts.shards or 1
+    random.shuffle(flat)  # round 1 ties are broken at random
+    rounds = rounds or default_swiss_rounds(len(flat))
+    per_round = len(flat) // 2
+    round_robin = sum(1 for a, b in itertools.combinations(flat, 2) if a[0] != b[0])
+    print(f"\nMATCHMAKER - {game_name} [swiss]")
+    print(f"Agents: {len(flat)} ({len(agents)} models)")
+    print(
+        f"Fixture: {rounds * per_round} matches ({rounds} rounds x {per_round} pairings; "
+        f"a round robin needs {round_robin} per same_opponent_match)"
+    )
+    print(f"Workers: {workers}")
+    print(f"Backend: {opts.backend}")
+    if opts.dry_run:
+        print("\n--- DRY RUN (no matches executed) ---")
+        print(f"Total Matches: {rounds * per_round}")
+        return
+
+    journal = FixtureJournal.create(game_name)
+    print(f"Journal: {journal.path}")
+    durations = FixtureDurations(game_name)
+    pool = make_pool([(match_script, game_name, agents)], opts)
+    pinning = start_pinning(pool, opts)
+    semaphore = fixture_slots(pool, workers, opts.concurrency, opts.concurrency_start)
+    start_time = time.time()
+    status = RunStatus(game_name, slot_limit(pool, semaphore, workers))
+    status.add(rounds * per_round)
+    await status.open()
+
+    by_key = {f"{f}:{r}": (f, r) for f, r in flat}
+    points = {a: 0.0 for a in flat}
+    opponents: dict[tuple[str, int], list[tuple[str, int]]] = {a: [] for a in flat}
+    byes: Counter = Counter()
+    played: Counter = Counter()
+    results: list[dict] = []
+    try:
+        for rnd in range(1, rounds + 1):
+            ranked = sorted(flat, key=lambda a: points[a], reverse=True)
+            bye = None
+            if len(ranked) % 2:
+                bye = min(reversed(ranked), key=lambda a: byes[a])
+                ranked.remove(bye)
+                byes[bye] += 1
+            pairs = swiss_pairings(ranked, played)
+            jobs = [
+                {
+                    "agents": list(pair),
+                    "label": " vs ".join(f"{f}:{r}" for f, r in pair),
+                    "num_of_games": None,
+                    "write_scoreboard": True,
+                    "shards": shards,
+                }
+                for pair in pairs
+            ]
+            if opts.order == "longest-first":
+                jobs, _ = order_longest_first(jobs, durations)
+            phase = f"round{rnd}"
+            for i, job in enumerate(jobs):
+                job["batch"] = i
+            journal.write_jobs(phase, game_id, jobs)
+            bye_str = f", bye: {bye[0]}:{bye[1]}" if bye else ""
+            print(f"\nROUND {rnd}/{rounds}: {len(jobs)} matches{bye_str}", flush=True)
+
+            log_dir = opts.runner_log_dir / phase if opts.runner_log_dir else None
+            batches = await asyncio.gather(*(
+                run_fixture_job(
+                    job, i + 1, len(jobs), semaphore, start_time, match_script, pool=pool,
+                    runner_log_dir=log_dir, durations=durations, journal=journal,
+                    phase=phase, pinning=pinning, tag=f"R{rnd}", status=status,
+                )
+                for i, job in enumerate(jobs)
+            ))
+            round_results = [r for batch in batches for r in batch]
+            results += round_results
+            durations.save()
+
+            for a, b in pairs:
+                played[tuple(sorted((a, b)))] += 1
+                opponents[a].append(b)
+                opponents[b].append(a)
+            scored = []
+            for res in round_results:
+                if res.get("success"):
+                    for key, pts in zip(res["agents"], res["points"]):
+                        points[by_key[key]] += pts
+                        scored.append(pts)
+            if bye is not None and scored:
+                points[bye] += sum(scored) / len(scored)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\nInterrupted — cancelling remaining matches...")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_pending=True)
+        durations.save()
+        await status.close()
+
+    print_summary(
+        game_id, results, [], journal, start_time, semaphore,
+        title="SWISS COMPLETE", resumable=False,
+    )
+    _print_swiss_standings(points, opponents, byes)
+
+
@@ -0,0 +1,188 @@
+"""
+Runtime concurrency control for fixture batches.
+
+The engines enforce move limits with ``signal.alarm`` on wall-clock time,
+so an oversubscribed host turns slow scheduling into spurious ``TIMEOUT``
+moves and corrupts results, while too few concurrent fixtures leave cores
+idle. ``AdaptiveConcurrency`` replaces the matchmaker's fixed
+``asyncio.Semaphore(workers)`` with a limit that a control loop adjusts
+every ``INTERVAL`` seconds from four signals:
+
+    runnable      -- mean of ``procs_running`` in ``/proc/stat`` over the
+                     interval (tasks on or waiting for a CPU)
+    load          -- 1-minute load average
+    timeout rate  -- move timeouts per game in the fixtures that finished
+                     during the interval (``move_timeouts`` in their results)
+    kills         -- fixtures killed at their deadline during the interval
+
+A timeout rate above ``SPIKE_RATIO`` times its running baseline (and at
+least ``SPIKE_FLOOR``) halves the limit; a deadline kill, or a runnable
+queue or load above ``OVERLOAD`` per CPU, lowers it by one; a host below
+``IDLE`` per CPU whose slots are all busy raises it by a quarter of the
+CPUs. The limit stays between 1 and the worker count the pool was started
+with, and every change is printed with the numbers that caused it.
+"""
+
+import asyncio
+import os
+import time
+
+# Seconds between decisions.
+INTERVAL = 15.0
+# Games that must finish in an interval before its timeout rate is trusted.
+MIN_GAMES = 4
+# Timeouts per game that always count as a spike once over the baseline.
+SPIKE_FLOOR = 0.05
+SPIKE_RATIO = 2.0
+# Runnable tasks (or load) per CPU above which the limit is lowered ...
+OVERLOAD = 1.25
+# ... and below which it may be raised.
+IDLE = 0.75
+
+
+def cpu_count() -> int:
+    """CPUs this process may run on (affinity-aware where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def start_limit(ceiling: int, start: int | None = None) -> int:
+    """Limit an ``AdaptiveConcurrency`` of at most *ceiling* starts at."""
+    return max(1, min(max(1, ceiling), start or cpu_count()))
+
+
+def runnable_tasks() -> int | None:
+    """Tasks currently running or runnable on the host (Linux), else None."""
+    try:
+        with open("/proc/stat") as f:
+            for line in f:
+                if line.startswith("procs_running"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def load_average() -> float | None:
+    try:
+        return os.getloadavg()[0]
+    except OSError:
+        return None
+
+
+class AdaptiveConcurrency:
+    """Async context manager admitting up to ``limit`` batches at once.
+
+    Used in place of ``asyncio.Semaphore``; ``run_fixture_job`` reports
+    every finished batch through ``observe()``. Must be created inside the
+    running event loop, and ``close()``d when the tournament phase ends.
+    """
+
+    def __init__(self, ceiling: int, start: int | None = None, interval: float = INTERVAL) -> None:
+        self.cpus = cpu_count()
+        self.ceiling = max(1, ceiling)
+        self.limit = start_limit(self.ceiling, start)
+        self.interval = interval
+        self.active = 0
+        self.decisions: list[tuple[float, int, int, str]] = []  # (time, old, new, reason)
+        self.low = self.high = self.limit
+        self._changed = asyncio.Condition()
+        self._games = 0
+        self._timeouts = 0
+        self._kills = 0
+        self._baseline: float | None = None
+        self._saturated = False
+        self._task = asyncio.get_running_loop().create_task(self._control())
+
+    async def __aenter__(self) -> None:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+            if self.active >= self.limit:
+                self._saturated = True
+
+    async def __aexit__(self, *exc) -> None:
+        async with self._changed:
+            self.active -= 1
+            self._changed.notify_all()
+
+    def observe(self, results: list[dict]) -> None:
+        """Count the games, move timeouts and deadline kills of a finished batch."""
+        for res in results:
+            if res.get("killed") == "deadline":
+                self._kills += 1
+            elif res.get("success"):
+                self._games += res.get("games_actual") or res.get("games_played") or 0
+                self._timeouts += res.get("move_timeouts") or 0
+
+    def decide(
+        self,
+        runnable: float | None,
+        load: float | None,
+        games: int,
+        timeouts: int,
+        kills: int = 0,
+    ) -> tuple[int, str | None]:
+        """New limit and the reason for it, given one interval's signals."""
+        rate = timeouts / games if games >= MIN_GAMES else None
+        if rate is not None:
+            threshold = max(SPIKE_FLOOR, SPIKE_RATIO * (self._baseline or 0.0))
+            if rate > threshold:
+                return (
+                    max(1, self.limit // 2),
+                    (f"move timeouts spiked to {rate:.2f}/game over {games} games "
+                     f"(baseline {self._baseline or 0.0:.2f})"),
+                )
+            # Only calm intervals feed the baseline, so a spike cannot raise it.
+            self._baseline = rate if self._baseline is None else 0.7 * self._baseline + 0.3 * rate
+
+        if kills and self.limit > 1:
+            return self.limit - 1, f"{kills} fixtures killed at their deadline"
+
+        pressure = max(
+            (runnable or 0.0) / self.cpus,
+            (load or 0.0) / self.cpus,
+        )
+        signals = f"runnable {runnable:.1f}" if runnable is not None else "runnable n/a"
+        signals += f", load {load:.2f}" if load is not None else ", load n/a"
+        signals += f" on {self.cpus} CPUs"
+        if pressure > OVERLOAD and self.limit > 1:
+            return self.limit - 1, f"host overloaded ({signals})"
+        if pressure < IDLE and self._saturated and self.limit < self.ceiling:
+            step = max(1, self.cpus // 4)
+            return min(self.ceiling, self.limit + step), f"CPUs idle ({signals})"
+        return self.limit, None
+
+    async def _control(self) -> None:
+        start = time.monotonic()
+        while True:
+            samples = []
+            for _ in range(max(1, int(self.interval))):
+                await asyncio.sleep(self.interval / max(1, int(self.interval)))
+                n = runnable_tasks()
+                if n is not None:
+                    samples.append(max(0, n - 1))  # not counting this sampler
+            runnable = sum(samples) / len(samples) if samples else None
+            games, timeouts, kills = self._games, self._timeouts, self._kills
+            self._games = self._timeouts = self._kills = 0
+            new, reason = self.decide(runnable, load_average(), games, timeouts, kills)
+            self._saturated = self.active >= self.limit
+            if new == self.limit:
+                continue
+            elapsed = time.strftime("%H:%M:%S", time.gmtime(time.monotonic() - start))
+            print(f"CONCURRENCY: {self.limit} -> {new} at {elapsed} | {reason}", flush=True)
+            self.decisions.append((time.monotonic() - start, self.limit, new, reason))
+            async with self._changed:
+                self.limit = new
+                self.low, self.high = min(self.low, new), max(self.high, new)
+                self._changed.notify_all()
+
+    def summary(self) -> str:
+        return (
+            f"adaptive, {len(self.decisions)} changes, "
+            f"range {self.low}-{self.high} of {self.ceiling}, final {self.limit}"
+        )
+
+    def close(self) -> None:
+        self._task.cancel()
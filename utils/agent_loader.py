@@ -15,6 +15,10 @@ logger = setup_logging("agent-loader")
 
 AGENTS_DIR = Path(__file__).parent.parent / "agents"
 
+# (agent_file, mtime_ns, size, agent_idx, class_name) -> load_stored_agent result.
+# Keyed on file metadata so edited, renamed or replaced agents are re-read.
+_LOAD_CACHE: dict[tuple, tuple[str, str]] = {}
+
 
 def load_stored_agent(
     model_folder: str, game: str, run: int, agent_idx: int, class_name: str
@@ -23,7 +27,8 @@ def load_stored_agent(
 
     Reads the agent source, collects all import lines that appear before the
     class definition, then extracts the class body and renames it with an
-    ``_{agent_idx}`` suffix.
+    ``_{agent_idx}`` suffix. Results are cached per file version, so a
+    process running many fixtures of the same agent extracts it once.
 
     Args:
         model_folder: Directory name under agents/ (sanitized model name).
@@ -43,6 +48,11 @@ def load_stored_agent(
         logger.error("Agent file not found: %s", agent_file)
         return "", ""
 
+    stat = agent_file.stat()
+    cache_key = (str(agent_file), stat.st_mtime_ns, stat.st_size, agent_idx, class_name)
+    if cache_key in _LOAD_CACHE:
+        return _LOAD_CACHE[cache_key]
+
     content = agent_file.read_text()
     code_lines = content.split("\n")
 
@@ -92,7 +102,8 @@ def load_stored_agent(
         rf"\b{class_name}\b", f"{class_name}_{agent_idx}", agent_code
     )
 
-    return agent_code.strip(), "\n".join(imports)
+    _LOAD_CACHE[cache_key] = (agent_code.strip(), "\n".join(imports))
+    return _LOAD_CACHE[cache_key]
 
 
 COMMON_HEADER_IMPORTS: set[str] = {
@@ -127,3 +138,26 @@ def consolidate_imports(
     return "\n".join(
         imp for imp in sorted(all_imports) if imp.strip() and imp not in exclude
     )
+
+
+def collect_agent_imports(game: str, agents: dict[str, list[int]]) -> set[str]:
+    """Union of the top-level import lines across stored agents of *game*.
+
+    Used to preload agent dependencies once in a zygote process; the set is
+    a superset of what ``load_stored_agent`` would extract, which is fine
+    for warming ``sys.modules``.
+
+    Args:
+        game: Game file stem, e.g. ``"A1-Battleship"``.
+        agents: ``{model_folder: [run, ...]}`` as returned by discovery.
+    """
+    imports: set[str] = set()
+    for model_folder, runs in agents.items():
+        for run in runs:
+            agent_file = AGENTS_DIR / model_folder / f"{game}_{run}.py"
+            if not agent_file.exists():
+                continue
+            for line in agent_file.read_text().split("\n"):
+                if line.startswith("import ") or line.startswith("from "):
+                    imports.add(line.strip())
+    return imports
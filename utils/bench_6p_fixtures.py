@@ -0,0 +1,136 @@
+"""
+Benchmark of the 6-player fixture generator.
+
+Compares ``matchmaker.generate_6p_fixtures`` (incremental deficit counters,
+groups grown from the most under-covered pairs) with the sampling generator
+it replaced, which recounted the under-covered pairs on every iteration and
+scored 1,000 random groups per fixture. Pools are synthetic: models with
+two runs each. For each pool size the table shows generation time, the
+number of fixtures, and the lower bound ``ceil(missing meetings / 15)``
+(a group of 6 covers at most 15 pairs).
+
+Usage examples:
+    uv run utils/bench_6p_fixtures.py
+    uv run utils/bench_6p_fixtures.py --agents 20 50 100 --target 8
+    uv run utils/bench_6p_fixtures.py --agents 200 --skip-legacy
+"""
+
+import argparse
+import itertools
+import math
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "game_scripts"))
+
+from matchmaker import generate_6p_fixtures
+
+
+def legacy_generate_6p_fixtures(
+    agents: dict[str, list[int]], same_opponent_match: int
+) -> list[list[tuple[str, int]]]:
+    """The sampling generator, as it was before the incremental one."""
+    flat = [(folder, run) for folder, runs in agents.items() for run in runs]
+    folders = list(agents.keys())
+    num_models = len(folders)
+    group_size = min(num_models, 6)
+
+    cross_pairs = [
+        (a, b) for a, b in itertools.combinations(flat, 2) if a[0] != b[0]
+    ]
+    coverage: Counter = Counter()
+    target = same_opponent_match
+
+    def under_covered() -> int:
+        return sum(1 for p in cross_pairs if coverage[p] < target)
+
+    fixtures = []
+    stall = 0
+    while under_covered() > 0:
+        best_group, best_score = None, 0
+        for _ in range(1000):
+            chosen_models = random.sample(folders, group_size)
+            group = [(m, random.choice(agents[m])) for m in chosen_models]
+            score = 0
+            for a, b in itertools.combinations(group, 2):
+                pair = (a, b) if a < b else (b, a)
+                if coverage[pair] < target:
+                    score += 1
+            if score > best_score:
+                best_score, best_group = score, group
+        if best_group is None:
+            stall += 1
+            if stall >= 200:
+                break
+            continue
+        stall = 0
+        for a, b in itertools.combinations(best_group, 2):
+            pair = (a, b) if a < b else (b, a)
+            coverage[pair] += 1
+        fixtures.append(best_group)
+    return fixtures
+
+
+def synthetic_pool(num_agents: int, runs: int) -> dict[str, list[int]]:
+    models = math.ceil(num_agents / runs)
+    return {f"model-{m:03d}": list(range(1, runs + 1)) for m in range(models)}
+
+
+def shortfall(fixtures: list, agents: dict[str, list[int]], target: int) -> int:
+    """Cross-model pairs with fewer than *target* meetings."""
+    coverage: Counter = Counter()
+    for group in fixtures:
+        for a, b in itertools.combinations(sorted(group), 2):
+            coverage[a, b] += 1
+    flat = sorted((f, r) for f, runs in agents.items() for r in runs)
+    return sum(
+        1 for a, b in itertools.combinations(flat, 2) if a[0] != b[0] and coverage[a, b] < target
+    )
+
+
+def timed(generate, *args) -> tuple[float, list]:
+    start = time.perf_counter()
+    fixtures = generate(*args)
+    return time.perf_counter() - start, fixtures
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the 6-player fixture generator")
+    parser.add_argument("--agents", type=int, nargs="+", default=[20, 50, 100],
+                        help="Pool sizes to benchmark (default: 20 50 100)")
+    parser.add_argument("--runs", type=int, default=2, help="Runs per model (default: 2)")
+    parser.add_argument("--target", type=int, default=4,
+                        help="Meetings per cross-model pair (default: 4)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument("--skip-legacy", action="store_true",
+                        help="Only time the current generator")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    print(f"{'Agents':>6} | {'Bound':>6} | {'Legacy s':>9} | {'Legacy fx':>9} | "
+          f"{'New s':>7} | {'New fx':>6} | Short (legacy/new)")
+    for num_agents in args.agents:
+        agents = synthetic_pool(num_agents, args.runs)
+        flat = [(f, r) for f, runs in agents.items() for r in runs]
+        pairs = sum(1 for a, b in itertools.combinations(flat, 2) if a[0] != b[0])
+        bound = math.ceil(pairs * args.target / 15)
+
+        random.seed(args.seed)
+        new_s, new_fx = timed(generate_6p_fixtures, agents, args.target)
+        legacy = "-", "-", "-"
+        if not args.skip_legacy:
+            random.seed(args.seed)
+            legacy_s, legacy_fx = timed(legacy_generate_6p_fixtures, agents, args.target)
+            legacy = f"{legacy_s:9.2f}", len(legacy_fx), shortfall(legacy_fx, agents, args.target)
+        print(f"{len(flat):>6} | {bound:>6} | {legacy[0]:>9} | {legacy[1]:>9} | "
+              f"{new_s:7.2f} | {len(new_fx):>6} | "
+              f"{legacy[2]}/{shortfall(new_fx, agents, args.target)}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+CPU pinning and per-worker CPU quotas for fair move timing.
+
+Move limits are wall-clock (``signal.alarm``), so a match that shares a core
+with a CPU-heavy neighbour can time out through no fault of its agents.
+``CpuPinning`` splits the CPUs this process may use into one core set per
+worker slot. A pinned worker process, thread or runner subprocess calls
+``apply(slot)``; ``os.sched_setaffinity`` is inherited by every game script
+and shard it starts.
+
+Where a cgroup v2 hierarchy is writable, each slot also gets its own cgroup
+``<own cgroup>/matchmaker-<pid>-slot<k>`` whose ``cpu.max`` allows exactly
+its cores' worth of CPU time, so a slot cannot borrow cycles from its
+neighbours through processes that escape the affinity mask. Without
+cgroup v2 (or the ``cpu`` controller) only affinity is applied, and the
+reason is reported.
+
+Pinned processes set ``MATCH_CPU_PINNING``; the runners then write the
+actual placement (``cpu_placement()``) into each match log.
+"""
+
+import atexit
+import os
+from pathlib import Path
+
+# cpu.max period, microseconds.
+QUOTA_PERIOD = 100_000
+
+
+def format_cpu_list(cpus) -> str:
+    """``[0, 1, 2, 5]`` -> ``"0-2,5"``."""
+    cpus = sorted(cpus)
+    ranges = []
+    for cpu in cpus:
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(f"{a}-{b}" if a != b else str(a) for a, b in ranges)
+
+
+def core_sets(slots: int, cpus: list[int]) -> list[list[int]]:
+    """Split *cpus* into *slots* disjoint core sets of equal size.
+
+    Leftover CPUs stay unpinned (the matchmaker runs there). With more
+    slots than CPUs, slots share single cores round-robin.
+    """
+    per_slot = len(cpus) // slots
+    if per_slot == 0:
+        return [[cpus[k % len(cpus)]] for k in range(slots)]
+    return [cpus[k * per_slot:(k + 1) * per_slot] for k in range(slots)]
+
+
+def _cgroup2_mount() -> Path | None:
+    try:
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                fields = line.split()
+                sep = fields.index("-")
+                if fields[sep + 1] == "cgroup2":
+                    return Path(fields[4])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _own_cgroup() -> str | None:
+    """This process's cgroup v2 path (``0::/...`` in /proc/self/cgroup)."""
+    try:
+        with open("/proc/self/cgroup") as f:
+            for line in f:
+                if line.startswith("0::"):
+                    return line[3:].strip()
+    except OSError:
+        pass
+    return None
+
+
+def _create_quota_groups(sets: list[list[int]]) -> tuple[list[Path], str | None]:
+    """One cgroup per slot with ``cpu.max`` set; ``([], reason)`` when impossible."""
+    mount, own = _cgroup2_mount(), _own_cgroup()
+    if mount is None or own is None:
+        return [], "no cgroup v2 hierarchy"
+    base = mount / own.lstrip("/")
+    created: list[Path] = []
+    try:
+        if "cpu" not in (base / "cgroup.controllers").read_text().split():
+            return [], f"cpu controller not available in {base}"
+        subtree = base / "cgroup.subtree_control"
+        if "cpu" not in subtree.read_text().split():
+            subtree.write_text("+cpu")
+        for k, cores in enumerate(sets):
+            group = base / f"matchmaker-{os.getpid()}-slot{k}"
+            group.mkdir(exist_ok=True)
+            created.append(group)
+            (group / "cpu.max").write_text(f"{len(cores) * QUOTA_PERIOD} {QUOTA_PERIOD}")
+    except OSError as e:
+        for group in created:
+            try:
+                group.rmdir()
+            except OSError:
+                pass
+        return [], f"{base} not writable ({e.strerror or e})"
+    return created, None
+
+
+class CpuPinning:
+    """Core sets (and cgroup quotas, where possible) for *slots* workers."""
+
+    def __init__(self, slots: int, quota: bool = True) -> None:
+        self.cpus = sorted(os.sched_getaffinity(0))
+        self.sets = core_sets(max(1, slots), self.cpus)
+        self.quota_dirs: list[Path] = []
+        self.quota_reason: str | None = "disabled"
+        if quota:
+            self.quota_dirs, self.quota_reason = _create_quota_groups(self.sets)
+        self._free = list(range(len(self.sets)))
+        atexit.register(self.remove)
+
+    def describe(self) -> str:
+        sizes = {len(s) for s in self.sets}
+        shared = len(self.sets) > len(self.cpus)
+        text = (
+            f"{len(self.sets)} core sets of {'/'.join(map(str, sorted(sizes)))} CPUs "
+            f"from {format_cpu_list(self.cpus)}" + (" (shared: more slots than CPUs)" if shared else "")
+        )
+        if self.quota_dirs:
+            return text + ", cgroup v2 cpu.max quota per slot"
+        return text + f", no cgroup quota ({self.quota_reason})"
+
+    def acquire(self) -> int:
+        """Take a free slot (for callers that start one process per fixture)."""
+        return self._free.pop(0)
+
+    def release(self, slot: int) -> None:
+        self._free.append(slot)
+
+    def apply(self, slot: int, thread: bool = False) -> None:
+        """Pin the calling process (or, with *thread*, only the calling thread)."""
+        slot %= len(self.sets)
+        os.sched_setaffinity(0, self.sets[slot])
+        os.environ["MATCH_CPU_PINNING"] = "1"
+        if self.quota_dirs and not thread:
+            (self.quota_dirs[slot] / "cgroup.procs").write_text(str(os.getpid()))
+
+    def remove(self) -> None:
+        """Delete the slot cgroups (once their processes have exited)."""
+        for group in self.quota_dirs:
+            try:
+                group.rmdir()
+            except OSError:
+                pass
+        self.quota_dirs = []
+
+
+def cpu_placement() -> str | None:
+    """Match-log line with this process's CPUs and cgroup quota, if pinned."""
+    if not os.getenv("MATCH_CPU_PINNING"):
+        return None
+    cpus = format_cpu_list(os.sched_getaffinity(0))
+    quota = "none"
+    mount, own = _cgroup2_mount(), _own_cgroup()
+    if mount is not None and own is not None:
+        try:
+            limit = (mount / own.lstrip("/") / "cpu.max").read_text().strip()
+            quota = f"cpu.max {limit} ({own})"
+        except OSError:
+            pass
+    return f"CPU Placement: pid {os.getpid()}, cpus {cpus}, quota {quota}"
@@ -0,0 +1,133 @@
+"""
+Historical fixture wall times for longest-processing-time-first scheduling.
+
+Fixtures are generated in random order, so the slowest pairings often start
+last and one straggler keeps a tournament alive while every other worker is
+idle. The matchmaker records how long each fixture took, per game and agent
+group, and the next run starts the fixtures expected to take longest first.
+
+A sample is the time a worker spent on one fixture (from when it picked
+the fixture up, not counting the wait for a free worker) divided by the
+games the fixture really played, so A3 qualifiers at 10x games, 1-game
+Phase 2 tables and matches stopped early by SPRT share one history.
+Samples are stored per agent group and shard count in a pipe-delimited
+file next to the match results::
+
+    Agents | Shards | Samples | Seconds/Game
+    gpt-5-mini:1,mistral-large:2 | 1 | 3 | 0.8421
+
+Agents are sorted, so seat order does not split the history. The mean is a
+running average over the last ``WINDOW`` samples' worth of weight, so it
+follows agents that get faster or slower. A sharded match's seconds are
+wall time over ``shards`` processes; estimates normalize them once, to the
+time of one process (``seconds * shards``), and callers divide by the
+shards of the fixture they plan. A group that never ran is estimated from
+its agents' averages over all their recorded groups. Files without the
+Shards column are read as unsharded.
+"""
+
+import os
+from pathlib import Path
+
+DURATIONS_DIR = Path(__file__).parent.parent / "results" / "fixture_durations"
+
+# Samples after which new measurements stop being averaged in equally.
+WINDOW = 10
+
+
+def _group_key(agents: list[tuple[str, int]]) -> str:
+    return ",".join(sorted(f"{folder}:{run}" for folder, run in agents))
+
+
+class FixtureDurations:
+    """Per-game store of recorded fixture times (seconds per game played)."""
+
+    def __init__(self, game_name: str, path: Path | None = None) -> None:
+        self.path = Path(path) if path is not None else DURATIONS_DIR / f"{game_name}.txt"
+        # (key, shards) -> (samples, wall sec/game), as recorded
+        self.samples: dict[tuple[str, int], tuple[int, float]] = {}
+        # key -> (samples, sec/game of one process), over every shard count
+        self.groups: dict[str, tuple[int, float]] = {}
+        if self.path.exists():
+            for line in self.path.read_text().splitlines():
+                parts = [p.strip() for p in line.split("|")]
+                if len(parts) == 3:
+                    parts.insert(1, "1")
+                if len(parts) != 4 or parts[0] == "Agents":
+                    continue
+                try:
+                    self.samples[parts[0], int(parts[1])] = (int(parts[2]), float(parts[3]))
+                except ValueError:
+                    continue
+        for key in {key for key, _ in self.samples}:
+            self._merge(key)
+        self._index_agents()
+
+    def _merge(self, key: str) -> None:
+        """Combine a group's samples at every shard count into one process time."""
+        rows = [
+            (n, per_game * shards)
+            for (k, shards), (n, per_game) in self.samples.items()
+            if k == key
+        ]
+        total = sum(n for n, _ in rows)
+        self.groups[key] = (total, sum(n * per_game for n, per_game in rows) / total)
+
+    def _index_agents(self) -> None:
+        """Per-agent mean seconds/game over every recorded group it played in."""
+        totals: dict[str, list[float]] = {}
+        for key, (_, per_game) in self.groups.items():
+            for agent in key.split(","):
+                totals.setdefault(agent, []).append(per_game)
+        self.agent_means = {a: sum(v) / len(v) for a, v in totals.items()}
+        values = [per_game for _, per_game in self.groups.values()]
+        self.global_mean = sum(values) / len(values) if values else None
+
+    def record(
+        self, agents: list[tuple[str, int]], games: float, seconds: float, shards: int = 1
+    ) -> None:
+        """Add one fixture that played *games* games in *seconds* on *shards* processes."""
+        if games <= 0 or seconds <= 0:
+            return
+        key = _group_key(agents)
+        shards = max(1, shards)
+        samples, mean = self.samples.get((key, shards), (0, 0.0))
+        samples += 1
+        mean += (seconds / games - mean) / min(samples, WINDOW)
+        self.samples[key, shards] = (samples, mean)
+        self._merge(key)
+
+    def known(self, agents: list[tuple[str, int]]) -> bool:
+        return _group_key(agents) in self.groups
+
+    def estimate(self, agents: list[tuple[str, int]], games: int) -> float | None:
+        """Expected time of an unsharded fixture, or None with no history at all.
+
+        A fixture on ``shards`` processes takes this divided by ``shards``.
+        Uses the group's own history when there is one, otherwise the mean of
+        its agents' averages (agents without history count as the overall
+        mean).
+        """
+        key = _group_key(agents)
+        if key in self.groups:
+            return self.groups[key][1] * games
+        if self.global_mean is None:
+            return None
+        per_agent = [
+            self.agent_means.get(agent, self.global_mean) for agent in key.split(",")
+        ]
+        return sum(per_agent) / len(per_agent) * games
+
+    def save(self) -> None:
+        """Rewrite the history file atomically and refresh the estimates."""
+        self._index_agents()
+        if not self.samples:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = ["Agents | Shards | Samples | Seconds/Game"]
+        for key, shards in sorted(self.samples):
+            samples, per_game = self.samples[key, shards]
+            lines.append(f"{key} | {shards} | {samples} | {per_game:.4f}")
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,184 @@
+"""
+Append-only fixture journal for resumable tournaments.
+
+The matchmaker writes one JSON object per line to a journal file:
+
+    {"type": "fixtures", "phase": ..., "game": ..., "jobs": [...]}
+        the fixture batches of a tournament phase, in start order
+    {"type": "fixtures", "phase": ..., "game": ..., "stream": {...}}
+        instead of the batches: the parameters of a lazy ``FixtureStream``
+        (``matchmaker.py --stream``), which rebuilds them in the same order
+    {"type": "start", "phase": ..., "batch": i}
+        batch ``i`` was handed to a worker
+    {"type": "result", "phase": ..., "batch": i, "success": ..., "agents": [...],
+     "points": [...], "scores": [...], "error": ...}
+        one fixture of batch ``i`` finished; cached replays (``--cache``) are
+        journaled with ``"batch": null, "cached": true``
+
+Result lines are appended by the process that wrote the fixture's
+scoreboard rows, immediately after writing them: the pool worker calling
+``run_fixture()``, or the runner CLI itself for the subprocess backend
+(which learns the journal from ``MATCH_JOURNAL`` / ``MATCH_JOURNAL_ENTRY``).
+A fixture that still finishes after the matchmaker was interrupted is
+therefore journaled too, and resuming from the journal never replays a
+fixture whose result is already on the scoreboard. Over all journals of a
+game, ``recorded_fixtures`` counts what the scoreboard already holds. Each line is a single
+``write()`` on an ``O_APPEND`` descriptor under ``flock``, and a torn last
+line (the machine went down mid-write) is ignored when reading.
+"""
+
+import fcntl
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from match_api import fixture_result
+
+JOURNAL_DIR = Path(__file__).parent.parent / "results" / "journals"
+
+_RESULT_KEYS = ("success", "agents", "points", "scores", "error", "label")
+
+
+def append_entry(path: Path | str, entry: dict) -> None:
+    """Append one JSON line to the journal at *path*."""
+    line = (json.dumps(entry, default=str) + "\n").encode()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def result_entry(base: dict, res: dict) -> dict:
+    """Journal line for one ``run_fixture`` result dict."""
+    entry = {"type": "result", **base}
+    entry.update({k: res[k] for k in _RESULT_KEYS if k in res})
+    if entry.get("error") is not None:
+        entry["error"] = str(entry["error"])[:300]
+    return entry
+
+
+def journal_match(res: dict, agent_keys: list[str]) -> None:
+    """Journal a runner CLI's match result when the matchmaker asked for it.
+
+    Called by the runners after ``record_match``. A no-op unless
+    ``MATCH_JOURNAL`` is set in the environment.
+    """
+    path = os.getenv("MATCH_JOURNAL")
+    if not path:
+        return
+    base = json.loads(os.getenv("MATCH_JOURNAL_ENTRY", "{}"))
+    append_entry(path, result_entry(base, fixture_result(dict(res), agent_keys, 0, None)))
+
+
+class FixtureJournal:
+    """A tournament's journal: fixture lists per phase plus finished fixtures."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.entries: list[dict] = []
+        if self.path.exists():
+            for line in self.path.read_text().splitlines():
+                try:
+                    self.entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # torn last line
+
+    @classmethod
+    def create(cls, game_name: str) -> "FixtureJournal":
+        """New empty journal under ``results/journals/``."""
+        JOURNAL_DIR.mkdir(parents=True, exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return cls(JOURNAL_DIR / f"{game_name}_{ts}.jsonl")
+
+    def jobs(self, phase: str) -> tuple[str, list[dict]] | None:
+        """``(game, jobs)`` recorded for *phase*, or None if it never started."""
+        for entry in self.entries:
+            if entry.get("type") == "fixtures" and entry.get("phase") == phase and "jobs" in entry:
+                jobs = [
+                    {**job, "agents": [tuple(a) for a in job["agents"]]}
+                    for job in entry["jobs"]
+                ]
+                return entry.get("game"), jobs
+        return None
+
+    def write_jobs(self, phase: str, game: str, jobs: list[dict]) -> None:
+        self._append({"type": "fixtures", "phase": phase, "game": game, "jobs": jobs})
+
+    def stream(self, phase: str) -> tuple[str, dict] | None:
+        """``(game, stream spec)`` recorded for *phase*, or None."""
+        for entry in self.entries:
+            if entry.get("type") == "fixtures" and entry.get("phase") == phase and "stream" in entry:
+                return entry.get("game"), entry["stream"]
+        return None
+
+    def write_stream(self, phase: str, game: str, spec: dict) -> None:
+        self._append({"type": "fixtures", "phase": phase, "game": game, "stream": spec})
+
+    def start(self, phase: str, batch: int) -> None:
+        self._append({"type": "start", "phase": phase, "batch": batch})
+
+    def completed(self, phase: str) -> dict[int, list[dict]]:
+        """Successful fixture results of *phase*, by batch index."""
+        done: dict[int, list[dict]] = {}
+        for entry in self.entries:
+            if (
+                entry.get("type") == "result"
+                and entry.get("phase") == phase
+                and entry.get("success")
+            ):
+                done.setdefault(entry["batch"], []).append(entry)
+        return done
+
+    def record_cached(self, phase: str, results: list[dict]) -> None:
+        """Journal results reused from the match cache (no batch; never resumed)."""
+        for res in results:
+            self._append(result_entry({"phase": phase, "batch": None, "cached": True}, res))
+
+    def interrupted(self, phase: str) -> int:
+        """Batches of *phase* that were started but journaled no result."""
+        started = {
+            e["batch"] for e in self.entries
+            if e.get("type") == "start" and e.get("phase") == phase
+        }
+        finished = {
+            e["batch"] for e in self.entries
+            if e.get("type") == "result" and e.get("phase") == phase
+        }
+        return len(started - finished)
+
+    def _append(self, entry: dict) -> None:
+        append_entry(self.path, entry)
+        self.entries.append(entry)
+
+
+def recorded_fixtures(game_name: str, journal_dir: Path = JOURNAL_DIR) -> Counter:
+    """Fixtures already on *game_name*'s scoreboard, by agent group.
+
+    Counts, over every journal of the game, the successful results of
+    batches journaled with ``write_scoreboard`` (every batch of a fixture
+    stream) plus cached replays.
+    Qualifiers and mini leagues never reach the scoreboard and are not
+    counted. Keys are sorted tuples of (folder, run).
+    """
+    counts: Counter = Counter()
+    for path in sorted(Path(journal_dir).glob(f"{game_name}_*.jsonl")):
+        journal = FixtureJournal(path)
+        fixtures = [e for e in journal.entries if e.get("type") == "fixtures"]
+        streamed = {entry["phase"] for entry in fixtures if "stream" in entry}
+        scored = {
+            (entry["phase"], job.get("batch"))
+            for entry in fixtures
+            for job in entry.get("jobs", []) if job.get("write_scoreboard")
+        }
+        for entry in journal.entries:
+            if entry.get("type") != "result" or not entry.get("success"):
+                continue
+            phase = entry.get("phase")
+            if entry.get("cached") or phase in streamed or (phase, entry.get("batch")) in scored:
+                agents = (a.rsplit(":", 1) for a in entry["agents"])
+                counts[tuple(sorted((folder, int(run)) for folder, run in agents))] += 1
+    return counts
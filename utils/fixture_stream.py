@@ -0,0 +1,139 @@
+"""
+Lazy, pseudo-random stream of 2-player fixture batches.
+
+``generate_2p_fixtures`` builds every fixture (pairs x same_opponent_match
+tuples) and shuffles the list; with 200 agents that is over 150,000
+fixtures, each then turned into a job dict, before the first match starts.
+``FixtureStream`` produces the same fixtures as batches, one at a time:
+
+    unit      -- (pair, chunk): up to ``batch_size`` of the pair's meetings,
+                 run back to back as one batch (``repeat``), starting with
+                 meeting ``occurrence``
+    order     -- unit ``permute(p)`` is yielded at position p, where
+                 ``permute`` is a seeded bijection on the unit indices
+                 (a 4-round Feistel network with cycle walking)
+
+A unit index maps to its pair by unranking ``itertools.combinations`` of
+the agent list, so nothing grows with the number of fixtures. Units of
+same-model pairs (or, with *new_models*, pairs without a new model) are
+skipped. A batch's ``batch`` number is its stream position, which is
+stable: the stream is rebuilt from ``spec()`` (journaled instead of the
+fixture list) to resume a tournament.
+"""
+
+import math
+import random
+from typing import Iterator
+
+_MASK64 = (1 << 64) - 1
+_ROUNDS = 4
+
+
+def _mix(x: int) -> int:
+    """splitmix64 finalizer."""
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+    return x ^ (x >> 31)
+
+
+def permute(index: int, size: int, seed: int) -> int:
+    """Position *index* of a seeded pseudo-random permutation of range(size)."""
+    half = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half) - 1
+    x = index
+    while True:
+        left, right = x >> half, x & mask
+        for r in range(_ROUNDS):
+            left, right = right, left ^ (_mix(seed * _ROUNDS + r + (right << 8)) & mask)
+        x = (left << half) | right
+        if x < size:
+            return x
+
+
+def unrank_pair(k: int, n: int) -> tuple[int, int]:
+    """k-th pair of ``itertools.combinations(range(n), 2)``."""
+    # Pairs starting before i: i * n - i * (i + 1) / 2
+    i = n - 2 - (math.isqrt(8 * (n * (n - 1) // 2 - 1 - k) + 1) - 1) // 2
+    j = k - (i * n - i * (i + 1) // 2) + i + 1
+    return i, j
+
+
+def count_pairs(agents: dict[str, list[int]], new_models: list[str] | None = None) -> int:
+    """Cross-model agent pairs (with a new model, if given), from the model sizes."""
+    def cross(sizes: list[int]) -> int:
+        total = sum(sizes)
+        return (total * total - sum(n * n for n in sizes)) // 2
+
+    pairs = cross([len(runs) for runs in agents.values()])
+    if new_models:
+        pairs -= cross([len(runs) for m, runs in agents.items() if m not in new_models])
+    return pairs
+
+
+class FixtureStream:
+    """Cross-model 2-player fixtures of a round robin, as lazy batches."""
+
+    def __init__(
+        self,
+        agents: dict[str, list[int]],
+        same_opponent_match: int,
+        batch_size: int = 1,
+        new_models: list[str] | None = None,
+        seed: int | None = None,
+        shards: int = 1,
+    ) -> None:
+        self.agents = agents
+        self.same_opponent_match = same_opponent_match
+        self.batch_size = max(1, batch_size)
+        self.new_models = list(new_models or [])
+        self.seed = random.randrange(2**31) if seed is None else seed
+        self.shards = shards
+        self.flat = [(folder, run) for folder, runs in agents.items() for run in runs]
+        self.chunks = math.ceil(same_opponent_match / self.batch_size)
+        self.units = math.comb(len(self.flat), 2) * self.chunks
+
+    def spec(self) -> dict:
+        """JSON-able parameters that rebuild this exact stream."""
+        return {
+            "agents": self.agents,
+            "same_opponent_match": self.same_opponent_match,
+            "batch_size": self.batch_size,
+            "new_models": self.new_models,
+            "seed": self.seed,
+            "shards": self.shards,
+        }
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "FixtureStream":
+        return cls(**spec)
+
+    def pairs(self) -> int:
+        return count_pairs(self.agents, self.new_models)
+
+    def fixtures(self) -> int:
+        return self.pairs() * self.same_opponent_match
+
+    def batches(self) -> int:
+        return self.pairs() * self.chunks
+
+    def __iter__(self) -> Iterator[dict]:
+        n = len(self.flat)
+        new = set(self.new_models)
+        for position in range(self.units):
+            pair, chunk = divmod(permute(position, self.units, self.seed), self.chunks)
+            i, j = unrank_pair(pair, n)
+            a, b = self.flat[i], self.flat[j]
+            if a[0] == b[0] or (new and a[0] not in new and b[0] not in new):
+                continue
+            repeat = min(self.batch_size, self.same_opponent_match - chunk * self.batch_size)
+            label = f"{a[0]}:{a[1]} vs {b[0]}:{b[1]}"
+            yield {
+                "agents": [a, b],
+                "label": f"{label} (x{repeat})" if repeat > 1 else label,
+                "num_of_games": None,
+                "write_scoreboard": True,
+                "shards": self.shards,
+                "repeat": repeat,
+                "occurrence": chunk * self.batch_size,
+                "batch": position,
+            }
@@ -0,0 +1,189 @@
+"""
+Library entry points into the game match runners.
+
+Every ``game_scripts/A*_match.py`` exposes ``run_fixture()``, which loads the
+stored agents, plays one match, writes the per-match log and (optionally)
+the scoreboard rows, and returns a structured result dict. This module loads
+runner scripts as importable modules (their filenames contain dashes) and
+normalizes the call so the matchmaker and the enhancement pipeline can run
+fixtures without spawning a runner CLI per match.
+
+Result dicts returned by ``run_fixture`` carry, in addition to the runner's
+own ``run_match`` keys:
+    agents        -- ["folder:run", ...] in seat order
+    points        -- per-agent league points, aligned with agents (on success)
+    scores        -- per-agent tiebreak score, aligned with agents (on success)
+    games_played  -- number of games in the match
+    games_actual  -- games really played (fewer when SPRT stopped the match)
+    log_path      -- per-match log file under results/ ("" if none written)
+    move_timeouts -- agent moves that hit the move time limit, all agents
+    killed        -- "deadline" / "stall" if the game script was killed, else None
+"""
+
+import importlib.util
+import inspect
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from match_sprt import games_actual, sprt_games
+from zygote import MatchKilled
+
+
+def load_runner(script_path: Path | str) -> ModuleType:
+    """Import a match runner script as a module, caching it in sys.modules."""
+    script_path = Path(script_path).resolve()
+    module_name = "runner_" + script_path.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def call_run_fixture(
+    module: ModuleType,
+    agents: list[tuple[str, int]],
+    num_of_games: int | None = None,
+    write_scoreboard: bool = False,
+    shards: int = 1,
+    seed: int | None = None,
+) -> dict:
+    """Invoke ``module.run_fixture`` for a list of (folder, run) agents.
+
+    ``num_of_games`` has the meaning of the ``NUM_OF_GAMES_IN_A_MATCH``
+    environment variable; each runner converts it into its own per-match
+    game count via ``games_per_match`` (some games divide it by 10). Runners
+    without that hook (A4, first-to-N matches) ignore it, and likewise
+    ``shards``, since their game count is not known up front. ``seed`` is
+    passed to runners that take one (see ``takes_seed``).
+    """
+    num_games = None
+    if num_of_games is not None and hasattr(module, "games_per_match"):
+        num_games = module.games_per_match(num_of_games)
+    kwargs = {}
+    if shards > 1 and hasattr(module, "games_per_match"):
+        kwargs["shards"] = shards
+    if seed is not None and takes_seed(module):
+        kwargs["seed"] = seed
+
+    if len(agents) == 2:
+        return module.run_fixture(
+            agents[0], agents[1],
+            num_games=num_games,
+            write_scoreboard=write_scoreboard,
+            **kwargs,
+        )
+    return module.run_fixture(
+        agents, num_games=num_games, write_scoreboard=write_scoreboard, **kwargs
+    )
+
+
+def takes_seed(module: ModuleType) -> bool:
+    """Whether the runner's ``run_fixture`` can seed its games (not A4)."""
+    return "seed" in inspect.signature(module.run_fixture).parameters
+
+
+def record_scoreboard(module: ModuleType, res: dict) -> None:
+    """Write a successful ``run_fixture`` result's scoreboard rows.
+
+    For callers that ran the fixture with ``write_scoreboard=False``
+    elsewhere (a remote worker) and own the scoreboard themselves; the rows
+    are exactly the ones the runner would have written.
+    """
+    if not res.get("success"):
+        return
+    specs = [(folder, int(run)) for folder, run in (a.rsplit(":", 1) for a in res["agents"])]
+    module.update_match_scoreboard(res, specs, res["games_played"])
+
+
+def match_timeout(match_time_limit: float, default_games: int, num_games: int) -> float:
+    """Deadline for a match of *num_games* games.
+
+    ``MATCH_TIME_LIMIT`` is sized for a match of the runner's default game
+    count; longer matches (A3 qualifiers, enhancement matches) get a
+    proportionally longer deadline, shorter ones keep the full limit.
+    """
+    if default_games <= 0:
+        return match_time_limit
+    return match_time_limit * max(1.0, num_games / default_games)
+
+
+_TIMEOUTS_RE = re.compile(r"^\S+ Timeouts: (\d+)$", re.MULTILINE)
+
+
+def count_move_timeouts(log: str) -> int:
+    """Move timeouts of all agents in a game script's output.
+
+    Every engine prints an ``<agent> Timeouts: N`` line per agent in its
+    match summary.
+    """
+    return sum(int(n) for n in _TIMEOUTS_RE.findall(log or ""))
+
+
+def kill_reason(error: BaseException) -> str | None:
+    """``"deadline"`` / ``"stall"`` if *error* is a killed game script, else None."""
+    return error.reason if isinstance(error, MatchKilled) else None
+
+
+def report_kill(res: dict) -> None:
+    """Print a runner CLI's ``KILLED:<reason>`` line for a killed match.
+
+    The matchmaker's subprocess backend takes kills from these lines only,
+    never from error text an agent could have written.
+    """
+    if res.get("killed"):
+        print(f"KILLED:{res['killed']}", flush=True)
+
+
+def report_stop(res: dict, num_games: int) -> None:
+    """Print a runner CLI's ``SPRT_STOP`` line for a match SPRT stopped early.
+
+    Printed after the match's ``MINI:`` line so the matchmaker's subprocess
+    backend can tell stopped matches from complete ones.
+    """
+    played = games_actual(res, num_games)
+    if res.get("success") and played < num_games:
+        print(f"SPRT_STOP: {played} of {num_games} games", flush=True)
+
+
+def fixture_result(
+    res: dict,
+    agent_keys: list[str],
+    games_played: int,
+    log_path: Path | None,
+) -> dict:
+    """Attach the common result keys to a ``run_match`` dict.
+
+    Handles both result shapes: 2-player runners report ``agent1_points`` /
+    ``agent2_points``, the 6-player runner reports ``agent_points`` keyed by
+    ``Agent-<seat>``. The raw game log is dropped: it already lives in
+    ``log_path`` and would otherwise be shipped back to the caller for every
+    fixture. ``games_actual`` is the number of games really played, which
+    is below ``games_played`` when SPRT stopped the match early.
+    """
+    log = res.pop("log", "")
+    res.setdefault("move_timeouts", count_move_timeouts(log))
+    res["agents"] = agent_keys
+    res["games_played"] = res.get("games_played", games_played)
+    res["games_actual"] = sprt_games(log) or res["games_played"]
+    res["log_path"] = str(log_path) if log_path else ""
+    res.setdefault("killed", None)
+    if not res.get("success"):
+        return res
+    if "agent_points" in res:
+        seats = [f"Agent-{i}" for i in range(1, len(agent_keys) + 1)]
+        res["points"] = [res["agent_points"].get(k, 0) for k in seats]
+        res["scores"] = [res.get("agent_scores", {}).get(k, 0.0) for k in seats]
+    else:
+        res["points"] = [res.get("agent1_points", 0), res.get("agent2_points", 0)]
+        res["scores"] = [res.get("agent1_score", 0.0), res.get("agent2_score", 0.0)]
+    return res
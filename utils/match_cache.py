@@ -0,0 +1,111 @@
+"""
+Content-addressed cache of match outcomes.
+
+Re-running a tournament replays every pairing, even when neither agent nor
+the game changed. With ``--cache any`` or ``seeded``, every successful
+fixture result is stored under a key that covers everything that decides
+its outcome:
+
+    runner    -- SHA-256 of the runner script (the game engine is embedded)
+    agents    -- (folder, run, SHA-256 of the agent source) in seat order
+    games     -- NUM_OF_GAMES_IN_A_MATCH the fixture runs with
+    move      -- MOVE_TIME_LIMIT
+    seeds     -- seed policy: "random", or "seeded:<base>" with ``--seed``
+    occurrence-- k for the k-th fixture of the same agents in a tournament
+    sprt      -- MATCH_SPRT, only when early stopping is on
+
+so an edited agent, engine or setting never hits an old entry. Entries are
+JSON files ``results/match_cache/<game>/<key[:2]>/<key>.json`` holding the
+full result dict (the one ``run_fixture`` returns), which is all the
+runner's ``update_match_scoreboard`` needs to write the rows again.
+
+With random seeds a cached outcome is one sample of the match rather than
+the match itself; ``--cache seeded`` reuses entries only for runs with a
+deterministic ``--seed``.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from match_sprt import sprt_alpha
+
+CACHE_DIR = Path(__file__).parent.parent / "results" / "match_cache"
+AGENTS_DIR = Path(__file__).parent.parent / "agents"
+
+_file_hashes: dict[Path, str] = {}
+
+
+def file_sha(path: Path) -> str:
+    """SHA-256 of a file's bytes ("missing" if it does not exist), memoized."""
+    path = Path(path)
+    if path not in _file_hashes:
+        try:
+            _file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            _file_hashes[path] = "missing"
+    return _file_hashes[path]
+
+
+def seed_policy(seed: int | None) -> str:
+    return "random" if seed is None else f"seeded:{seed}"
+
+
+def fixture_seed(base: int, agents: list[tuple[str, int]], occurrence: int) -> int:
+    """Deterministic per-fixture seed derived from the tournament's ``--seed``."""
+    text = f"{base}|{agents}|{occurrence}"
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "big") >> 1
+
+
+class MatchCache:
+    """Cached fixture results of one game."""
+
+    def __init__(self, game_name: str, match_script: Path, root: Path | None = None) -> None:
+        self.game_name = game_name
+        self.dir = Path(root or CACHE_DIR) / game_name
+        self.runner_sha = file_sha(match_script)
+
+    def key(
+        self,
+        agents: list[tuple[str, int]],
+        games: int,
+        policy: str,
+        occurrence: int,
+    ) -> str:
+        material = {
+            "runner": self.runner_sha,
+            "agents": [
+                [folder, run, file_sha(AGENTS_DIR / folder / f"{self.game_name}_{run}.py")]
+                for folder, run in agents
+            ],
+            "games": games,
+            "move": os.getenv("MOVE_TIME_LIMIT", "1.0"),
+            "seeds": policy,
+            "occurrence": occurrence,
+        }
+        if sprt_alpha() is not None:
+            material["sprt"] = sprt_alpha()
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            res = json.loads(self._path(key).read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        res["cached"] = True
+        return res
+
+    def put(self, key: str, res: dict) -> None:
+        """Store a successful result (atomically; concurrent writers are fine)."""
+        if not res.get("success"):
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {k: v for k, v in res.items() if k not in ("cached", "label", "killed", "error")}
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry, default=str))
+        os.replace(tmp_path, path)
@@ -0,0 +1,489 @@
+"""
+Multi-host match execution: a coordinator and remote workers over TCP.
+
+The matchmaker's ``--backend cluster`` starts a ``ClusterPool``, which
+listens on a TCP port instead of starting local workers. Workers on any
+host with the same checkout (``agents/``, ``game_scripts/``, ``.env``)
+connect to it with::
+
+    python utils/match_cluster.py --connect coordinator-host:8765 --slots 8
+
+Each slot is one TCP connection and one warm local worker process (see
+``match_pool``). The protocol is newline-delimited JSON:
+
+    worker      -> coordinator   {"op": "hello", "host": ..., "slot": k, "nonce": w}
+    coordinator -> worker        {"op": "challenge", "nonce": c, "proof": ...}
+    worker      -> coordinator   {"op": "auth", "proof": ...}
+    coordinator -> worker        {"op": "run", "id": n, "script": ..., "agents": ...,
+                                  "num_of_games": ..., "repeat": ..., "shards": ...,
+                                  "seed": ...}
+    worker      -> coordinator   {"op": "result", "id": n, "results": [...]}
+
+Both ends prove they know ``MATCH_CLUSTER_TOKEN`` (set the same value in
+every host's ``.env``) without sending it: each side picks a random nonce
+and answers the other's with an HMAC-SHA256 of both nonces, keyed by the
+token and labelled with its role, so a proof cannot be replayed or
+reflected. A worker runs nothing for a peer that fails the challenge, and
+only runs ``A*_match.py`` scripts named by their bare basename in its own
+``game_scripts/``. The coordinator only accepts replies that answer the
+batch it sent: ``op`` ``result``, the batch's ``id``, and one result per
+fixture for exactly the batch's agents. Any other reply drops the slot and
+queues the batch again.
+
+Workers always run fixtures with ``write_scoreboard=False`` and ship the
+structured results back (per-match logs stay under ``results/`` on the
+worker host). The coordinator owns the scoreboard: it writes the rows of
+every successful fixture with the runner's own ``update_match_scoreboard``
+and journals it (see ``fixture_journal``). A batch whose worker disconnects
+mid-run is queued again, up to ``MAX_ATTEMPTS`` times; a result that
+arrives after the matchmaker gave up on the batch (its deadline passed) is
+dropped, so it never reaches the scoreboard. The slot a batch held past
+its deadline stays taken until the worker replies (or disconnects), so
+the coordinator never counts a busy worker as free.
+
+The coordinator listens on 127.0.0.1 unless given another host; use
+``--listen 0.0.0.0:8765`` to accept workers from other machines. Everything
+runs on one machine too: start the matchmaker with ``--backend cluster``
+and a few workers pointed at ``127.0.0.1:8765``.
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import socket
+import sys
+import traceback
+from itertools import count
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from fixture_journal import append_entry, result_entry
+from match_api import load_runner, record_scoreboard
+from match_pool import MatchWorkerPool
+
+GAME_SCRIPTS_DIR = Path(__file__).parent.parent / "game_scripts"
+
+DEFAULT_PORT = 8765
+# Dispatches of one batch before it is reported failed (worker crashes).
+MAX_ATTEMPTS = 3
+# Results carry per-agent stats; allow long lines.
+LINE_LIMIT = 16 * 1024 * 1024
+
+
+def cluster_token() -> str | None:
+    """Shared secret of coordinator and workers, from ``MATCH_CLUSTER_TOKEN``."""
+    return os.getenv("MATCH_CLUSTER_TOKEN", "").strip() or None
+
+
+def parse_address(address: str, default_host: str = "127.0.0.1") -> tuple[str, int]:
+    """``host:port``, ``host`` or ``:port`` -> (host, port)."""
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return host or default_host, int(port) if port else DEFAULT_PORT
+
+
+def _proof(token: str, role: str, *nonces: str) -> str:
+    """HMAC-SHA256 over *role* and *nonces*, keyed by the shared token."""
+    message = "|".join((role, *nonces)).encode()
+    return hmac.new(token.encode(), message, hashlib.sha256).hexdigest()
+
+
+def _valid_proof(proof, token: str, role: str, *nonces: str) -> bool:
+    return isinstance(proof, str) and hmac.compare_digest(
+        proof.encode(), _proof(token, role, *nonces).encode()
+    )
+
+
+async def _read_message(reader: asyncio.StreamReader) -> dict:
+    """Next JSON object from *reader*; ``{}`` for EOF or anything else."""
+    try:
+        message = json.loads(await reader.readline() or b"{}")
+    except json.JSONDecodeError:
+        return {}
+    return message if isinstance(message, dict) else {}
+
+
+def _script_path(name) -> Path:
+    """Runner script a coordinator asked for, or ValueError.
+
+    Only a bare ``A*_match.py`` basename of a script in ``GAME_SCRIPTS_DIR``
+    is accepted, never a path.
+    """
+    if (
+        not isinstance(name, str)
+        or Path(name).name != name
+        or not fnmatch.fnmatchcase(name, "A*_match.py")
+        or not (GAME_SCRIPTS_DIR / name).is_file()
+    ):
+        raise ValueError(f"refusing to run script {name!r}")
+    return GAME_SCRIPTS_DIR / name
+
+
+def _send(writer: asyncio.StreamWriter, message: dict) -> None:
+    writer.write((json.dumps(message, default=str) + "\n").encode())
+
+
+def _check_reply(job: dict, message: dict) -> list[dict]:
+    """The results of *message* if it answers *job*, else ValueError."""
+    if message.get("op") != "result" or message.get("id") != job["id"]:
+        raise ValueError(f"unexpected reply to batch {job['id']}")
+    results = message.get("results")
+    agents = [f"{f}:{r}" for f, r in job["request"]["agents"]]
+    if not isinstance(results, list) or len(results) != job["request"]["repeat"]:
+        raise ValueError(f"batch {job['id']} came back with the wrong number of results")
+    if any(not isinstance(res, dict) or res.get("agents") != agents for res in results):
+        raise ValueError(f"batch {job['id']} came back with results for other agents")
+    return results
+
+
+class _Capacity:
+    """Semaphore whose size is the number of connected worker slots.
+
+    Used by the matchmaker in place of ``asyncio.Semaphore(workers)``, so a
+    batch only leaves the queue (and starts its deadline) when a remote slot
+    is free to take it.
+    """
+
+    def __init__(self) -> None:
+        self._free = 0
+        self._changed = asyncio.Condition()
+
+    async def add(self, n: int) -> None:
+        async with self._changed:
+            self._free += n
+            self._changed.notify_all()
+
+    async def __aenter__(self) -> None:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._free > 0)
+            self._free -= 1
+
+    def hold(self) -> None:
+        """Take one permit out of circulation now.
+
+        If none is free the count goes negative, and the next permit
+        released pays it back instead of waking a waiter.
+        """
+        self._free -= 1
+
+    async def __aexit__(self, *exc) -> None:
+        await self.add(1)
+
+
+class ClusterPool:
+    """Coordinator side: the ``MatchWorkerPool`` interface over remote slots."""
+
+    def __init__(self, listen: str, scripts: list[Path], token: str) -> None:
+        self.host, self.port = parse_address(listen)
+        self.token = token
+        self.scripts = [str(Path(s).resolve()) for s in scripts]
+        self.capacity = _Capacity()
+        self.slots = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._ids = count(1)
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._started = asyncio.get_running_loop().create_task(self._serve())
+
+    async def _serve(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_slot, self.host, self.port, limit=LINE_LIMIT
+        )
+        print(f"Coordinator listening on {self.host}:{self.port}", flush=True)
+
+    async def _handle_slot(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one worker slot: hand it batches until it disconnects."""
+        hello = await _read_message(reader)
+        name = f"{hello.get('host', '?')}/{hello.get('slot', '?')}"
+        worker_nonce, nonce = str(hello.get("nonce") or ""), secrets.token_hex(16)
+        auth = {}
+        if hello.get("op") == "hello" and worker_nonce:
+            proof = _proof(self.token, "coordinator", worker_nonce, nonce)
+            _send(writer, {"op": "challenge", "nonce": nonce, "proof": proof})
+            await writer.drain()
+            auth = await _read_message(reader)
+        if auth.get("op") != "auth" or not _valid_proof(
+            auth.get("proof"), self.token, "worker", nonce, worker_nonce
+        ):
+            peer = writer.get_extra_info("peername")
+            print(f"Worker slot rejected: {name} from {peer} (bad hello or token)", flush=True)
+            writer.close()
+            return
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.slots += 1
+        self._writers.add(writer)
+        print(f"Worker slot connected: {name} ({self.slots} slots)", flush=True)
+        await self.capacity.add(1)
+
+        job = None
+        try:
+            while True:
+                job = await self._queue.get()
+                if job["future"].done():  # matchmaker gave up while it was queued
+                    continue
+                if not job["taken"].done():
+                    job["taken"].set_result(None)  # its deadline starts now
+                job["attempts"] += 1
+                job["idle"].clear()
+                try:
+                    _send(writer, {"op": "run", "id": job["id"], **job["request"]})
+                    await writer.drain()
+                    line = await reader.readline()
+                finally:
+                    job["idle"].set()  # the worker replied or is gone
+                if not line:
+                    raise ConnectionError("worker closed the connection")
+                results = _check_reply(job, json.loads(line))
+                if not job["future"].done():
+                    job["future"].set_result(results)
+                job = None
+        except (ConnectionError, OSError, ValueError, asyncio.IncompleteReadError) as e:
+            print(f"Worker slot lost: {name} ({e})", flush=True)
+        except asyncio.CancelledError:
+            pass  # event loop shutting down at the end of the tournament
+        finally:
+            self.slots -= 1
+            self._writers.discard(writer)
+            # Take this slot's permit out of circulation; if it is in use,
+            # the next batch to finish pays it back.
+            self.capacity.hold()
+            writer.close()
+            if job is not None and not job["future"].done():
+                if job["attempts"] < MAX_ATTEMPTS:
+                    self._queue.put_nowait(job)
+                else:
+                    job["future"].set_exception(
+                        ConnectionError(f"worker lost {job['attempts']} times running this batch")
+                    )
+
+    async def run_fixtures(
+        self,
+        script: Path | str,
+        agents: list[tuple[str, int]],
+        num_of_games: int | None = None,
+        write_scoreboard: bool = False,
+        repeat: int = 1,
+        shards: int = 1,
+        journal: tuple[str, dict] | None = None,
+        seed: int | None = None,
+        deadline: float | None = None,
+    ) -> list[dict]:
+        """Run a batch on the next free remote slot; same contract as the pool.
+
+        The ``deadline`` starts when a slot takes the batch. Scoreboard rows
+        and journal lines are written here, on the coordinator, when the
+        results come back.
+        """
+        await self._started
+        if num_of_games is None and os.getenv("NUM_OF_GAMES_IN_A_MATCH"):
+            # Workers may have another .env; play the coordinator's game count.
+            num_of_games = int(os.environ["NUM_OF_GAMES_IN_A_MATCH"])
+        loop = asyncio.get_running_loop()
+        future, taken = loop.create_future(), loop.create_future()
+        job = {
+            "id": next(self._ids),
+            "attempts": 0,
+            "future": future,
+            "taken": taken,
+            "idle": asyncio.Event(),
+            "request": {
+                "script": Path(script).name,
+                "agents": [list(a) for a in agents],
+                "num_of_games": num_of_games,
+                "repeat": repeat,
+                "shards": shards,
+                "seed": seed,
+            },
+        }
+        self._queue.put_nowait(job)
+        try:
+            await taken
+            results = await asyncio.wait_for(future, deadline)
+        except TimeoutError:
+            # The worker is still playing the batch: keep its slot taken
+            # after the matchmaker releases it, until the worker replies.
+            self.capacity.hold()
+            task = loop.create_task(self._release_when_idle(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            raise
+        finally:
+            future.cancel()  # no-op once done; otherwise a late result is dropped
+        module = load_runner(script)
+        for res in results:
+            if write_scoreboard and res.get("success"):
+                try:
+                    record_scoreboard(module, res)
+                except Exception:
+                    res["success"] = False
+                    res["error"] = "scoreboard write failed:\n" + traceback.format_exc()[-300:]
+            if journal is not None:
+                append_entry(journal[0], result_entry(journal[1], res))
+        return results
+
+    async def _release_when_idle(self, job: dict) -> None:
+        await job["idle"].wait()
+        await self.capacity.add(1)
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """Stop accepting workers and disconnect the connected ones (they exit)."""
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if not job["future"].done():
+                job["future"].cancel()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+async def _connect(host: str, port: int, wait: float):
+    """Open a connection, retrying for up to *wait* seconds."""
+    loop = asyncio.get_running_loop()
+    give_up = loop.time() + wait
+    while True:
+        try:
+            return await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        except OSError:
+            if loop.time() >= give_up:
+                raise
+            await asyncio.sleep(1)
+
+
+async def run_slot(
+    host: str, port: int, pool: MatchWorkerPool, slot: int, wait: float, token: str
+) -> int:
+    """Serve batches from the coordinator on one connection. Returns batches run.
+
+    The coordinator must answer the hello with a valid proof of the token
+    before this slot proves itself in turn and accepts any batch.
+    """
+    reader, writer = await _connect(host, port, wait)
+    nonce = secrets.token_hex(16)
+    _send(writer, {"op": "hello", "host": socket.gethostname(), "slot": slot, "nonce": nonce})
+    await writer.drain()
+    batches = 0
+    try:
+        challenge = await _read_message(reader)
+        coordinator_nonce = str(challenge.get("nonce") or "")
+        if (
+            challenge.get("op") != "challenge"
+            or not coordinator_nonce
+            or not _valid_proof(
+                challenge.get("proof"), token, "coordinator", nonce, coordinator_nonce
+            )
+        ):
+            print(f"[slot {slot}] coordinator failed the token challenge; disconnecting", flush=True)
+            return 0
+        _send(writer, {"op": "auth", "proof": _proof(token, "worker", coordinator_nonce, nonce)})
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            if message.get("op") != "run":
+                continue
+            try:
+                script = _script_path(message.get("script"))
+            except ValueError as e:
+                print(f"[slot {slot}] {e}; disconnecting", flush=True)
+                break
+            agents = [tuple(a) for a in message["agents"]]
+            print(f"[slot {slot}] {' vs '.join(f'{f}:{r}' for f, r in agents)}", flush=True)
+            results = await pool.run_fixtures(
+                script, agents, message["num_of_games"], False,
+                message.get("repeat", 1), message.get("shards", 1),
+                seed=message.get("seed"),
+            )
+            _send(writer, {"op": "result", "id": message["id"], "results": results})
+            await writer.drain()
+            batches += 1
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        writer.close()
+    return batches
+
+
+async def run_worker(
+    address: str, slots: int, wait: float, token: str, pin_cpus: bool = False
+) -> None:
+    host, port = parse_address(address, default_host="127.0.0.1")
+    scripts = sorted(GAME_SCRIPTS_DIR.glob("A*_match.py"))
+    pool = MatchWorkerPool(slots, scripts, pin_cpus=pin_cpus)
+    if pool.pinning is not None:
+        print(f"CPU pinning: {pool.pinning.describe()}", flush=True)
+    pool.warm()  # fork the workers before any coordinator socket exists
+    try:
+        done = await asyncio.gather(*(run_slot(host, port, pool, k, wait, token) for k in range(slots)))
+    finally:
+        pool.shutdown(cancel_pending=True)
+    print(f"Coordinator closed the connection; ran {sum(done)} batches.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Remote match worker: run fixtures served by a matchmaker "
+        "started with --backend cluster"
+    )
+    parser.add_argument(
+        "--connect",
+        required=True,
+        metavar="HOST:PORT",
+        help=f"Coordinator address (default port {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--slots",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Fixtures run concurrently on this host (default: CPU count)",
+    )
+    parser.add_argument(
+        "--wait",
+        type=float,
+        default=60,
+        metavar="SECONDS",
+        help="Keep retrying the coordinator this long before giving up (default: 60)",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each slot's worker to its own core set (cgroup v2 quota where writable)",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    os.environ.setdefault("MATCH_STALL_LIMIT", "600")
+    token = cluster_token()
+    if token is None:
+        print("ERROR: set MATCH_CLUSTER_TOKEN in .env to the coordinator's token")
+        sys.exit(1)
+    try:
+        asyncio.run(
+            run_worker(args.connect, max(1, args.slots), args.wait, token, args.pin_cpus)
+        )
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except OSError as e:
+        print(f"ERROR: cannot reach coordinator {args.connect}: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Warm worker pool for executing match fixtures.
+
+Launching ``python <runner> --agent ...`` per fixture pays interpreter
+startup plus the runner's dotenv/openai/agent-loader imports every time.
+This pool keeps ``workers`` long-lived processes that import each runner
+module once (see ``match_api.load_runner``) and then call its
+``run_fixture()`` directly for every fixture routed to them. Log files and
+scoreboard writes are the ones the runner CLI would produce; the result
+comes back as the structured dict documented in ``match_api``.
+
+With ``zygote_imports`` each worker additionally becomes a zygote (see
+``zygote.enable``): agent imports are preloaded, the heap is frozen, and
+every game script is forked from the worker instead of started cold.
+
+``SubinterpreterPool`` offers the same interface with workers that run
+each game script in an isolated subinterpreter of their own process (see
+``subinterp``) instead of a child process.
+
+A batch still running at its deadline gets its worker recycled: the
+worker is stopped (SIGTERM, which kills the game script it is waiting on,
+then SIGKILL after ``RECYCLE_GRACE`` seconds) and ``multiprocessing.Pool``
+starts a fresh one in its place, so the slot is free again at once.
+
+With ``pin_cpus`` every worker process is pinned to its own core set, with
+a cgroup v2 CPU quota where possible (see ``cpu_pinning``).
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import signal
+import time
+import traceback
+from multiprocessing.pool import AsyncResult
+from pathlib import Path
+
+import subinterp
+import zygote
+from cpu_pinning import CpuPinning
+from fixture_journal import append_entry, result_entry
+from logging_config import setup_logging
+from match_api import call_run_fixture, load_runner
+
+logger = setup_logging("match-pool")
+
+# Seconds a recycled worker gets to exit on SIGTERM before it is killed.
+RECYCLE_GRACE = 5
+
+# Set in each worker by _warm_worker: its pinning slot, and the queue it
+# announces every batch it starts on as (batch id, pid, slot).
+_SLOT: int | None = None
+_STARTED = None
+
+
+def _stop_worker(signum, frame) -> None:
+    raise SystemExit(128 + signum)
+
+
+def _warm_worker(
+    script_paths: list[str],
+    zygote_imports: list[str] | None,
+    pinning: CpuPinning | None = None,
+    slots=None,
+    started=None,
+    subinterpreters: bool = False,
+) -> None:
+    """Pool initializer: import every runner module once per worker.
+
+    With *pinning*, the worker first takes a slot from the *slots* queue
+    and pins itself (and so every game script it starts) to that slot.
+    SIGTERM unwinds the worker, so the game script it runs is killed too.
+    """
+    global _SLOT, _STARTED
+    signal.signal(signal.SIGTERM, _stop_worker)
+    _STARTED = started
+    if pinning is not None:
+        _SLOT = slots.get()
+        pinning.apply(_SLOT)
+    for script_path in script_paths:
+        try:
+            load_runner(script_path)
+        except Exception:
+            # A broken runner only fails its own fixtures, not the pool.
+            logger.exception("Could not load %s", script_path)
+    if zygote_imports is not None:
+        zygote.enable(zygote_imports)
+    if subinterpreters:
+        subinterp.enable()
+
+
+def _run_fixture_job(
+    batch_id: int,
+    script_path: str,
+    agents: list[tuple[str, int]],
+    num_of_games: int | None,
+    write_scoreboard: bool,
+    repeat: int = 1,
+    shards: int = 1,
+    journal: tuple[str, dict] | None = None,
+    seed: int | None = None,
+) -> list[dict]:
+    """Worker-side body of a batch: *repeat* back-to-back fixtures. Never raises.
+
+    With *journal* = ``(path, entry)`` every fixture's result is appended to
+    that fixture journal right after its scoreboard rows are written. Each
+    result carries ``seconds``, the time this worker spent on the fixture.
+    """
+    if _STARTED is not None:
+        _STARTED.put((batch_id, os.getpid(), _SLOT))
+    results = []
+    for _ in range(repeat):
+        started = time.monotonic()
+        try:
+            module = load_runner(script_path)
+            res = call_run_fixture(module, agents, num_of_games, write_scoreboard, shards, seed)
+        except Exception:
+            logger.exception("Fixture %s failed in the worker", agents)
+            res = {
+                "success": False,
+                "agents": [f"{f}:{r}" for f, r in agents],
+                "error": traceback.format_exc()[-500:],
+            }
+        res["seconds"] = time.monotonic() - started
+        if journal is not None:
+            try:
+                append_entry(journal[0], result_entry(journal[1], res))
+            except OSError:
+                traceback.print_exc()
+        results.append(res)
+    return results
+
+
+class MatchWorkerPool:
+    """Fixed-size pool of warm workers that run match fixtures in-process."""
+
+    def __init__(
+        self,
+        workers: int,
+        scripts: list[Path],
+        zygote_imports: set[str] | None = None,
+        pin_cpus: bool = False,
+        subinterpreters: bool = False,
+    ) -> None:
+        self.scripts = [str(Path(s).resolve()) for s in scripts]
+        self._free = asyncio.Semaphore(workers)
+        self._ids = itertools.count()
+        self._running: dict[int, tuple[int, int | None]] = {}  # pid -> (batch id, slot)
+        self._live: dict[int, AsyncResult] = {}
+        preload = sorted(zygote_imports) if zygote_imports is not None else None
+        context = multiprocessing.get_context("fork")
+        self.pinning = CpuPinning(workers) if pin_cpus else None
+        self._slots = None
+        if self.pinning is not None:
+            self._slots = context.SimpleQueue()
+            for k in range(workers):
+                self._slots.put(k)
+        self._started = context.SimpleQueue()
+        # multiprocessing.Pool (not ProcessPoolExecutor) replaces a worker
+        # that dies without breaking the others' batches.
+        self._executor = context.Pool(
+            workers,
+            initializer=_warm_worker,
+            initargs=(
+                self.scripts, preload, self.pinning, self._slots, self._started, subinterpreters
+            ),
+        )
+
+    async def run_fixtures(
+        self,
+        script: Path | str,
+        agents: list[tuple[str, int]],
+        num_of_games: int | None = None,
+        write_scoreboard: bool = False,
+        repeat: int = 1,
+        shards: int = 1,
+        journal: tuple[str, dict] | None = None,
+        seed: int | None = None,
+        deadline: float | None = None,
+    ) -> list[dict]:
+        """Run *repeat* fixtures of ``script`` back to back on the next free worker.
+
+        A batch occupies one worker, so the agents are loaded and the game
+        script compiled once per batch rather than once per fixture. With
+        ``shards`` > 1 the worker plays each match's games in that many
+        child processes (see ``match_shards``). With ``journal`` the worker
+        appends each result to that fixture journal (see ``fixture_journal``).
+        ``seed`` seeds the match's games (runners that support it).
+        Returns one result dict per fixture, in order.
+
+        A batch is only submitted once a worker is free, so its ``deadline``
+        (seconds, ``asyncio.TimeoutError`` when it passes) starts when a
+        worker takes it. A worker whose batch runs past its deadline is
+        recycled, and its slot is free for the next batch right away.
+        """
+        loop = asyncio.get_running_loop()
+        await self._free.acquire()
+        batch_id = next(self._ids)
+        future = loop.create_future()
+
+        def settle(result=None, error=None) -> None:
+            self._live.pop(batch_id, None)
+            if future.done():
+                return  # recycled after its deadline; the slot is already free
+            self._free.release()
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+        self._live[batch_id] = self._executor.apply_async(
+            _run_fixture_job,
+            (
+                batch_id,
+                str(Path(script).resolve()),
+                list(agents),
+                num_of_games,
+                write_scoreboard,
+                repeat,
+                shards,
+                journal,
+                seed,
+            ),
+            callback=lambda result: loop.call_soon_threadsafe(settle, result),
+            error_callback=lambda error: loop.call_soon_threadsafe(settle, None, error),
+        )
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), deadline)
+        except TimeoutError:
+            self._recycle(batch_id)
+            if not future.done():
+                future.cancel()
+                self._live.pop(batch_id, None)
+                self._free.release()
+            raise
+
+    def _recycle(self, batch_id: int) -> None:
+        """Stop the worker running *batch_id*; the pool starts a new one."""
+        while not self._started.empty():
+            started_id, pid, slot = self._started.get()
+            self._running[pid] = (started_id, slot)
+        pid = next((p for p, (b, _) in self._running.items() if b == batch_id), None)
+        if pid is None:
+            return
+        _, slot = self._running.pop(pid)
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        asyncio.get_running_loop().call_later(RECYCLE_GRACE, _kill_worker, pid)
+        if slot is not None:
+            self._slots.put(slot)  # for the replacement worker
+
+    def warm(self) -> None:
+        """Make sure every worker process is up before continuing.
+
+        Forked workers inherit the parent's open descriptors; start them
+        before opening sockets that must close when this process exits.
+        """
+        self._executor.apply(int)
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """Stop the workers after the batches they are running.
+
+        Batches are only submitted to a free worker, so none are pending;
+        *cancel_pending* is accepted for the executor-style interface.
+        Always waits for the worker processes to exit, and never for a
+        batch whose worker was recycled.
+        """
+        for result in list(self._live.values()):
+            result.wait()
+        self._executor.terminate()
+        self._executor.join()
+        if self.pinning is not None:
+            self.pinning.remove()
+
+
+def _kill_worker(pid: int) -> None:
+    """SIGKILL a recycled worker still alive after ``RECYCLE_GRACE``."""
+    if any(child.pid == pid for child in multiprocessing.active_children()):
+        os.kill(pid, signal.SIGKILL)
+
+
+class SubinterpreterPool(MatchWorkerPool):
+    """Worker pool whose fixtures run their game scripts in subinterpreters.
+
+    The subinterpreters live in the forked workers, not in the matchmaker,
+    so agent code never runs in the matchmaker process and a worker past
+    its deadline is recycled like any other. Each game script gets a fresh
+    isolated subinterpreter instead of a child process. Matches whose
+    imports cannot load in a subinterpreter transparently run in a cold
+    subprocess instead.
+    """
+
+    def __init__(self, workers: int, scripts: list[Path], pin_cpus: bool = False) -> None:
+        super().__init__(workers, scripts, pin_cpus=pin_cpus, subinterpreters=True)
@@ -0,0 +1,182 @@
+"""
+Sharded execution of one match's games.
+
+A match script plays games 1..NUM_GAMES one after another in its ``main()``
+loop, so a 500-game A3 qualifier or enhancement match runs on a single core
+and dominates the tail of a tournament. ``run_game_script_sharded()`` splits
+the game range into K contiguous shards and runs K copies of the script at
+once, each with its header constants rewritten:
+
+    NUM_GAMES         games in this shard
+    FIRST_GAME        number of the shard's first game (keeps seat rotation)
+    MATCH_SEED        game ``i`` reseeds ``random`` with ``MATCH_SEED + i``
+    SHARD_STATS_ONLY  print ``SHARD_STATS:<match_stats>`` instead of a summary
+
+The shards' ``match_stats`` are summed per agent and field, and one more copy
+of the script plays zero games starting from ``MERGED_STATS``. The summary
+(``RESULT:`` / ``SCORE:`` / ``WINS:`` / ``STATS:`` / match statistics) is
+therefore printed by the game's own code, exactly as a serial run prints it,
+and the returned ``CompletedProcess`` (game logs in game order followed by
+that summary) is parsed by the runners like any other run.
+
+Every shard gets its own seed range: with the same ``seed`` a sharded and a
+serial run seed each game identically. Fractional fields (A3's shared
+placements) are summed per shard, so they can differ from a serial run in
+the last floating-point digit.
+"""
+
+import ast
+import os
+import random
+import re
+import subprocess
+import time
+
+from match_sprt import sprt_alpha
+from zygote import run_game_script, run_game_scripts
+
+SHARD_STATS_PREFIX = "SHARD_STATS:"
+
+
+def supports_shards(source: str) -> bool:
+    """Whether a generated match script has the shard header constants."""
+    return re.search(r"^FIRST_GAME = ", source, re.MULTILINE) is not None
+
+
+def shard_ranges(num_games: int, shards: int) -> list[tuple[int, int]]:
+    """Split games 1..num_games into at most *shards* ``(first_game, count)`` ranges."""
+    shards = max(1, min(shards, num_games))
+    base, extra = divmod(num_games, shards)
+    ranges = []
+    first = 1
+    for k in range(shards):
+        count = base + (1 if k < extra else 0)
+        ranges.append((first, count))
+        first += count
+    return ranges
+
+
+def merge_match_stats(parts: list[dict]) -> dict:
+    """Sum per-agent ``match_stats`` dicts field by field, keeping key order."""
+    merged: dict[str, dict] = {}
+    for stats in parts:
+        for agent, fields in stats.items():
+            totals = merged.setdefault(agent, {})
+            for key, value in fields.items():
+                totals[key] = totals.get(key, 0) + value
+    return merged
+
+
+def _set_constants(source: str, **values) -> str:
+    """Rewrite the first ``NAME = ...`` line of each constant in the header."""
+    for name, value in values.items():
+        line = f"{name} = {value!r}"
+        source, count = re.subn(
+            rf"^{name} = .*$", lambda _, line=line: line, source, count=1, flags=re.MULTILINE
+        )
+        if not count:
+            raise ValueError(f"match script defines no {name}")
+    return source
+
+
+def _split_shard_output(stdout: str) -> tuple[str, dict | None]:
+    """Separate a shard's game log from its trailing SHARD_STATS line."""
+    idx = stdout.rfind("\n" + SHARD_STATS_PREFIX)
+    if idx < 0 and not stdout.startswith(SHARD_STATS_PREFIX):
+        return stdout, None
+    start = idx + 1 if idx >= 0 else 0
+    line = stdout[start + len(SHARD_STATS_PREFIX):].splitlines()[0]
+    try:
+        return stdout[:start], ast.literal_eval(line)
+    except (ValueError, SyntaxError):
+        return stdout, None
+
+
+def _run_sources(
+    script_path: str, sources: list[str], timeout: float | None
+) -> list[subprocess.CompletedProcess]:
+    """Write each variant of *script_path* next to it and run them concurrently."""
+    base = script_path.removesuffix(".py")
+    paths = [f"{base}_shard{k}.py" for k in range(len(sources))]
+    try:
+        for path, source in zip(paths, sources):
+            with open(path, "w") as f:
+                f.write(source)
+        return run_game_scripts(paths, timeout)
+    finally:
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def run_game_script_sharded(
+    script_path: str,
+    shards: int = 1,
+    timeout: float | None = None,
+    seed: int | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a match script with its games split across *shards* processes.
+
+    Drop-in for ``zygote.run_game_script``; with ``shards <= 1`` and no
+    ``seed`` it is exactly that call. Scripts without the shard header (A4
+    plays first-to-N, not a fixed game count) always run serially.
+    ``timeout`` bounds the whole match, shards and summary included.
+
+    With ``MATCH_SPRT`` set, a serial run of a script that has the
+    ``SPRT_ALPHA`` constant may stop early (see ``match_sprt``); sharded
+    runs always play every game.
+    """
+    alpha = sprt_alpha()
+    if shards <= 1 and seed is None and alpha is None:
+        return run_game_script(script_path, timeout)
+    with open(script_path) as f:
+        source = f.read()
+    if not supports_shards(source):
+        return run_game_script(script_path, timeout)
+    if shards <= 1 and alpha is not None and re.search(r"^SPRT_ALPHA = ", source, re.MULTILINE):
+        source = _set_constants(source, SPRT_ALPHA=alpha)
+        if seed is None:
+            return _run_sources(script_path, [source], timeout)[0]
+
+    num_games = int(re.search(r"^NUM_GAMES = (\d+)", source, re.MULTILINE).group(1))
+    ranges = shard_ranges(num_games, shards)
+    if seed is None:
+        # Disjoint per-game seeds across shards, fresh for every match.
+        seed = random.randrange(2**31)
+    if len(ranges) == 1:
+        return _run_sources(script_path, [_set_constants(source, MATCH_SEED=seed)], timeout)[0]
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    shard_sources = [
+        _set_constants(
+            source,
+            NUM_GAMES=count,
+            FIRST_GAME=first,
+            MATCH_SEED=seed,
+            SHARD_STATS_ONLY=True,
+        )
+        for first, count in ranges
+    ]
+    shard_runs = _run_sources(script_path, shard_sources, timeout)
+
+    logs, parts = [], []
+    for run in shard_runs:
+        if run.returncode != 0:
+            return run
+        log, stats = _split_shard_output(run.stdout)
+        if stats is None:
+            return subprocess.CompletedProcess(
+                run.args, 1, run.stdout, run.stderr + "Shard printed no SHARD_STATS line.\n"
+            )
+        logs.append(log)
+        parts.append(stats)
+
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    summary_source = _set_constants(source, NUM_GAMES=0, MERGED_STATS=merge_match_stats(parts))
+    summary = _run_sources(script_path, [summary_source], remaining)[0]
+    return subprocess.CompletedProcess(
+        ["python", script_path],
+        summary.returncode,
+        "".join(logs) + summary.stdout,
+        "".join(run.stderr for run in shard_runs) + summary.stderr,
+    )
@@ -0,0 +1,88 @@
+"""
+Sequential early stopping of 2-player matches (SPRT).
+
+A match plays ``NUM_GAMES`` games even when one agent won every game so
+far by crash or forfeit. With ``MATCH_SPRT`` set to an error rate (e.g.
+``0.05``), the generated match script runs a sequential probability ratio
+test after every seat pair of games (two games, so both agents have moved
+first equally often) and stops once a winner is decided.
+
+The test looks at decisive games only (draws carry no information about
+who is stronger). For each agent it compares
+
+    H0: the agent wins a decisive game with probability 0.5
+    H1: the agent wins a decisive game with probability ``SPRT_P1`` (0.75)
+
+and stops when the log-likelihood ratio for either agent reaches
+``log(2 / alpha)``. The likelihood ratio is a martingale under H0, so
+(Ville's inequality) the chance that two equally strong agents ever stop
+the match, checked after every pair of games, is at most ``alpha``.
+Against an agent that loses every game this takes 10 games at
+``alpha = 0.05``.
+
+An early-stopped match reports the totals it actually observed; nothing is
+extrapolated. The games played are printed as ``SPRT_STOP: <played> of
+<NUM_GAMES> games`` in the match log, returned by the runners as
+``games_actual`` and written to the scoreboard in place of ``NUM_GAMES``,
+with the match counted in the scoreboard's "Stopped" column.
+
+Only serial matches of the fixed-length 2-player runners are tested:
+sharded matches (``--shards`` > 1), A3 (6 players) and A4 (first to N
+points) always play in full. ``SPRT_CODE`` is the source the runners
+embed in their match scripts; ``run_game_script_sharded`` sets its
+``SPRT_ALPHA`` header constant from ``MATCH_SPRT``.
+"""
+
+import os
+import re
+
+SPRT_P1 = 0.75
+
+SPRT_CODE = f'''
+import math
+
+SPRT_P1 = {SPRT_P1}
+
+
+def sprt_stop(match_stats, played):
+    """Whether the games so far decide the winner (see utils/match_sprt.py)."""
+    if SPRT_ALPHA is None or played % 2:
+        return False
+    a, b = list(match_stats.values())[:2]
+    win = math.log(SPRT_P1 / 0.5)
+    loss = math.log((1 - SPRT_P1) / 0.5)
+    bound = math.log(2 / SPRT_ALPHA)
+    llr_a = a["wins"] * win + b["wins"] * loss
+    llr_b = b["wins"] * win + a["wins"] * loss
+    return max(llr_a, llr_b) >= bound
+
+
+def sprt_finish(match_stats, played):
+    """Report how many games an early-stopped match played."""
+    if SPRT_ALPHA is None or played == 0 or played >= NUM_GAMES:
+        return
+    print(f"SPRT_STOP: {{played}} of {{NUM_GAMES}} games")
+'''
+
+_STOP_RE = re.compile(r"^SPRT_STOP: (\d+) of \d+ games", re.MULTILINE)
+
+
+def sprt_alpha() -> float | None:
+    """Error rate from ``MATCH_SPRT``, or None when early stopping is off."""
+    value = os.getenv("MATCH_SPRT", "").strip()
+    if not value or float(value) <= 0:
+        return None
+    return min(float(value), 0.5)
+
+
+def sprt_games(log: str) -> int | None:
+    """Games actually played by an early-stopped match, from its output."""
+    match = _STOP_RE.search(log or "")
+    return int(match.group(1)) if match else None
+
+
+def games_actual(res: dict, num_games: int) -> int:
+    """Games a match result really played: fewer than *num_games* if SPRT stopped it."""
+    if res.get("games_actual"):
+        return res["games_actual"]
+    return sprt_games(res.get("log", "")) or num_games
@@ -0,0 +1,117 @@
+"""
+Live agent ratings with uncertainty, for information-driven pairing.
+
+``RatingTable`` keeps a Glicko-style Gaussian estimate per agent: a rating
+``mu`` (Elo scale, 1500 to start) and its variance ``var`` (rating
+deviation squared, 350^2 to start). A finished match is one observation:
+agent A's share of the match points, ``pts_a / (pts_a + pts_b)``, updates
+both agents as a (fractional) Glicko game result and shrinks their
+variances.
+
+The expected information of pairing A with B is
+
+    p (1 - p) (var_a + var_b)
+
+with ``p`` the predicted share of A: largest for close ratings (p near
+0.5) and uncertain agents, small for lopsided pairings whose result is
+already known. ``rank_confidence`` is the expected fraction, under the
+current estimates, of agent pairs that the leaderboard orders correctly.
+"""
+
+import math
+from collections import Counter
+from typing import Callable, Hashable
+
+START_RATING = 1500.0
+START_DEVIATION = 350.0
+# Smallest deviation a rating keeps, so agents never become "certain".
+MIN_DEVIATION = 30.0
+# Pairs considered per agent: its neighbours within this many places.
+PAIR_WINDOW = 16
+
+_Q = math.log(10) / 400
+
+
+def _g(var: float) -> float:
+    return 1 / math.sqrt(1 + 3 * _Q * _Q * var / math.pi ** 2)
+
+
+def match_share(points_a: float, points_b: float) -> float:
+    """A's share of a match's points (0.5 when neither scored)."""
+    points_a, points_b = max(points_a, 0.0), max(points_b, 0.0)
+    if points_a + points_b <= 0:
+        return 0.5
+    return points_a / (points_a + points_b)
+
+
+class RatingTable:
+    """Gaussian rating estimates of a set of agents."""
+
+    def __init__(self, agents: list[Hashable]) -> None:
+        self.mu = {a: START_RATING for a in agents}
+        self.var = {a: START_DEVIATION ** 2 for a in agents}
+        self.matches: Counter = Counter()
+
+    def expected(self, a: Hashable, b: Hashable) -> float:
+        """Predicted share of A against B, allowing for both uncertainties."""
+        g = _g(self.var[a] + self.var[b])
+        return 1 / (1 + 10 ** (-g * (self.mu[a] - self.mu[b]) / 400))
+
+    def information(self, a: Hashable, b: Hashable) -> float:
+        p = self.expected(a, b)
+        return p * (1 - p) * (self.var[a] + self.var[b])
+
+    def update(self, a: Hashable, b: Hashable, share_a: float) -> None:
+        """Apply one match in which A took *share_a* of the points."""
+        old = {x: (self.mu[x], self.var[x]) for x in (a, b)}
+        for x, y, score in ((a, b, share_a), (b, a, 1 - share_a)):
+            (mu_x, var_x), (mu_y, var_y) = old[x], old[y]
+            g = _g(var_y)
+            e = 1 / (1 + 10 ** (-g * (mu_x - mu_y) / 400))
+            d2 = 1 / (_Q * _Q * g * g * e * (1 - e))
+            var = max(1 / (1 / var_x + 1 / d2), MIN_DEVIATION ** 2)
+            self.mu[x] = mu_x + _Q * var * g * (score - e)
+            self.var[x] = var
+            self.matches[x] += 1
+
+    def ranked(self) -> list[Hashable]:
+        return sorted(self.mu, key=self.mu.get, reverse=True)
+
+    def rank_confidence(self) -> float:
+        """Expected fraction of agent pairs that the leaderboard orders correctly."""
+        agents = list(self.mu)
+        if len(agents) < 2:
+            return 1.0
+        total = 0.0
+        for i, a in enumerate(agents):
+            for b in agents[i + 1 :]:
+                z = abs(self.mu[a] - self.mu[b]) / math.sqrt(self.var[a] + self.var[b])
+                total += 0.5 * (1 + math.erf(z / math.sqrt(2)))
+        return total / (len(agents) * (len(agents) - 1) / 2)
+
+    def best_pair(
+        self,
+        allowed: Callable[[Hashable, Hashable], bool],
+        busy: Counter | None = None,
+    ) -> tuple[Hashable, Hashable] | None:
+        """Allowed pair with the most expected information.
+
+        Only neighbours within ``PAIR_WINDOW`` places are compared (pairs
+        further apart are lopsided), falling back to every pair. Agents
+        with matches in flight (*busy*) are discounted, since their
+        pending results are not in the estimates yet.
+        """
+        busy = busy or Counter()
+        ranked = self.ranked()
+        for window in (PAIR_WINDOW, len(ranked)):
+            best, best_gain = None, 0.0
+            for i, a in enumerate(ranked):
+                for b in ranked[i + 1 : i + 1 + window]:
+                    if not allowed(a, b):
+                        continue
+                    gain = self.information(a, b) / (1 + busy[a] + busy[b])
+                    if gain > best_gain:
+                        best, best_gain = (a, b), gain
+            if best is not None:
+                return best
+        return None
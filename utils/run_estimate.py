@@ -0,0 +1,95 @@
+"""
+Wall-time and CPU-hour estimate of a tournament, for ``--dry-run``.
+
+Sizing a run (``--same_opponent_match``, ``NUM_OF_GAMES_IN_A_MATCH``,
+``--workers``, machines) takes more than a fixture count. ``run_estimate``
+replays the batches in start order on *workers* slots, as the matchmaker
+dispatches them, each taking its expected wall time from
+``FixtureDurations``. Durations are recorded per game, so a different
+``NUM_OF_GAMES_IN_A_MATCH`` scales the history. The estimate reports:
+
+    wall       -- when the last slot finishes
+    cpu_hours  -- the summed batch times (a match runs on one core)
+    straggler  -- the batch that finishes last, with its expected start:
+                  the critical path of the run
+
+A sharded match (``shards`` > 1) takes a ``shards``-th of its one-process
+time as wall time (``batch_estimate``) and counts its full time as work.
+
+Groups that never played are estimated from their agents' averages (see
+``FixtureDurations.estimate``); agents without any history count as the
+mean of all recorded groups. ``calibration_groups`` picks short fixtures
+that give every agent without history a measurement first
+(``matchmaker.py --dry-run --calibrate``).
+"""
+
+import heapq
+import random
+from collections.abc import Callable, Iterable
+
+from fixture_durations import FixtureDurations
+from time_budget import batch_estimate
+
+# Games per calibration fixture: one per seat of a 2-player game.
+CALIBRATION_GAMES = 2
+
+
+def run_estimate(
+    batches: Iterable[dict],
+    games: Callable[[dict], int],
+    durations: FixtureDurations,
+    workers: int,
+) -> dict | None:
+    """Simulate *batches* (``games(batch)`` games per fixture) on *workers* slots.
+
+    Returns ``wall`` and ``work`` (seconds), ``cpu_hours``, ``batches``,
+    ``known`` (batches whose agent group has its own history) and
+    ``straggler`` (``label``, ``start``, ``seconds``), or None without any
+    recorded durations.
+    """
+    if not durations.groups:
+        return None
+    slots = [0.0] * max(1, workers)
+    work, count, known = 0.0, 0, 0
+    straggler = {"label": None, "start": 0.0, "seconds": 0.0}
+    for batch in batches:
+        wall = batch_estimate(durations, batch, games(batch)) or 0.0
+        start = heapq.heapreplace(slots, slots[0] + wall)
+        if start + wall >= straggler["start"] + straggler["seconds"]:
+            straggler = {"label": batch["label"], "start": start, "seconds": wall}
+        work += wall * max(1, batch.get("shards", 1))
+        count += 1
+        known += durations.known(batch["agents"])
+    return {
+        "wall": max(slots),
+        "work": work,
+        "cpu_hours": work / 3600,
+        "batches": count,
+        "known": known,
+        "straggler": straggler,
+    }
+
+
+def calibration_groups(
+    agents: dict[str, list[int]], players: int, durations: FixtureDurations
+) -> list[list[tuple[str, int]]]:
+    """Agent groups that measure every agent without recorded durations.
+
+    Agents without history are grouped with each other where their models
+    differ, and groups are filled up with other agents; each agent without
+    history plays exactly one group.
+    """
+    flat = [(folder, run) for folder, runs in agents.items() for run in runs]
+    pending = [a for a in flat if f"{a[0]}:{a[1]}" not in durations.agent_means]
+    random.shuffle(pending)
+    groups = []
+    while pending:
+        group = [pending.pop()]
+        for agent in pending + random.sample(flat, len(flat)):
+            if len(group) == players:
+                break
+            if agent[0] not in {folder for folder, _ in group}:
+                group.append(agent)
+        pending = [a for a in pending if a not in group]
+        groups.append(group)
+    return groups
@@ -0,0 +1,197 @@
+"""
+Live progress of a running tournament, as a JSON status file and endpoint.
+
+The matchmaker's ``[idx/total]`` lines count batches as they start, which
+says little about how far a tournament has got. ``RunStatus`` follows the
+fixtures instead (``start`` when a batch takes a slot, ``finish`` with its
+results) and publishes a snapshot:
+
+    fixtures     total / completed / failed / running / unplayed / pending
+    throughput   matches per minute, overall and over the last
+                 ``RATE_WINDOW`` seconds
+    games        per game: completed, failed, mean wall time per fixture
+    workers      busy slots, the current concurrency limit, utilization
+    eta          pending fixtures at the recent throughput
+
+The snapshot is rewritten atomically to ``results/status/<name>.json`` at
+most every ``WRITE_INTERVAL`` seconds and once more when the run ends.
+With ``MATCH_STATUS_PORT`` set (``matchmaker.py --status-port``), it is
+also served as JSON over HTTP on 127.0.0.1 at that port, computed fresh
+for every request.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from time_budget import format_duration
+
+STATUS_DIR = Path(__file__).parent.parent / "results" / "status"
+
+# Seconds of completions the recent throughput (and the ETA) averages over.
+RATE_WINDOW = 600
+# Least seconds between two writes of the status file.
+WRITE_INTERVAL = 2.0
+
+
+def status_port() -> int | None:
+    """HTTP port from ``MATCH_STATUS_PORT``, or None when not serving."""
+    value = os.getenv("MATCH_STATUS_PORT", "").strip()
+    return int(value) if value else None
+
+
+class RunStatus:
+    """Fixture counters of one tournament (or league) run."""
+
+    def __init__(
+        self,
+        name: str,
+        limit: Callable[[], int],
+        path: Path | None = None,
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.path = Path(path) if path is not None else STATUS_DIR / f"{name}.json"
+        self.started = time.time()
+        self.total = self.completed = self.failed = self.unplayed = 0
+        self.running = self.busy = 0
+        self.games: dict[str, list[float]] = {}  # game -> [completed, failed, seconds]
+        self.recent: deque[tuple[float, int]] = deque()
+        self.state = "running"
+        self._written = 0.0
+        self._server: asyncio.Server | None = None
+
+    async def open(self) -> None:
+        """Write the first snapshot and start the HTTP endpoint, if configured."""
+        self.write(force=True)
+        line = f"Status: {self.path}"
+        port = status_port()
+        if port is not None:
+            try:
+                self._server = await asyncio.start_server(self._serve, "127.0.0.1", port)
+                line += f" and http://127.0.0.1:{port}/"
+            except OSError as e:
+                line += f" (HTTP endpoint not started: {e})"
+        print(line)
+
+    async def close(self) -> None:
+        """Final snapshot (``finished``, or ``stopped`` with fixtures cut off)."""
+        self.state = "finished" if self.running == 0 else "stopped"
+        self.write(force=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def add(self, fixtures: int) -> None:
+        """Count *fixtures* more planned fixtures."""
+        self.total += fixtures
+        self.write()
+
+    def start(self, fixtures: int) -> None:
+        """A batch of *fixtures* took a slot."""
+        self.busy += 1
+        self.running += fixtures
+        self.write()
+
+    def finish(self, game: str, results: list[dict], seconds: float) -> None:
+        """A started batch of *game* ended after *seconds* with *results*."""
+        self.busy -= 1
+        self.running -= len(results)
+        ok = sum(1 for res in results if res.get("success"))
+        stats = self.games.setdefault(game, [0, 0, 0.0])
+        stats[0] += ok
+        stats[1] += len(results) - ok
+        if ok:
+            stats[2] += seconds * ok / len(results)
+        self.completed += ok
+        self.failed += len(results) - ok
+        self.recent.append((time.monotonic(), len(results)))
+        self.write()
+
+    def skip(self, fixtures: int) -> None:
+        """*fixtures* were not played (time budget)."""
+        self.unplayed += fixtures
+        self.write()
+
+    def done_pct(self) -> float:
+        return 100 * (self.completed + self.failed) / self.total if self.total else 0.0
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        while self.recent and now - self.recent[0][0] > RATE_WINDOW:
+            self.recent.popleft()
+        elapsed = time.time() - self.started
+        ended = self.completed + self.failed
+        window = min(RATE_WINDOW, elapsed)
+        recent_rate = sum(n for _, n in self.recent) / window * 60 if window > 0 else 0.0
+        pending = max(0, self.total - ended - self.running - self.unplayed)
+        eta = None
+        if recent_rate > 0 and self.state == "running":
+            eta = (pending + self.running) / recent_rate * 60
+        limit = max(1, self.limit())
+        return {
+            "name": self.name,
+            "state": self.state,
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "updated": datetime.now().isoformat(timespec="seconds"),
+            "elapsed": format_duration(elapsed),
+            "fixtures": {
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+                "running": self.running,
+                "unplayed": self.unplayed,
+                "pending": pending,
+                "done_pct": round(self.done_pct(), 1),
+            },
+            "matches_per_minute": {
+                "overall": round(ended / elapsed * 60, 2) if elapsed > 0 else 0.0,
+                "recent": round(recent_rate, 2),
+            },
+            "games": {
+                game: {
+                    "completed": int(ok),
+                    "failed": int(bad),
+                    "avg_fixture_seconds": round(seconds / ok, 2) if ok else None,
+                }
+                for game, (ok, bad, seconds) in sorted(self.games.items())
+            },
+            "workers": {
+                "busy": self.busy,
+                "limit": limit,
+                "utilization": round(min(self.busy / limit, 1.0), 2),
+            },
+            "eta": format_duration(eta) if eta is not None else None,
+        }
+
+    def write(self, force: bool = False) -> None:
+        """Rewrite the status file, at most every ``WRITE_INTERVAL`` seconds."""
+        now = time.monotonic()
+        if not force and now - self._written < WRITE_INTERVAL:
+            return
+        self._written = now
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.snapshot(), indent=2) + "\n")
+        os.replace(tmp_path, self.path)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while (await reader.readline()).strip():
+                pass  # request line and headers; every path gets the snapshot
+            body = (json.dumps(self.snapshot(), indent=2) + "\n").encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
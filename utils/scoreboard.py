@@ -3,7 +3,9 @@ Global scoreboard persistence for cross-match score accumulation.
 
 Reads/writes pipe-delimited scoreboard files with file-level locking
 (fcntl.flock) for safe concurrent access from parallel match runners.
-Supports both 2-player (7-column) and 6-player (10-column) formats.
+Supports both 2-player (8-column) and 6-player (10-column) formats. The
+2-player "Stopped" column counts matches that SPRT stopped early, whose
+games are counted as actually played.
 """
 
 import fcntl
@@ -19,10 +21,12 @@ def update_scoreboard(
     draws: int,
     score: float,
     points: int = 0,
+    stopped: int = 0,
 ) -> None:
     """Atomically update an agent's row in the scoreboard file.
 
-    Creates the scoreboard directory and file if they don't exist. Uses an
+    *stopped* is the number of these matches that SPRT stopped early; rows
+    from older 7- and 6-column files start with none. Creates the scoreboard directory and file if they don't exist. Uses an
     adjacent .lock file with LOCK_EX for cross-process safety.
     """
     scoreboard_path = Path(scoreboard_path)
@@ -39,7 +43,7 @@ def update_scoreboard(
                 if not line or line.startswith("Agent"):
                     continue
                 parts = [p.strip() for p in line.split("|")]
-                if len(parts) == 7:
+                if len(parts) in (7, 8):
                     try:
                         entries[parts[0]] = {
                             "games": int(parts[1]),
@@ -48,6 +52,7 @@ def update_scoreboard(
                             "draws": int(parts[4]),
                             "points": int(parts[5]),
                             "score": float(parts[6]),
+                            "stopped": int(parts[7]) if len(parts) == 8 else 0,
                         }
                     except (ValueError, IndexError):
                         continue
@@ -60,6 +65,7 @@ def update_scoreboard(
                             "draws": int(parts[4]),
                             "points": 0,
                             "score": float(parts[5]),
+                            "stopped": 0,
                         }
                     except (ValueError, IndexError):
                         continue
@@ -72,6 +78,7 @@ def update_scoreboard(
             row["draws"] += draws
             row["points"] += points
             row["score"] += score
+            row["stopped"] += stopped
         else:
             entries[agent_name] = {
                 "games": games_played,
@@ -80,6 +87,7 @@ def update_scoreboard(
                 "draws": draws,
                 "points": points,
                 "score": score,
+                "stopped": stopped,
             }
 
         sorted_entries = sorted(
@@ -88,12 +96,12 @@ def update_scoreboard(
             reverse=True,
         )
 
-        lines = ["Agent | Games | Wins | Losses | Draws | Points | Score"]
+        lines = ["Agent | Games | Wins | Losses | Draws | Points | Score | Stopped"]
         for name, row in sorted_entries:
             lines.append(
                 f"{name} | {row['games']} | {row['wins']} | "
                 f"{row['losses']} | {row['draws']} | "
-                f"{row['points']} | {row['score']:.1f}"
+                f"{row['points']} | {row['score']:.1f} | {row['stopped']}"
             )
 
         scoreboard_path.write_text("\n".join(lines) + "\n")
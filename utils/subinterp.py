@@ -0,0 +1,269 @@
+"""
+Subinterpreter execution of generated match scripts (CPython 3.12+).
+
+Each game script runs in a fresh isolated subinterpreter with its own GIL
+and module state, created on the calling thread. The match worker pool
+(``match_pool.SubinterpreterPool``) enables this in its forked workers, so
+game scripts start without a child process while the two embedded
+``*Agent_1`` / ``*Agent_2`` classes and everything they import stay private
+to their match, and never run in the matchmaker itself. The shards of a
+sharded match run in parallel threads of the worker.
+
+Move timeouts in the engines use ``signal.signal(SIGALRM)`` +
+``signal.alarm()``, which only work in the main interpreter. Inside the
+subinterpreter both functions are replaced by a shim: ``alarm(n)`` arms a
+deadline enforced by a line tracer, and when it passes the registered
+SIGALRM handler is invoked in the agent's frame, raising the same timeout
+exception a real signal would. The tracer is only installed while an alarm
+is armed, i.e. during ``make_move`` calls.
+
+A subinterpreter cannot be killed, so the match deadline and the
+no-output stall limit are enforced from inside it: a watchdog thread
+started by the prelude watches the clock and the time of the last output,
+and once a limit passes it enables ``sys.monitoring`` line, jump and call
+events whose callback raises in every frame of the script. That stops
+engine and agent code alike, tight loops and bare ``except:`` included;
+only a single blocking C call (``time.sleep``) runs on until it returns,
+or until the pool recycles the worker at the batch deadline.
+
+Scripts whose imports cannot be loaded in an isolated subinterpreter (C
+extensions without multi-interpreter support, such as numpy or ctypes) are
+reported as unsupported so the caller can fall back to a process.
+"""
+
+import subprocess
+import threading
+
+try:
+    import _xxinterpchannels as _channels
+    import _xxsubinterpreters as _interpreters
+except ImportError:  # Python < 3.12
+    _channels = None
+    _interpreters = None
+
+_ENABLED = False
+
+# import line -> loads in an isolated subinterpreter
+_IMPORT_SUPPORT: dict[str, bool] = {}
+_IMPORT_SUPPORT_LOCK = threading.Lock()
+
+_PRELUDE = r'''
+import _xxinterpchannels as _channels
+import io as _io
+import signal as _signal
+import sys as _sys
+import threading as _threading
+import time as _time
+import traceback as _traceback
+
+_started = _time.monotonic()
+_last_output = [_started]
+_killed = [None]
+
+
+class _Output(_io.StringIO):
+    def write(self, text):
+        _last_output[0] = _time.monotonic()
+        return super().write(text)
+
+
+class _MatchKilled(BaseException):
+    pass
+
+
+_out, _err = _Output(), _Output()
+_sys.stdout, _sys.stderr = _out, _err
+
+_handlers = {{}}
+_deadline = [None]
+_ticks = [0]
+
+
+def _line_tracer(frame, event, arg):
+    _ticks[0] += 1
+    if _ticks[0] & 63:
+        return _line_tracer
+    if _deadline[0] is not None and _time.monotonic() >= _deadline[0]:
+        _deadline[0] = None
+        _sys.settrace(None)
+        handler = _handlers.get(_signal.SIGALRM)
+        if callable(handler):
+            handler(_signal.SIGALRM, frame)
+    return _line_tracer
+
+
+def _shim_signal(signum, handler):
+    previous = _handlers.get(signum, _signal.SIG_DFL)
+    _handlers[signum] = handler
+    return previous
+
+
+def _shim_alarm(seconds):
+    remaining = 0
+    if _deadline[0] is not None:
+        remaining = max(0, int(round(_deadline[0] - _time.monotonic())))
+    if seconds:
+        _deadline[0] = _time.monotonic() + seconds
+        _sys.settrace(_line_tracer)
+        _sys._getframe(1).f_trace = _line_tracer
+    else:
+        _deadline[0] = None
+        _sys.settrace(None)
+    return remaining
+
+
+_signal.signal = _shim_signal
+_signal.alarm = _shim_alarm
+
+_monitoring = _sys.monitoring
+_KILL_EVENTS = (_monitoring.events.LINE, _monitoring.events.JUMP, _monitoring.events.PY_START)
+_timeout, _stall = {timeout!r}, {stall!r}
+_stop = _threading.Event()
+
+
+def _kill(code, *args):
+    if code.co_filename == {script_path!r}:
+        raise _MatchKilled(_killed[0])
+    return _monitoring.DISABLE
+
+
+def _watchdog():
+    while not _stop.wait(0.25):
+        now = _time.monotonic()
+        if _timeout is not None and now - _started >= _timeout:
+            _killed[0] = "deadline"
+        elif _stall is not None and now - _last_output[0] >= _stall:
+            _killed[0] = "stall"
+        else:
+            continue
+        _monitoring.use_tool_id(_monitoring.DEBUGGER_ID, "match watchdog")
+        for _event in _KILL_EVENTS:
+            _monitoring.register_callback(_monitoring.DEBUGGER_ID, _event, _kill)
+        _monitoring.set_events(_monitoring.DEBUGGER_ID, sum(_KILL_EVENTS))
+        return
+
+
+_watcher = None
+if _timeout is not None or _stall is not None:
+    _watcher = _threading.Thread(target=_watchdog)
+    _watcher.start()
+
+_code = 0
+try:
+    _sys.argv = [{script_path!r}]
+    with open({script_path!r}) as _f:
+        _compiled = compile(_f.read(), {script_path!r}, "exec")
+    exec(_compiled, {{"__name__": "__main__", "__file__": {script_path!r}}})
+except _MatchKilled:
+    _code = 1
+except SystemExit as _e:
+    if isinstance(_e.code, int):
+        _code = _e.code
+    elif _e.code is not None:
+        print(_e.code, file=_err)
+        _code = 1
+except BaseException:
+    _traceback.print_exc(file=_err)
+    _code = 1
+finally:
+    _sys.settrace(None)
+    _stop.set()
+    if _watcher is not None:
+        _watcher.join()
+    if _monitoring.get_tool(_monitoring.DEBUGGER_ID) is not None:
+        _monitoring.set_events(_monitoring.DEBUGGER_ID, 0)
+
+_channels.send({channel_id}, _code)
+_channels.send({channel_id}, _out.getvalue())
+_channels.send({channel_id}, _err.getvalue())
+_channels.send({channel_id}, _killed[0])
+'''
+
+_PROBE = r'''
+import _xxinterpchannels as _channels
+try:
+    exec({line!r}, {{}})
+    _channels.send({channel_id}, 1)
+except BaseException:
+    _channels.send({channel_id}, 0)
+'''
+
+
+def available() -> bool:
+    """True when this interpreter can create isolated subinterpreters."""
+    return _interpreters is not None
+
+
+def enable() -> None:
+    """Route game scripts of this process through subinterpreters."""
+    global _ENABLED
+    if not available():
+        raise RuntimeError("subinterpreters require CPython 3.12+")
+    _ENABLED = True
+
+
+def is_enabled() -> bool:
+    return _ENABLED
+
+
+def _run_in_subinterpreter(source: str, messages: int) -> list:
+    """Run *source* in a new isolated subinterpreter, collect channel messages."""
+    channel_id = _channels.create()
+    interp = _interpreters.create(isolated=True)
+    try:
+        _interpreters.run_string(interp, source.replace("{channel_id}", str(int(channel_id))))
+        return [_channels.recv(channel_id) for _ in range(messages)]
+    finally:
+        _interpreters.destroy(interp)
+        _channels.destroy(channel_id)
+
+
+def _script_import_lines(script_path: str) -> set[str]:
+    """Every ``import`` / ``from`` statement in the script, at any indentation."""
+    lines = set()
+    with open(script_path) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith(("import ", "from ")) and not stripped.endswith("("):
+                lines.add(stripped)
+    return lines
+
+
+def imports_supported(import_lines: set[str]) -> bool:
+    """Whether every import line loads in an isolated subinterpreter (cached)."""
+    with _IMPORT_SUPPORT_LOCK:
+        unknown = [line for line in import_lines if line not in _IMPORT_SUPPORT]
+        for line in unknown:
+            probe = _PROBE.format(line=line, channel_id="{channel_id}")
+            try:
+                _IMPORT_SUPPORT[line] = bool(_run_in_subinterpreter(probe, 1)[0])
+            except RuntimeError:  # the subinterpreter or its channel failed
+                _IMPORT_SUPPORT[line] = False
+        return all(_IMPORT_SUPPORT[line] for line in import_lines)
+
+
+def try_run_game_script(
+    script_path: str, timeout: float | None = None, stall: float | None = None
+) -> subprocess.CompletedProcess | None:
+    """Run a generated match script in a subinterpreter, capturing its output.
+
+    Returns None when the script imports something that cannot load in a
+    subinterpreter; the caller should then run it in a process instead.
+    A script still running after ``timeout`` seconds, or silent for
+    ``stall`` seconds, is stopped from inside (see the module docstring)
+    and raises ``zygote.MatchKilled`` exactly like a killed process would.
+    """
+    from zygote import MatchKilled  # zygote imports this module
+
+    if not imports_supported(_script_import_lines(script_path)):
+        return None
+
+    args = ["python", script_path]
+    source = _PRELUDE.format(
+        script_path=script_path, timeout=timeout, stall=stall, channel_id="{channel_id}"
+    )
+    returncode, stdout, stderr, killed = _run_in_subinterpreter(source, 4)
+    if killed is not None:
+        limit = timeout if killed == "deadline" else stall
+        raise MatchKilled(args, limit, killed, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(args, returncode, stdout, stderr)
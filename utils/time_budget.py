@@ -0,0 +1,108 @@
+"""
+Wall-clock budget for a tournament (``matchmaker.py --time-budget``).
+
+A tournament usually has a window ("finish A4 before 6am") rather than a
+fixture count. With a budget the matchmaker orders the fixtures in
+coverage levels (every pairing's k-th meeting before any pairing's
+(k+1)-th, see ``order_by_coverage``), so stopping anywhere leaves coverage
+as even as it can be, and ``TimeBudget`` gates the dispatch: a batch only
+starts when its expected wall time still fits in what is left of the
+budget. Expected times come from ``FixtureDurations``; a batch without any
+history starts while time remains.
+
+Batches that do not fit are not run and not journaled as started, so
+``--resume`` with the tournament's journal plays them later.
+"""
+
+import heapq
+import re
+import time
+
+from fixture_durations import FixtureDurations
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)([hms])")
+_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1}
+
+
+def parse_duration(text: str) -> float:
+    """``"3h"``, ``"90m"``, ``"2h30m"``, ``"45s"`` or plain seconds -> seconds."""
+    text = text.strip().lower()
+    try:
+        seconds = float(text)
+    except ValueError:
+        parts = _DURATION_RE.findall(text)
+        if not parts or "".join(n + u for n, u in parts) != text:
+            raise ValueError(f"invalid duration: {text!r} (use e.g. 3h, 90m, 2h30m)")
+        seconds = sum(float(n) * _UNIT_SECONDS[u] for n, u in parts)
+    if seconds <= 0:
+        raise ValueError(f"duration must be positive: {text!r}")
+    return seconds
+
+
+def format_duration(seconds: float) -> str:
+    """HH:MM:SS, with hours past 24 kept (``"31:05:00"``)."""
+    minutes, secs = divmod(int(max(seconds, 0)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def batch_estimate(durations: FixtureDurations, job: dict, games: int) -> float | None:
+    """Expected wall time of a batch of *games*-game fixtures, or None.
+
+    Falls back to the mean over every recorded group, including the ones
+    recorded during this run, when the batch's agents have no history.
+    The only place a sharded batch's estimate is divided by its shards.
+    """
+    estimate = durations.estimate(job["agents"], games)
+    if estimate is None and durations.groups:
+        per_game = [mean for _, mean in durations.groups.values()]
+        estimate = sum(per_game) / len(per_game) * games
+    if estimate is None:
+        return None
+    return estimate * job.get("repeat", 1) / max(1, job.get("shards", 1))
+
+
+def budget_fit(
+    batches: list[dict], games: list[int], durations: FixtureDurations,
+    seconds: float, workers: int,
+) -> tuple[int, float] | None:
+    """Simulate the budgeted dispatch of *batches* on *workers* slots.
+
+    Every batch starts on the first free slot if its estimate fits in the
+    budget left at that moment, as ``TimeBudget.fits`` decides at run
+    time. Returns (fixtures that fit, estimated work in seconds over all
+    batches), or None without any recorded durations.
+    """
+    estimates = [batch_estimate(durations, b, g) for b, g in zip(batches, games)]
+    if all(e is None for e in estimates):
+        return None
+    slots = [0.0] * max(1, workers)
+    fitted, work = 0, 0.0
+    for batch, estimate in zip(batches, estimates):
+        estimate = estimate or 0.0
+        work += estimate
+        start = slots[0]
+        if start + estimate > seconds:
+            continue
+        heapq.heapreplace(slots, start + estimate)
+        fitted += batch.get("repeat", 1)
+    return fitted, work
+
+
+class TimeBudget:
+    """Run-time gate: whether a batch still fits in the remaining budget."""
+
+    def __init__(self, seconds: float, durations: FixtureDurations) -> None:
+        self.seconds = seconds
+        self.durations = durations
+        self.end = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return self.end - time.monotonic()
+
+    def fits(self, job: dict, games: int) -> bool:
+        remaining = self.remaining()
+        if remaining <= 0:
+            return False
+        estimate = batch_estimate(self.durations, job, games)
+        return estimate is None or estimate <= remaining
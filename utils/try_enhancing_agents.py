@@ -13,7 +13,6 @@ Usage:
 
 import asyncio
 import os
-import re
 import sys
 import time
 from datetime import datetime
@@ -29,6 +28,7 @@ sys.path.insert(0, str(PROJECT_ROOT / "utils"))
 sys.path.insert(0, str(PROJECT_ROOT / "game_scripts"))
 
 from logging_config import setup_logging
+from match_api import call_run_fixture, load_runner
 from matchmaker import GAME_REGISTRY, discover_agents
 from model_api import ModelAPI
 from populate_agents import (
@@ -143,37 +143,6 @@ def validate_existing_agents(
 # ---------------------------------------------------------------------------
 
 
-def parse_match_result(stdout: str) -> dict | None:
-    """
-    Parse match results from match subprocess stdout.
-
-    The outer match script prints:
-        FINAL RESULTS:
-          folder: Pts 377, Score -3315.0
-          folder: Pts 2438, Score 3315.0
-
-    We extract the Pts values in order (agent-1 first, agent-2 second).
-    Falls back to the inner RESULT:Agent-1=X,Agent-2=Y format if present.
-    """
-    # Try inner format first (in case script architecture changes)
-    res = re.search(r"RESULT:Agent-1=([\d.]+),Agent-2=([\d.]+)", stdout)
-    if res:
-        return {
-            "agent1_points": float(res.group(1)),
-            "agent2_points": float(res.group(2)),
-        }
-
-    # Parse outer FINAL RESULTS format
-    pts_matches = re.findall(r"Pts\s+(\d+),\s*Score", stdout)
-    if len(pts_matches) >= 2:
-        return {
-            "agent1_points": float(pts_matches[0]),
-            "agent2_points": float(pts_matches[1]),
-        }
-
-    return None
-
-
 async def run_enhancement_match(
     game_id: str,
     model_folder: str,
@@ -181,41 +150,31 @@ async def run_enhancement_match(
     run_b: int,
     tag: str,
     match_semaphore: asyncio.Semaphore,
+    shards: int = 1,
 ) -> dict:
     """
     Run a single same-model match between two agents.
-    Overrides NUM_OF_GAMES_IN_A_MATCH in the subprocess environment to 10x.
+    Calls the runner's run_fixture() with NUM_OF_GAMES_IN_A_MATCH at 10x,
+    without updating the scoreboard, split across *shards* processes.
     """
     game_info = GAME_REGISTRY[game_id]
-    match_script = SCRIPT_DIR / game_info["script"]
+    runner = load_runner(SCRIPT_DIR / game_info["script"])
 
     enhanced_games = BASE_NUM_GAMES * ENHANCEMENT_MULTIPLIER
-    cmd = [
-        sys.executable,
-        str(match_script),
-        "--agent",
-        f"{model_folder}:{run_a}",
-        f"{model_folder}:{run_b}",
-        # No --update-scoreboard
-    ]
+    agents = [(model_folder, run_a), (model_folder, run_b)]
     label = f"{model_folder}:{run_a} vs {model_folder}:{run_b}"
 
-    # Override env var for the subprocess
-    env = os.environ.copy()
-    env["NUM_OF_GAMES_IN_A_MATCH"] = str(enhanced_games)
-
     async with match_semaphore:
         print(f"  {tag} Starting match: {label}")
 
+        loop = asyncio.get_running_loop()
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-            )
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                proc.communicate(), timeout=MATCH_TIMEOUT
+            res = await asyncio.wait_for(
+                loop.run_in_executor(
+                    None, call_run_fixture, runner, agents, enhanced_games, False, shards
+                ),
+                # The runner scales its own kill deadline with the game count too.
+                timeout=MATCH_TIMEOUT * ENHANCEMENT_MULTIPLIER,
             )
         except asyncio.TimeoutError:
             print(f"  {tag} Match TIMED OUT: {label}")
@@ -236,45 +195,30 @@ async def run_enhancement_match(
                 "label": label,
             }
 
-        stdout_str = stdout_bytes.decode(errors="replace")
-        stderr_str = stderr_bytes.decode(errors="replace")
-
-        if proc.returncode != 0:
+        if not res.get("success"):
             print(f"  {tag} Match FAILED: {label}")
             return {
                 "run_a": run_a,
                 "run_b": run_b,
                 "success": False,
-                "error": stderr_str[:500],
-                "label": label,
-                "stdout": stdout_str,
-            }
-
-        parsed = parse_match_result(stdout_str)
-        if not parsed:
-            print(f"  {tag} Match PARSE ERROR: {label}")
-            return {
-                "run_a": run_a,
-                "run_b": run_b,
-                "success": False,
-                "error": "Could not parse RESULT line from stdout",
+                "error": str(res.get("error"))[:500],
                 "label": label,
-                "stdout": stdout_str,
             }
 
+        agent1_points, agent2_points = (float(p) for p in res["points"])
         print(
             f"  {tag} Match done: {label} — "
-            f"Pts: {parsed['agent1_points']:.0f} vs {parsed['agent2_points']:.0f}"
+            f"Pts: {agent1_points:.0f} vs {agent2_points:.0f}"
         )
 
         return {
             "run_a": run_a,
             "run_b": run_b,
             "success": True,
-            "agent1_points": parsed["agent1_points"],
-            "agent2_points": parsed["agent2_points"],
+            "agent1_points": agent1_points,
+            "agent2_points": agent2_points,
             "label": label,
-            "stdout": stdout_str,
+            "log_path": res.get("log_path", ""),
         }
 
 
@@ -428,6 +372,7 @@ async def run_combo_pipeline(
     api_semaphore: asyncio.Semaphore,
     match_semaphore: asyncio.Semaphore,
     timestamp: str,
+    shards: int = 1,
 ) -> None:
     """
     Full pipeline for one (model, game) combo.
@@ -471,7 +416,7 @@ async def run_combo_pipeline(
 
     match_tasks = [
         run_enhancement_match(
-            game_id, model_folder, new_run, ex_run, tag, match_semaphore
+            game_id, model_folder, new_run, ex_run, tag, match_semaphore, shards
         )
         for ex_run in existing_runs
     ]
@@ -500,7 +445,7 @@ async def run_combo_pipeline(
         pairs = list(combinations(existing_runs, 2))
         extra_tasks = [
             run_enhancement_match(
-                game_id, model_folder, ra, rb, tag, match_semaphore
+                game_id, model_folder, ra, rb, tag, match_semaphore, shards
             )
             for ra, rb in pairs
         ]
@@ -549,6 +494,12 @@ async def main_async() -> None:
         required=True,
         help="Comma-separated game prefixes (e.g., A1,A5) or 'all'",
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split each enhancement match's games across this many processes",
+    )
 
     args = parser.parse_args()
 
@@ -632,7 +583,10 @@ async def main_async() -> None:
     print(f"Combos: {len(combos)}")
     print(f"Games per match: {enhanced_games} (base {BASE_NUM_GAMES} x {ENHANCEMENT_MULTIPLIER})")
     print(f"API calls: {len(combos)}")
-    print(f"Match subprocesses: {worst_case_subprocesses} needed, max {MAX_MATCH_WORKERS} concurrent")
+    match_workers = max(1, MAX_MATCH_WORKERS // max(1, args.shards))
+    print(f"Match subprocesses: {worst_case_subprocesses} needed, max {match_workers} concurrent")
+    if args.shards > 1:
+        print(f"Shards: {args.shards} processes per match")
     print(f"{'=' * 60}")
 
     confirm = input("\nProceed? [y/N]: ").strip().lower()
@@ -642,7 +596,7 @@ async def main_async() -> None:
 
     # Fire all combos concurrently — each combo is an independent pipeline
     api_semaphore = asyncio.Semaphore(POPULATE_MAX_WORKERS)
-    match_semaphore = asyncio.Semaphore(MAX_MATCH_WORKERS)
+    match_semaphore = asyncio.Semaphore(match_workers)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     start_time = time.time()
 
@@ -658,6 +612,7 @@ async def main_async() -> None:
             api_semaphore,
             match_semaphore,
             timestamp,
+            args.shards,
         )
         for combo in combos
     ]
@@ -0,0 +1,334 @@
+"""
+Zygote execution of generated match scripts.
+
+Every match runner writes its game script (engine + both agents) to a temp
+file and runs ``python <temp_file>``, paying interpreter startup plus the
+engine's and agents' imports before the first move. A process that calls
+``enable()`` becomes a zygote: it imports the header modules and the union
+of agent imports once, freezes the resulting heap with ``gc.freeze()`` and
+from then on runs each game script in a child forked from itself. Children
+share the preloaded pages copy-on-write and still get their own process,
+so agent isolation, move timeouts (SIGALRM) and crash containment are the
+same as with a cold interpreter.
+
+``run_game_script()`` is the single entry point used by the runners. It
+prefers a subinterpreter when ``subinterp.enable()`` was called in this
+process, then a fork when this process is a zygote, and otherwise starts a
+cold subprocess. ``run_game_scripts()`` runs several scripts at once on the
+same backends (used for sharded matches, see ``match_shards``).
+
+Every script process leads its own process group. When the match deadline
+passes, or the script stays silent for ``MATCH_STALL_LIMIT`` seconds, the
+whole group is killed (including anything an agent spawned) and
+``MatchKilled`` is raised.
+"""
+
+import gc
+import os
+import random
+import selectors
+import signal
+import subprocess
+import sys
+import time
+import traceback
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import subinterp
+from agent_loader import COMMON_HEADER_IMPORTS
+
+_ENABLED = False
+
+# Compiled game scripts by source text. Batched fixtures of the same agents
+# produce identical scripts, so the zygote compiles them once before forking.
+_CODE_CACHE: dict[str, object] = {}
+_CODE_CACHE_SIZE = 16
+
+
+class MatchKilled(subprocess.TimeoutExpired):
+    """A game script killed by its deadline or by the no-output watchdog.
+
+    ``reason`` is ``"deadline"`` or ``"stall"``; ``timeout`` is the limit
+    that was hit, in seconds.
+    """
+
+    def __init__(self, cmd, timeout, reason, output=None, stderr=None):
+        super().__init__(cmd, timeout, output=output, stderr=stderr)
+        self.reason = reason
+
+    def __str__(self):
+        if self.reason == "stall":
+            return f"killed: stall (no output for {self.timeout:g} seconds)"
+        return f"killed: deadline (still running after {self.timeout:g} seconds)"
+
+
+def stall_limit() -> float | None:
+    """Seconds a game script may print nothing before it is killed.
+
+    Read from ``MATCH_STALL_LIMIT`` on every call (unset or 0 disables the
+    watchdog). Game scripts flush after every game, so this bounds the
+    length of a single game rather than of the match.
+    """
+    try:
+        limit = float(os.getenv("MATCH_STALL_LIMIT", "0"))
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+
+def enable(import_lines: Iterable[str] = ()) -> list[str]:
+    """Preload imports, freeze the heap and route game scripts through fork.
+
+    Args:
+        import_lines: ``import`` / ``from`` statements collected from agent
+            files (see ``agent_loader.collect_agent_imports``). Lines that
+            fail to execute are skipped; the agent's own import in the child
+            will surface the error exactly as a cold run would.
+
+    Returns:
+        The import lines that could not be preloaded.
+    """
+    global _ENABLED
+    failed = []
+    for line in sorted(set(COMMON_HEADER_IMPORTS) | set(import_lines)):
+        try:
+            exec(line, {})
+        except Exception:
+            failed.append(line)
+    gc.collect()
+    gc.freeze()
+    _ENABLED = True
+    return failed
+
+
+def is_enabled() -> bool:
+    return _ENABLED
+
+
+def _compile_cached(script_path: str):
+    """Compile *script_path* in the zygote, reusing identical scripts (None on error)."""
+    with open(script_path) as f:
+        source = f.read()
+    code = _CODE_CACHE.get(source)
+    if code is None:
+        try:
+            code = compile(source, script_path, "exec")
+        except Exception:
+            return None  # let the child reproduce the error on its stderr
+        if len(_CODE_CACHE) >= _CODE_CACHE_SIZE:
+            _CODE_CACHE.pop(next(iter(_CODE_CACHE)))
+        _CODE_CACHE[source] = code
+    return code
+
+
+def _exec_script_in_child(script_path: str, code=None) -> int:
+    """Body of the forked child. Returns the process exit code."""
+    # Forked children inherit the zygote's PRNG state; reseed so matches differ.
+    random.seed()
+    if "numpy" in sys.modules:
+        try:
+            sys.modules["numpy"].random.seed()
+        except Exception:
+            pass
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    sys.argv = [script_path]
+    namespace = {"__name__": "__main__", "__file__": script_path, "__builtins__": __builtins__}
+    try:
+        if code is None:
+            with open(script_path) as f:
+                code = compile(f.read(), script_path, "exec")
+        exec(code, namespace)
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+
+
+def _fork_child(script_path: str, code, inherited_fds: Iterable[int]) -> tuple:
+    """Fork a child running *script_path*; returns (pid, stdout fd, stderr fd, wait)."""
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            # Own process group, so a kill also reaches anything the agents spawned.
+            os.setsid()
+            for fd in inherited_fds:
+                os.close(fd)
+            os.close(out_r)
+            os.close(err_r)
+            os.dup2(out_w, 1)
+            os.dup2(err_w, 2)
+            os.close(out_w)
+            os.close(err_w)
+            exit_code = _exec_script_in_child(script_path, code)
+        finally:
+            os._exit(exit_code)
+    os.close(out_w)
+    os.close(err_w)
+    return pid, out_r, err_r, lambda: os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+
+
+def _spawn_child(script_path: str) -> tuple:
+    """Start ``python script_path`` in a new session; same tuple as ``_fork_child``."""
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        proc = subprocess.Popen(
+            ["python", script_path], stdout=out_w, stderr=err_w, start_new_session=True
+        )
+    except BaseException:
+        os.close(out_r)
+        os.close(err_r)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+    return proc.pid, out_r, err_r, proc.wait
+
+
+def _run_processes(
+    script_paths: list[str], timeout: float | None
+) -> list[subprocess.CompletedProcess]:
+    """Run each script in its own process group and drain them together.
+
+    Children are forked from this zygote when enabled, otherwise started as
+    cold interpreters; either way all of them are started from the calling
+    thread before any output is read, so the scripts run concurrently.
+    If ``timeout`` expires, or a script prints nothing for ``stall_limit()``
+    seconds, every process group is killed and ``MatchKilled`` is raised.
+    An exception while waiting (a recycled pool worker's SIGTERM) kills
+    them too.
+    """
+    stall = stall_limit()
+    children = []
+    streams: dict[int, tuple[int, int]] = {}  # read fd -> (script index, 1 | 2)
+    try:
+        if _ENABLED:
+            codes = [_compile_cached(path) for path in script_paths]
+            sys.stdout.flush()
+            sys.stderr.flush()
+        for idx, script_path in enumerate(script_paths):
+            if _ENABLED:
+                child = _fork_child(script_path, codes[idx], list(streams))
+            else:
+                child = _spawn_child(script_path)
+            children.append(child)
+            streams[child[1]] = (idx, 1)
+            streams[child[2]] = (idx, 2)
+    except BaseException:
+        for pid, *_ in children:
+            _kill_group(pid)
+        for fd in streams:
+            os.close(fd)
+        for *_, wait in children:
+            wait()
+        raise
+
+    chunks: dict[int, list[bytes]] = {fd: [] for fd in streams}
+    start = time.monotonic()
+    deadline = start + timeout if timeout is not None else None
+    last_output = [start] * len(children)
+    open_streams = [2] * len(children)
+    killed = None
+    drained = False
+    sel = selectors.DefaultSelector()
+    for fd in streams:
+        sel.register(fd, selectors.EVENT_READ)
+    try:
+        while any(open_streams):
+            now = time.monotonic()
+            waits = []
+            if deadline is not None:
+                if now >= deadline:
+                    killed = ("deadline", timeout)
+                    break
+                waits.append(deadline - now)
+            if stall is not None:
+                quiet_since = min(t for t, n in zip(last_output, open_streams) if n)
+                if now - quiet_since >= stall:
+                    killed = ("stall", stall)
+                    break
+                waits.append(quiet_since + stall - now)
+            for key, _ in sel.select(min(waits) if waits else None):
+                idx = streams[key.fd][0]
+                data = os.read(key.fd, 65536)
+                if data:
+                    chunks[key.fd].append(data)
+                    last_output[idx] = time.monotonic()
+                else:
+                    sel.unregister(key.fd)
+                    open_streams[idx] -= 1
+        drained = True
+    finally:
+        sel.close()
+        if killed or not drained:
+            for pid, *_ in children:
+                _kill_group(pid)
+        for fd in streams:
+            os.close(fd)
+        exit_codes = [wait() for *_, wait in children]
+
+    outputs = [["", ""] for _ in script_paths]
+    for fd, (idx, stream) in streams.items():
+        outputs[idx][stream - 1] = b"".join(chunks[fd]).decode(errors="replace")
+    if killed:
+        reason, limit = killed
+        stdout, stderr = ("".join(o[i] for o in outputs) for i in (0, 1))
+        raise MatchKilled(["python", *script_paths], limit, reason, output=stdout, stderr=stderr)
+    return [
+        subprocess.CompletedProcess(["python", path], code, stdout, stderr)
+        for path, code, (stdout, stderr) in zip(script_paths, exit_codes, outputs)
+    ]
+
+
+def _kill_group(pid: int) -> None:
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_game_script(script_path: str, timeout: float | None = None) -> subprocess.CompletedProcess:
+    """Run a generated match script and capture its output as text.
+
+    Drop-in for ``subprocess.run(["python", script_path], capture_output=True,
+    text=True, timeout=timeout)``: returns a ``CompletedProcess`` and raises
+    ``subprocess.TimeoutExpired`` (as ``MatchKilled``) after killing the
+    script's whole process group on timeout or when it stalls.
+    """
+    if subinterp.is_enabled():
+        result = subinterp.try_run_game_script(script_path, timeout, stall_limit())
+        if result is not None:
+            return result
+    return _run_processes([script_path], timeout)[0]
+
+
+def run_game_scripts(
+    script_paths: list[str], timeout: float | None = None
+) -> list[subprocess.CompletedProcess]:
+    """Run several generated scripts concurrently, one result per script.
+
+    Same backends as ``run_game_script``. ``timeout`` applies to the whole
+    group; if it expires, or any script stalls, every script still running
+    is killed and ``MatchKilled`` is raised.
+    """
+    if subinterp.is_enabled():
+        with ThreadPoolExecutor(max_workers=max(1, len(script_paths))) as executor:
+            return list(executor.map(lambda path: run_game_script(path, timeout), script_paths))
+    return _run_processes(list(script_paths), timeout)